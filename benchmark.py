@@ -0,0 +1,68 @@
+import argparse
+import json
+import os
+import platform
+import sys
+
+from typing import Any, Final
+from benchmarks.runner import compareResults, runScenario
+from benchmarks.scenarios import SCENARIOS
+
+DEFAULT_RESULTS_PATH: Final[str] = "data/benchmarkResults.json"
+
+
+def parseArguments(arguments: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the Star Force Zero simulation core on fixed-seed scenarios.")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario",
+                        help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="timed runs per scenario; the fastest one counts")
+    parser.add_argument("-o", "--output", default=DEFAULT_RESULTS_PATH, help="JSON file the results are written to")
+    parser.add_argument("-b", "--baseline", help="results JSON of an earlier run to compare against")
+    parser.add_argument("-t", "--threshold", type=float, default=0.1, help="relative change reported as a regression")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy movement engine")
+    parsedArguments = parser.parse_args(arguments)
+
+    unknownScenarios = [name for name in parsedArguments.scenarios if name not in SCENARIOS]
+    if unknownScenarios:
+        parser.error(f"unknown scenarios: {', '.join(unknownScenarios)} (choose from {', '.join(SCENARIOS)})")
+    return parsedArguments
+
+
+def main(arguments: list[str]) -> None:
+    arguments = parseArguments(arguments)
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "vectorized": arguments.vectorized,
+        "scenarios": {},
+    }
+
+    for name in arguments.scenarios or SCENARIOS:
+        result = runScenario(SCENARIOS[name](), arguments.vectorized, arguments.repeat)
+        results["scenarios"][name] = result
+        tick = result["phases"]["total"]
+        print(f"{name:<12} {result['ticksPerSecond']:>10,.0f} ticks/s  "
+              f"tick p50 {tick['p50']:.3f} ms  p99 {tick['p99']:.3f} ms  "
+              f"peak {result['peakMemoryKiB']:,.0f} KiB  peak entities {result['peakEntities']['entities']}")
+
+    outputDirectory = os.path.dirname(arguments.output)
+    if outputDirectory:
+        os.makedirs(outputDirectory, exist_ok=True)
+    with open(arguments.output, "w") as resultsFile:
+        json.dump(results, resultsFile, indent=2)
+    print(f"Results written to {arguments.output}")
+
+    if arguments.baseline is None: return
+    with open(arguments.baseline) as baselineFile:
+        regressions = compareResults(results, json.load(baselineFile), arguments.threshold)
+    if not regressions:
+        print(f"No regressions against {arguments.baseline}")
+        return
+    print(f"Regressions against {arguments.baseline}:")
+    for regression in regressions:
+        print(f"  {regression}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,93 @@
+import time
+import tracemalloc
+from typing import Any, Final
+
+from benchmarks.scenarios import Scenario
+from helpers.frameProfiler import FrameProfiler
+
+
+def timeScenario(scenario: Scenario, vectorized: bool = False) -> float:
+    """Seconds one uninstrumented run of the scenario takes."""
+    simulation = scenario.createSimulation(vectorized)
+    game = simulation.game
+    startedAt = time.perf_counter()
+    for _ in range(scenario.ticks):
+        scenario.beforeTick(game)
+        simulation.step()
+    return time.perf_counter() - startedAt
+
+
+def profileScenario(scenario: Scenario, vectorized: bool = False) -> tuple[dict[str, dict[str, float]], dict[str, int]]:
+    """Per-phase times of every tick and the peak entity counts."""
+    simulation = scenario.createSimulation(vectorized)
+    game = simulation.game
+    profiler = game.profiler = FrameProfiler(window=scenario.ticks, traceCapacity=0)
+    peakCounts: dict[str, int] = {}
+    for _ in range(scenario.ticks):
+        profiler.beginFrame()
+        scenario.beforeTick(game)
+        simulation.policy.act(game)
+        profiler.lap("policy")
+        game.update()
+        counts = game.getEntityCounts()
+        profiler.endFrame(counts)
+        for name, count in counts.items():
+            peakCounts[name] = max(peakCounts.get(name, 0), count)
+    return profiler.getSummary(), peakCounts
+
+
+def measurePeakMemory(scenario: Scenario, vectorized: bool = False) -> int:
+    """Peak bytes allocated while building and running the scenario."""
+    tracemalloc.start()
+    try:
+        simulation = scenario.createSimulation(vectorized)
+        for _ in range(scenario.ticks):
+            scenario.beforeTick(simulation.game)
+            simulation.step()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def runScenario(scenario: Scenario, vectorized: bool = False, repeat: int = 3) -> dict[str, Any]:
+    """
+    Benchmarks a scenario in three separate passes so the instruments do not
+    skew each other: the best of `repeat` plain runs for ticks per second,
+    one profiled run for the phases and one traced run for peak memory.
+    """
+    seconds = min(timeScenario(scenario, vectorized) for _ in range(max(1, repeat)))
+    phases, peakEntities = profileScenario(scenario, vectorized)
+    return {
+        "ticks": scenario.ticks,
+        "seconds": round(seconds, 4),
+        "ticksPerSecond": round(scenario.ticks / seconds, 1),
+        "peakMemoryKiB": round(measurePeakMemory(scenario, vectorized) / 1024, 1),
+        "peakEntities": peakEntities,
+        "phases": phases,
+    }
+
+
+REGRESSION_METRICS: Final[dict[str, int]] = {
+    # Metric -> 1 when bigger is better, -1 when smaller is better.
+    "ticksPerSecond": 1,
+    "peakMemoryKiB": -1,
+}
+
+
+def compareResults(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Lists the scenario metrics that got worse than the baseline by more than
+    `threshold` (a fraction). Scenarios missing from either side are skipped.
+    """
+    regressions: list[str] = []
+    for name, result in results["scenarios"].items():
+        baselineResult = baseline["scenarios"].get(name)
+        if baselineResult is None: continue
+
+        for metric, direction in REGRESSION_METRICS.items():
+            current, previous = result[metric], baselineResult[metric]
+            if previous <= 0: continue
+            change = (current - previous) / previous * direction
+            if change < -threshold:
+                regressions.append(f"{name}.{metric}: {previous} -> {current} ({change:+.1%})")
+    return regressions
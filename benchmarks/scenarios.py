@@ -0,0 +1,114 @@
+import math
+from typing import Any, Final
+
+from config import FRAME_RATE, GAME_FIELD_SIZE
+from helpers.location import Location
+from logic.game import Game
+from logic.policies import createPolicy
+from logic.simulation import Simulation
+from units.bullet import Bullet
+from units.pickups.megabomb import Megabomb
+
+
+class Scenario:
+    """
+    A reproducible workload for the simulation core: a seeded headless match
+    with fixed balance, policy and length. The player cannot die, so every
+    run simulates exactly `ticks` ticks. setUp runs once on the new game and
+    beforeTick before every tick, to push the match into the state under test.
+    """
+    name: str = "scenario"
+    ticks: int = 1800
+    seed: int = 1
+    gridSize: tuple[int, int] = (GAME_FIELD_SIZE, GAME_FIELD_SIZE)
+    policyName: str = "idle"
+    balance: dict[str, Any] = {}
+
+    INVULNERABLE_HEALTH: Final[int] = 10 ** 9
+
+    def createSimulation(self, vectorized: bool = False) -> Simulation:
+        simulation = Simulation(
+            playerName=self.name,
+            seed=self.seed,
+            gridSize=self.gridSize,
+            # Long enough that the clock never ends the match before the last tick.
+            gameDurationInSeconds=self.ticks // FRAME_RATE + 1,
+            policy=createPolicy(self.policyName, self.seed),
+            balance=self.balance,
+            vectorized=vectorized,
+        )
+        self.setUp(simulation.game)
+        return simulation
+
+    def setUp(self, game: Game) -> None:
+        game.player.health = self.INVULNERABLE_HEALTH
+
+    def beforeTick(self, game: Game) -> None:
+        pass
+
+
+class IdleScenario(Scenario):
+    """Nothing spawns: the fixed cost of a tick."""
+    name = "idle"
+    balance = {"CRATE_SPAWN_CHANCE": 0.0}
+
+    def setUp(self, game: Game) -> None:
+        super().setUp(game)
+        game.setEnemySpawnTimer(math.inf)
+
+
+class MaxWaveScenario(Scenario):
+    """Full waves at the shortest spawn interval from the first second on."""
+    name = "maxWave"
+    policyName = "hunter"
+    balance = {"MAX_NUMBER_OF_ENEMIES_TO_SPAWN": 9, "ENEMY_SPAWN_INTERVAL_DECREMENT": 0.0}
+
+    def setUp(self, game: Game) -> None:
+        super().setUp(game)
+        game.setEnemySpawnTimer(game.MIN_ENEMY_SPAWN_INTERVAL, game.clock.now() - game.MIN_ENEMY_SPAWN_INTERVAL)
+
+
+class BulletSpamScenario(MaxWaveScenario):
+    """A row of bullets fired across the whole field every tick into full waves."""
+    name = "bulletSpam"
+    FIRING_ROW_OFFSET: Final[int] = 3
+
+    def beforeTick(self, game: Game) -> None:
+        grid = game.occupancyGrid
+        y = game.gridSize[1] - self.FIRING_ROW_OFFSET
+        for x in range(1, game.gridSize[0] - 1):
+            location = Location(x, y)
+            if grid.isBlocked(location): continue
+            game.placeUnit(game.createUnit(Bullet, location))
+
+
+class CrateStormScenario(Scenario):
+    """A crate every tick; the hunter shoots them open and collects the drops."""
+    name = "crateStorm"
+    policyName = "hunter"
+    balance = {"CRATE_SPAWN_CHANCE": 1.0}
+
+
+class MegabombScenario(MaxWaveScenario):
+    """Full waves wiped out by a Megabomb every three seconds."""
+    name = "megabomb"
+    policyName = "idle"
+    MEGABOMB_INTERVAL_TICKS: Final[int] = 3 * FRAME_RATE
+
+    def beforeTick(self, game: Game) -> None:
+        if game.clock.ticks % self.MEGABOMB_INTERVAL_TICKS != 0: return
+        game.player.addItem(Megabomb(game.player.location))
+        game.tryActivatePickup(len(game.player.inventory))
+
+
+class HugeGridScenario(MaxWaveScenario):
+    """Full waves on a field with 40 times the cells of the default one."""
+    name = "hugeGrid"
+    ticks = 900
+    gridSize = (160, 160)
+
+
+SCENARIOS: Final[dict[str, type[Scenario]]] = {
+    scenario.name: scenario
+    for scenario in (IdleScenario, MaxWaveScenario, BulletSpamScenario, CrateStormScenario, MegabombScenario, HugeGridScenario)
+}
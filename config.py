@@ -2,3 +2,14 @@ import os
 from typing import Final
 
 DB_PATH: Final[str] = os.path.abspath("data/game.db")
+
+# Simulation ticks per second. Rendering runs at its own rate, see RENDER_FRAME_RATE.
+FRAME_RATE: Final[int] = 30
+RENDER_FRAME_RATE: Final[int] = 60
+MAX_TICKS_PER_FRAME: Final[int] = 5
+RENDER_INTERPOLATION: Final[bool] = False
+GAME_DURATION_IN_SECONDS: Final[int] = 180
+GAME_FIELD_SIZE: Final[int] = 26
+
+PLAYER_START_POSITION: Final[tuple[int, int]] = (10, 20)
+PLAYER_HEALTH: Final[int] = 4
@@ -1,19 +1,12 @@
 import sqlite3
-from sqlite3 import Cursor
 from config import DB_PATH
+from repositories.schemaMigrations import applyMigrations, SCHEMA_VERSION
 
 def main():
     connection = sqlite3.connect(DB_PATH)
-    cursor: Cursor = connection.cursor()
-
-    cursor.execute("""
-        Create Table If Not Exists Scores (
-            Id Integer Primary Key AUTOINCREMENT,
-            PlayerName Text NOT NULL,
-            Score Integer NOT NULL,
-            CreatedAt Text NOT NULL
-        );
-    """)
+    startVersion = applyMigrations(connection)
+    connection.close()
+    print(f"Database {DB_PATH} migrated from schema version {startVersion} to {SCHEMA_VERSION}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
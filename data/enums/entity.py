@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Final
 
 class Entity(Enum):
     PLAYER = "player"
@@ -8,4 +9,9 @@ class Entity(Enum):
     HEART = "heart"
     EXTRA_SCORE = "extraScore"
     MEGABOMB = "megabomb"
-    WALL = "wall"    
\ No newline at end of file
+    WALL = "wall"    
+
+# Compact one-byte codes used by array-backed structures such as helpers.grid.Grid.
+EMPTY_ENTITY_CODE: Final[int] = 0
+ENTITY_CODES: Final[dict[Entity, int]] = {entity: code for code, entity in enumerate(Entity, start=1)}
+ENTITIES_BY_CODE: Final[tuple[Entity | None, ...]] = (None, *Entity)
@@ -0,0 +1,131 @@
+import hashlib
+import io
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Final, Hashable, TypeVar
+import pygame
+from pygame import Rect, Surface
+
+K = TypeVar("K", bound=Hashable)
+
+
+class AssetManager:
+    """
+    Loads images at the size they are drawn at. Every scaled result is cached
+    on disk under a hash of its source files and its size, so later launches
+    read one small pre-scaled PNG instead of decoding and rescaling the
+    original art; editing a source changes its hash and refreshes its entry.
+    Sprites of one size are packed into a single atlas surface and handed
+    out as subsurfaces of it.
+
+    preload starts loading on a background thread; get waits for the result
+    (or loads on the spot if nothing was preloaded) and converts it for the
+    display, which only the main thread may do. Surfaces are shared: blit
+    them, never draw on them.
+    """
+    DEFAULT_CACHE_DIRECTORY: Final[str] = "data/assetCache"
+    HASH_LENGTH: Final[int] = 16
+
+    def __init__(self, cacheDirectory: str | None = DEFAULT_CACHE_DIRECTORY, workers: int = 1) -> None:
+        """cacheDirectory None disables the disk cache."""
+        self.cacheDirectory = cacheDirectory
+        self.cacheHits: int = 0
+        self.cacheMisses: int = 0
+        # Seconds spent producing each asset, read from the cache or scaled from the source.
+        self.loadTimes: dict[str, float] = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        self._pending: dict[Hashable, Future[Surface]] = {}
+        self._surfaces: dict[Hashable, Surface] = {}
+        self._atlases: dict[Hashable, dict] = {}
+
+    def preloadImage(self, path: str, size: tuple[int, int]) -> None:
+        self._preload(("image", path, size), lambda: self._loadImage(path, size))
+
+    def getImage(self, path: str, size: tuple[int, int]) -> Surface:
+        return self._get(("image", path, size), lambda: self._loadImage(path, size))
+
+    def preloadAtlas(self, paths: dict[K, str], size: tuple[int, int]) -> None:
+        self._preload(self._getAtlasKey(paths, size), lambda: self._loadAtlas(list(paths.values()), size))
+
+    def getAtlas(self, paths: dict[K, str], size: tuple[int, int]) -> dict[K, Surface]:
+        """Sprites of size `size`, one per key, all subsurfaces of one atlas surface."""
+        key = self._getAtlasKey(paths, size)
+        sprites = self._atlases.get(key)
+        if sprites is None:
+            atlas = self._get(key, lambda: self._loadAtlas(list(paths.values()), size))
+            width, height = size
+            sprites = self._atlases[key] = {name: atlas.subsurface(Rect(index * width, 0, width, height)) for index, name in enumerate(paths)}
+        return sprites
+
+    def close(self) -> None:
+        """Drops the loads that have not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _getAtlasKey(paths: dict, size: tuple[int, int]) -> tuple:
+        return ("atlas", tuple(paths.items()), size)
+
+    def _preload(self, key: Hashable, load: Callable[[], Surface]) -> None:
+        if key in self._surfaces or key in self._pending: return
+        self._pending[key] = self._executor.submit(load)
+
+    def _get(self, key: Hashable, load: Callable[[], Surface]) -> Surface:
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            return surface
+        future = self._pending.pop(key, None)
+        surface = (load() if future is None else future.result()).convert_alpha()
+        self._surfaces[key] = surface
+        return surface
+
+    def _loadImage(self, path: str, size: tuple[int, int]) -> Surface:
+        return self._loadCached(os.path.splitext(os.path.basename(path))[0], [path], size, lambda sources: self._scale(sources[0], path, size))
+
+    def _loadAtlas(self, paths: list[str], size: tuple[int, int]) -> Surface:
+        def pack(sources: list[bytes]) -> Surface:
+            width, height = size
+            atlas = Surface((width * len(paths), height), pygame.SRCALPHA)
+            for index, (source, path) in enumerate(zip(sources, paths)):
+                # Added onto the transparent atlas, so the pixels are copied instead of blended.
+                atlas.blit(self._scale(source, path, size), (index * width, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            return atlas
+        return self._loadCached("atlas", paths, size, pack)
+
+    @staticmethod
+    def _scale(source: bytes, path: str, size: tuple[int, int]) -> Surface:
+        # The original file name tells pygame the image format.
+        image = pygame.image.load(io.BytesIO(source), path)
+        return pygame.transform.scale(image, size)
+
+    def _loadCached(self, name: str, paths: list[str], size: tuple[int, int], build: Callable[[list[bytes]], Surface]) -> Surface:
+        """May run on the loader thread, so it must not touch the display."""
+        start = time.perf_counter()
+        sources: list[bytes] = []
+        for path in paths:
+            with open(path, "rb") as file:
+                sources.append(file.read())
+
+        cachePath = None
+        if self.cacheDirectory is not None:
+            digest = hashlib.sha1()
+            for source in sources:
+                digest.update(hashlib.sha1(source).digest())
+            cachePath = os.path.join(self.cacheDirectory, f"{name}-{digest.hexdigest()[:self.HASH_LENGTH]}-{size[0]}x{size[1]}.png")
+            if os.path.exists(cachePath):
+                surface = pygame.image.load(cachePath)
+                self.cacheHits += 1
+                self.loadTimes[name] = time.perf_counter() - start
+                return surface
+
+        surface = build(sources)
+        self.cacheMisses += 1
+        if cachePath is not None:
+            os.makedirs(self.cacheDirectory, exist_ok=True)
+            # Written under a temporary name first, so a crash or a second launch never reads half a file.
+            temporaryPath = f"{cachePath}.{os.getpid()}.tmp.png"
+            pygame.image.save(surface, temporaryPath)
+            os.replace(temporaryPath, cachePath)
+        self.loadTimes[name] = time.perf_counter() - start
+        return surface
+
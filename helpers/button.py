@@ -1,5 +1,6 @@
 import pygame
 from colors import GREY_COLOR
+from helpers.textCache import textCache
 
 
 class Button:
@@ -21,7 +22,7 @@ class Button:
         self.hoveringColor = hoveringColor
         self.textValue = textValue
 
-        self.text = self.font.render(self.textValue, True, self.baseColor)
+        self.text = textCache.render(self.font, self.textValue, self.baseColor)
 
         if self.image is None:
             self.image = self.text
@@ -46,16 +47,16 @@ class Button:
 
     def changeColor(self, position: tuple[int, int]) -> None:
         if not self._isEnabled:
-            self.text = self.font.render(self.textValue, True, GREY_COLOR)
+            self.text = textCache.render(self.font, self.textValue, GREY_COLOR)
             return
 
         if (
             self.rect.left <= position[0] <= self.rect.right
             and self.rect.top <= position[1] <= self.rect.bottom
         ):
-            self.text = self.font.render(self.textValue, True, self.hoveringColor)
+            self.text = textCache.render(self.font, self.textValue, self.hoveringColor)
         else:
-            self.text = self.font.render(self.textValue, True, self.baseColor)
+            self.text = textCache.render(self.font, self.textValue, self.baseColor)
 
     @property
     def isEnabled(self) -> bool:
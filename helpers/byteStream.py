@@ -0,0 +1,67 @@
+import struct
+from helpers.varint import readVarint, writeVarint, zigzagDecode, zigzagEncode
+
+_FLOAT = struct.Struct("<d")
+
+
+class ByteWriter:
+    """Appends varints, signed varints, floats and strings to a growing buffer."""
+    __slots__ = ["buffer"]
+
+    def __init__(self, header: bytes = b"") -> None:
+        self.buffer = bytearray(header)
+
+    def writeUnsigned(self, value: int) -> None:
+        writeVarint(self.buffer, value)
+
+    def writeSigned(self, value: int) -> None:
+        writeVarint(self.buffer, zigzagEncode(value))
+
+    def writeFloat(self, value: float) -> None:
+        self.buffer += _FLOAT.pack(value)
+
+    def writeString(self, value: str) -> None:
+        encoded = value.encode("utf-8")
+        writeVarint(self.buffer, len(encoded))
+        self.buffer += encoded
+
+    def writeBytes(self, value: bytes) -> None:
+        writeVarint(self.buffer, len(value))
+        self.buffer += value
+
+    def getBytes(self) -> bytes:
+        return bytes(self.buffer)
+
+
+class ByteReader:
+    """Reads back what a ByteWriter wrote, in the same order."""
+    __slots__ = ["data", "offset"]
+
+    def __init__(self, data: bytes, offset: int = 0) -> None:
+        self.data = memoryview(data)
+        self.offset = offset
+
+    def readUnsigned(self) -> int:
+        value, self.offset = readVarint(self.data, self.offset)
+        return value
+
+    def readSigned(self) -> int:
+        return zigzagDecode(self.readUnsigned())
+
+    def readFloat(self) -> float:
+        if self.offset + _FLOAT.size > len(self.data):
+            raise ValueError("Truncated float")
+        value = _FLOAT.unpack_from(self.data, self.offset)[0]
+        self.offset += _FLOAT.size
+        return value
+
+    def readBytes(self) -> bytes:
+        length = self.readUnsigned()
+        if self.offset + length > len(self.data):
+            raise ValueError("Truncated byte string")
+        value = bytes(self.data[self.offset:self.offset + length])
+        self.offset += length
+        return value
+
+    def readString(self) -> str:
+        return self.readBytes().decode("utf-8")
@@ -0,0 +1,55 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Callable, Final
+
+
+class Clock(ABC):
+    @abstractmethod
+    def now(self) -> float:
+        """Returns the current game time in seconds."""
+        pass
+
+    def tick(self) -> None:
+        """Called once per Game.update before any game logic runs."""
+        pass
+
+    def copy(self) -> "Clock":
+        """Clock for a cloned game. Clocks without state of their own are shared."""
+        return self
+
+
+class TickClock(Clock):
+    """
+    Deterministic clock that advances by a fixed step on every tick.
+    Game time only moves when the simulation does, so the same inputs
+    always produce the same match regardless of how fast it is played.
+    """
+    DEFAULT_TICK_RATE: Final[int] = 30
+
+    __slots__ = ["tickRate", "ticks", "_secondsPerTick"]
+
+    def __init__(self, tickRate: int = DEFAULT_TICK_RATE, ticks: int = 0) -> None:
+        self.tickRate = tickRate
+        self.ticks = ticks
+        self._secondsPerTick = 1.0 / tickRate
+
+    def now(self) -> float:
+        return self.ticks * self._secondsPerTick
+
+    def tick(self) -> None:
+        self.ticks += 1
+
+    def getFirstTickWhere(self, isReached: Callable[[float], bool], estimate: float) -> int:
+        """
+        First tick from the current one on whose time satisfies isReached, a
+        condition on now() that stays true once it is met at about `estimate`
+        seconds. The condition is evaluated on the exact times now() returns,
+        so a timer fires on the same tick as polling it every tick would.
+        """
+        tick = max(self.ticks, math.floor(estimate * self.tickRate) - 1)
+        while not isReached(tick * self._secondsPerTick):
+            tick += 1
+        return tick
+
+    def copy(self) -> "TickClock":
+        return TickClock(self.tickRate, self.ticks)
@@ -0,0 +1,211 @@
+from contextlib import contextmanager
+from typing import Final, Iterator, Protocol
+from data.enums.entity import Entity
+from units.unit import Unit
+
+
+class EntityViewObserver(Protocol):
+    """Receives slot-level changes of an EntityView, e.g. to mirror it in parallel arrays."""
+    def onUnitAdded(self, unit: Unit, slot: int) -> None: ...
+    def onUnitRemoved(self, unit: Unit, slot: int) -> None: ...
+    def onSlotsCompacted(self, previousSlots: list[int]) -> None: ...
+
+
+class EntityView:
+    """
+    Live set of the registered units of one entity type, stored in slots.
+    Adding and removing a unit is O(1): a removed unit leaves a hole that is
+    reused by a later add. Iterating while units are added or removed is safe:
+    removed units are never yielded, units added during a pass are not visited
+    until the next one, and holes are only reused once no pass is running.
+    An optional observer is told about every slot change.
+    """
+    COMPACT_MIN_SLOTS: Final[int] = 64
+
+    __slots__ = ["entityType", "_slots", "_freeSlots", "_pendingFreeSlots", "_count", "_activeIterations", "observer"]
+
+    def __init__(self, entityType: Entity) -> None:
+        self.entityType = entityType
+        self._slots: list[Unit | None] = []
+        self._freeSlots: list[int] = []
+        self._pendingFreeSlots: list[int] = []
+        self._count = 0
+        self._activeIterations = 0
+        self.observer: EntityViewObserver | None = None
+
+    def add(self, unit: Unit) -> None:
+        if self._freeSlots:
+            slot = self._freeSlots.pop()
+            self._slots[slot] = unit
+        else:
+            slot = len(self._slots)
+            self._slots.append(unit)
+        unit.registrySlot = slot
+        self._count += 1
+        if self.observer is not None:
+            self.observer.onUnitAdded(unit, slot)
+
+    def discard(self, unit: Unit) -> bool:
+        slot = unit.registrySlot
+        if slot < 0 or slot >= len(self._slots) or self._slots[slot] is not unit:
+            return False
+
+        self._slots[slot] = None
+        unit.registrySlot = -1
+        self._count -= 1
+        if self.observer is not None:
+            self.observer.onUnitRemoved(unit, slot)
+        if self._activeIterations:
+            self._pendingFreeSlots.append(slot)
+        else:
+            self._freeSlots.append(slot)
+            self._compactIfSparse()
+        return True
+
+    def restoreSlots(self, slots: list[Unit | None], freeSlots: list[int]) -> None:
+        """
+        Replaces the content with an exact slot layout (e.g. of a snapshot or
+        of the view a clone is made from), holes included, so that later adds
+        reuse the same slots and iteration order stays the same.
+        """
+        if self._activeIterations:
+            raise RuntimeError("Cannot restore the slots of a view that is being iterated.")
+        self._slots = list(slots)
+        self._freeSlots = list(freeSlots)
+        self._pendingFreeSlots = []
+        self._count = 0
+        for slot, unit in enumerate(self._slots):
+            if unit is None: continue
+            unit.registrySlot = slot
+            self._count += 1
+            if self.observer is not None:
+                self.observer.onUnitAdded(unit, slot)
+
+    def _compactIfSparse(self) -> None:
+        # Keeps iteration proportional to the live units after a large wave dies.
+        if len(self._slots) < self.COMPACT_MIN_SLOTS or self._count * 4 > len(self._slots):
+            return
+        units = [unit for unit in self._slots if unit is not None]
+        previousSlots = [unit.registrySlot for unit in units]
+        for slot, unit in enumerate(units):
+            unit.registrySlot = slot
+        self._slots = units
+        self._freeSlots = []
+        if self.observer is not None:
+            self.observer.onSlotsCompacted(previousSlots)
+
+    def __iter__(self) -> Iterator[Unit]:
+        slots = self._slots
+        end = len(slots)
+        self._activeIterations += 1
+        try:
+            for slot in range(end):
+                unit = slots[slot]
+                if unit is not None:
+                    yield unit
+        finally:
+            self._endPass()
+
+    @contextmanager
+    def holdSlots(self) -> Iterator[None]:
+        """Runs a pass without iterating the view, e.g. over a precomputed list of movers: holes are reused only afterwards."""
+        self._activeIterations += 1
+        try:
+            yield
+        finally:
+            self._endPass()
+
+    def _endPass(self) -> None:
+        self._activeIterations -= 1
+        if not self._activeIterations and self._pendingFreeSlots:
+            self._freeSlots.extend(self._pendingFreeSlots)
+            self._pendingFreeSlots.clear()
+            self._compactIfSparse()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def slots(self) -> list[Unit | None]:
+        """The raw slot table, holes included. Read-only by convention."""
+        return self._slots
+
+    @property
+    def freeSlots(self) -> list[int]:
+        """Holes waiting for reuse, the next one to be filled last. Read-only by convention."""
+        return self._freeSlots
+
+    def __contains__(self, unit: object) -> bool:
+        slot = getattr(unit, "registrySlot", -1)
+        return 0 <= slot < len(self._slots) and self._slots[slot] is unit
+
+
+class EntityRegistry:
+    """
+    Owns every unit that lives in a Game. Each registered unit gets a stable
+    integer id (unit.unitId, never reused) and is filed into the view of its
+    entity type.
+    """
+    __slots__ = ["_nextId", "_units", "_views"]
+
+    def __init__(self) -> None:
+        self._nextId = 1
+        self._units: dict[int, Unit] = {}
+        self._views: dict[Entity, EntityView] = {}
+
+    def view(self, entityType: Entity) -> EntityView:
+        view = self._views.get(entityType)
+        if view is None:
+            view = self._views[entityType] = EntityView(entityType)
+        return view
+
+    def add(self, unit: Unit) -> int:
+        unit.unitId = self._nextId
+        self._nextId += 1
+        self._units[unit.unitId] = unit
+        self.view(unit.entityType).add(unit)
+        return unit.unitId
+
+    def remove(self, unit: Unit) -> bool:
+        """Unregisters a unit. Returns False if it was not registered (e.g. already removed)."""
+        if self._units.get(unit.unitId) is not unit:
+            return False
+        del self._units[unit.unitId]
+        self._views[unit.entityType].discard(unit)
+        return True
+
+    def get(self, unitId: int) -> Unit | None:
+        return self._units.get(unitId)
+
+    def __contains__(self, unit: object) -> bool:
+        return self._units.get(getattr(unit, "unitId", 0)) is unit
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def __iter__(self) -> Iterator[Unit]:
+        return iter(list(self._units.values()))
+
+    @property
+    def nextId(self) -> int:
+        return self._nextId
+
+    @property
+    def views(self) -> dict[Entity, EntityView]:
+        return self._views
+
+    def restore(self, units: list[Unit], nextId: int) -> None:
+        """
+        Registers units under the unitId they already carry, in the given
+        order. Views are not touched: fill them with EntityView.restoreSlots.
+        """
+        self._units = {unit.unitId: unit for unit in units}
+        self._nextId = nextId
+
+    def copy(self, clones: dict[Unit, Unit]) -> "EntityRegistry":
+        """A registry with the same ids and slot layouts holding the clone of every unit."""
+        registry = EntityRegistry()
+        registry.restore([clones[unit] for unit in self._units.values()], self._nextId)
+        for entityType, view in self._views.items():
+            registry.view(entityType).restoreSlots([None if unit is None else clones[unit] for unit in view.slots], view.freeSlots)
+        return registry
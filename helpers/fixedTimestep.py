@@ -0,0 +1,43 @@
+import time
+from typing import Callable, Final
+
+
+class FixedTimestep:
+    """
+    Accumulator that turns elapsed real time into a whole number of fixed
+    simulation ticks, independent of how often frames are rendered. After a
+    hitch at most maxTicksPerFrame ticks are run in one frame and the rest of
+    the backlog is dropped, so a slow frame cannot snowball into ever longer
+    catch-up frames; the game briefly runs slower instead.
+    """
+    DEFAULT_MAX_TICKS_PER_FRAME: Final[int] = 5
+
+    __slots__ = ["tickRate", "maxTicksPerFrame", "droppedTicks", "_secondsPerTick", "_accumulator", "_lastTime", "_timeSource"]
+
+    def __init__(self, tickRate: int, maxTicksPerFrame: int = DEFAULT_MAX_TICKS_PER_FRAME, timeSource: Callable[[], float] = time.perf_counter) -> None:
+        self.tickRate = tickRate
+        self.maxTicksPerFrame = maxTicksPerFrame
+        self.droppedTicks: int = 0
+        self._secondsPerTick = 1.0 / tickRate
+        self._accumulator = 0.0
+        self._timeSource = timeSource
+        self._lastTime = timeSource()
+
+    def advance(self) -> int:
+        """Adds the time since the previous call and returns how many ticks to simulate now."""
+        now = self._timeSource()
+        self._accumulator += now - self._lastTime
+        self._lastTime = now
+
+        ticks = int(self._accumulator / self._secondsPerTick)
+        if ticks > self.maxTicksPerFrame:
+            self.droppedTicks += ticks - self.maxTicksPerFrame
+            ticks = self.maxTicksPerFrame
+            self._accumulator = ticks * self._secondsPerTick + self._accumulator % self._secondsPerTick
+        self._accumulator -= ticks * self._secondsPerTick
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        """How far real time is between the last simulated tick and the next one, from 0 to 1."""
+        return min(1.0, self._accumulator / self._secondsPerTick)
@@ -0,0 +1,105 @@
+import csv
+import json
+import math
+import time
+from collections import deque
+from typing import Any, Final
+
+
+class FrameProfiler:
+    """
+    Lap timer for the phases of a frame. beginFrame starts the clock, every
+    lap(name) charges the time since the previous lap to that phase and
+    endFrame closes the frame. The last `window` frames feed the rolling
+    percentiles; up to `traceCapacity` frames are kept for dumpTrace.
+    Times are in milliseconds.
+    """
+    DEFAULT_WINDOW: Final[int] = 300
+    DEFAULT_TRACE_CAPACITY: Final[int] = 54000
+    PERCENTILES: Final[tuple[int, ...]] = (50, 95, 99)
+    FRAME_PHASE: Final[str] = "total"
+
+    __slots__ = ["window", "frameIndex", "counts", "_phaseTimes", "_currentPhases", "_frameStart", "_lapStart", "_trace"]
+
+    def __init__(self, window: int = DEFAULT_WINDOW, traceCapacity: int = DEFAULT_TRACE_CAPACITY) -> None:
+        self.window = window
+        self.frameIndex: int = 0
+        self.counts: dict[str, int] = {}
+        self._phaseTimes: dict[str, deque[int]] = {self.FRAME_PHASE: deque(maxlen=window)}
+        self._currentPhases: dict[str, int] = {}
+        self._frameStart: int = 0
+        self._lapStart: int = 0
+        # Raw (frame, phase nanoseconds, counts) entries, formatted only by dumpTrace.
+        self._trace: deque[tuple[int, dict[str, int], dict[str, int]]] = deque(maxlen=traceCapacity)
+
+    def beginFrame(self) -> None:
+        self._frameStart = self._lapStart = time.perf_counter_ns()
+        self._currentPhases = {}
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter_ns()
+        phases = self._currentPhases
+        phases[phase] = phases.get(phase, 0) + now - self._lapStart
+        self._lapStart = now
+
+    def endFrame(self, counts: dict[str, int] | None = None) -> None:
+        frameTime = time.perf_counter_ns() - self._frameStart
+        phases = self._currentPhases
+        phases[self.FRAME_PHASE] = frameTime
+
+        for phase, duration in phases.items():
+            times = self._phaseTimes.get(phase)
+            if times is None:
+                times = self._phaseTimes[phase] = deque(maxlen=self.window)
+            times.append(duration)
+
+        if counts is not None:
+            self.counts = counts
+        self._trace.append((self.frameIndex, phases, self.counts))
+        self.frameIndex += 1
+
+    @property
+    def phases(self) -> list[str]:
+        return list(self._phaseTimes)
+
+    def getPercentiles(self, phase: str) -> tuple[float, ...]:
+        """Nearest-rank PERCENTILES of the phase over the window, or zeros before it was timed."""
+        times = sorted(self._phaseTimes.get(phase, ()))
+        if not times:
+            return tuple(0.0 for _ in self.PERCENTILES)
+        return tuple(times[max(0, math.ceil(percentile / 100 * len(times)) - 1)] / 1e6 for percentile in self.PERCENTILES)
+
+    def getMean(self, phase: str) -> float:
+        times = self._phaseTimes.get(phase, ())
+        return sum(times) / len(times) / 1e6 if times else 0.0
+
+    def getSummary(self) -> dict[str, dict[str, float]]:
+        return {
+            phase: {
+                "mean": round(self.getMean(phase), 4),
+                **{f"p{percentile}": round(value, 4) for percentile, value in zip(self.PERCENTILES, self.getPercentiles(phase))}
+            }
+            for phase in self._phaseTimes
+        }
+
+    def dumpTrace(self, path: str) -> None:
+        """Writes the per-frame trace as JSON when path ends with .json, as CSV otherwise."""
+        rows: list[dict[str, Any]] = []
+        for frameIndex, phases, counts in self._trace:
+            row: dict[str, Any] = {"frame": frameIndex}
+            row.update((phase, round(duration / 1e6, 4)) for phase, duration in phases.items())
+            row.update(counts)
+            rows.append(row)
+
+        if path.endswith(".json"):
+            with open(path, "w") as traceFile:
+                json.dump(rows, traceFile)
+            return
+
+        columns: dict[str, None] = {}
+        for row in rows:
+            columns.update(dict.fromkeys(row))
+        with open(path, "w", newline="") as traceFile:
+            writer = csv.DictWriter(traceFile, fieldnames=list(columns), restval="")
+            writer.writeheader()
+            writer.writerows(rows)
@@ -1,51 +1,189 @@
 from typing import TYPE_CHECKING, Iterator
+from data.enums.entity import EMPTY_ENTITY_CODE, ENTITY_CODES, Entity
 from helpers.location import Location
 from units.unit import Unit
 from units.wall import Wall
 if TYPE_CHECKING:
     from logic.game import Game
 
+class GridSnapshot:
+    __slots__ = ["gridSize", "codes", "units"]
+
+    def __init__(self, gridSize: tuple[int, int], codes: bytes, units: tuple[Unit | None, ...]) -> None:
+        self.gridSize = gridSize
+        self.codes = codes
+        self.units = units
+
 class Grid:
+    """
+    Occupancy index of the game field stored row-major in two flat tables:
+    a bytearray of entity codes (see data.enums.entity.ENTITY_CODES) and a
+    parallel table with the occupying unit of each cell.
+    """
+    __slots__ = ["gridSize", "game", "width", "height", "_codes", "_units", "_changedCells"]
+
     def __init__(self, gridSize: tuple[int, int], game: "Game") -> None:
         self.gridSize = gridSize
         self.game = game
-        self._grid: list[list[Unit | str]] = []
+        self.width, self.height = gridSize
+        self._codes = bytearray(self.width * self.height)
+        self._units: list[Unit | None] = [None] * (self.width * self.height)
+        # Indices of cells changed since the last consumeChangedCells; None while nobody tracks changes.
+        self._changedCells: set[int] | None = None
         self.initializeGrid()
-    
+
     def initializeGrid(self):
-        for y in range(self.gridSize[1]):
-            row = []
-            for x in range(self.gridSize[0]):
-                if y == 0 or y == self.gridSize[1] - 1 or x == 0 or x == self.gridSize[0] - 1:
-                    row.append(Wall(Location(x, y)))
-                elif Location(x, y) == self.game.player.location:
-                    row.append(self.game.player)
-                else:
-                    row.append(self.game.EMPTY_CELL_SYMBOL)
-            self._grid.append(row)
-    
+        width, height = self.width, self.height
+        wallCode = ENTITY_CODES[Entity.WALL]
+        for x in range(width):
+            for y in (0, height - 1):
+                self._units[y * width + x] = Wall(Location(x, y))
+                self._codes[y * width + x] = wallCode
+        for y in range(1, height - 1):
+            for x in (0, width - 1):
+                self._units[y * width + x] = Wall(Location(x, y))
+                self._codes[y * width + x] = wallCode
+
+        self.setOccupyingUnit(self.game.player.location, self.game.player)
+
     def isLocationValid(self, location: Location) -> bool:
-        if location.x <= 0 or location.x >= self.gridSize[0] - 1: return False
-        elif location.y <= 0 or location.y >= self.gridSize[1] - 1: return False
+        if location.x <= 0 or location.x >= self.width - 1: return False
+        elif location.y <= 0 or location.y >= self.height - 1: return False
         return True
-    
+
     def isLocationAtLowerBorder(self, location: Location) -> bool:
-        return location.y >= self.gridSize[1] - 1
-    
+        return location.y >= self.height - 1
+
     def isBlocked(self, location: Location) -> bool:
         return self.getOccupyingUnit(location) is not None
 
     def getOccupyingUnit(self, location: Location) -> Unit | None:
-        if self.isLocationValid(location) is False: return None
+        x, y = location.x, location.y
+        if x <= 0 or x >= self.width - 1 or y <= 0 or y >= self.height - 1: return None
+        return self._units[y * self.width + x]
+
+    def getUnitAtIndex(self, index: int) -> Unit | None:
+        """Occupant of the cell with row-major index `index`, walls included."""
+        return self._units[index]
 
-        cell = self._grid[location.y][location.x]
-        return cell if isinstance(cell, Unit) else None
-    
     def setOccupyingUnit(self, location: Location, unit: Unit | str) -> None:
         if self.isLocationValid(location) is False: return
-        self._grid[location.y][location.x] = unit
-    
+        index = location.y * self.width + location.x
+        if isinstance(unit, Unit):
+            self._units[index] = unit
+            self._codes[index] = ENTITY_CODES[unit.entityType]
+        else:
+            self._units[index] = None
+            self._codes[index] = EMPTY_ENTITY_CODE
+        if self._changedCells is not None:
+            self._changedCells.add(index)
+
+    def moveUnit(self, unit: Unit, nextLocation: Location) -> None:
+        """Moves a unit to nextLocation, clearing its current cell only if it still holds the unit."""
+        x, y = unit.location.x, unit.location.y
+        if 0 < x < self.width - 1 and 0 < y < self.height - 1:
+            index = y * self.width + x
+            if self._units[index] is unit:
+                self._units[index] = None
+                self._codes[index] = EMPTY_ENTITY_CODE
+                if self._changedCells is not None:
+                    self._changedCells.add(index)
+        unit.location = nextLocation
+        self.setOccupyingUnit(nextLocation, unit)
+
+    def trackChanges(self) -> None:
+        """Starts recording which cells change, for consumers like the renderer."""
+        self._changedCells = set(range(len(self._codes)))
+
+    def consumeChangedCells(self) -> set[int]:
+        """Returns the indices of the cells changed since the previous call (all cells on the first one)."""
+        if self._changedCells is None:
+            raise RuntimeError("Call trackChanges before consuming changed cells.")
+        changedCells = self._changedCells
+        self._changedCells = set()
+        return changedCells
+
+    def getEntityCode(self, location: Location) -> int:
+        """Returns the entity code of any cell on the field, walls included."""
+        return self._codes[location.y * self.width + location.x]
+
+    def getLocationsOfType(self, entityType: Entity) -> list[Location]:
+        codes, width = self._codes, self.width
+        code = ENTITY_CODES[entityType]
+        locations: list[Location] = []
+        index = codes.find(code)
+        while index != -1:
+            locations.append(Location(index % width, index // width))
+            index = codes.find(code, index + 1)
+        return locations
+
+    def countOfType(self, entityType: Entity) -> int:
+        return self._codes.count(ENTITY_CODES[entityType])
+
+    def scanRow(self, y: int) -> list[Unit | None]:
+        return self._units[y * self.width:(y + 1) * self.width]
+
+    def scanColumn(self, x: int) -> list[Unit | None]:
+        return self._units[x::self.width]
+
+    def getRowCodes(self, y: int) -> bytes:
+        return bytes(self._codes[y * self.width:(y + 1) * self.width])
+
+    def getColumnCodes(self, x: int) -> bytes:
+        return bytes(self._codes[x::self.width])
+
+    @property
+    def codes(self) -> memoryview:
+        """Read-only, zero-copy view of the entity codes, row-major."""
+        return memoryview(self._codes).toreadonly()
+
+    def snapshot(self) -> GridSnapshot:
+        return GridSnapshot(self.gridSize, bytes(self._codes), tuple(self._units))
+
+    def restore(self, snapshot: GridSnapshot) -> None:
+        if snapshot.gridSize != self.gridSize:
+            raise ValueError(f"Cannot restore a {snapshot.gridSize} snapshot into a {self.gridSize} grid.")
+        self._codes[:] = snapshot.codes
+        self._units[:] = snapshot.units
+        if self._changedCells is not None:
+            self._changedCells.update(range(len(self._codes)))
+
+    def copy(self, game: "Game", clones: dict[Unit, Unit] | None = None) -> "Grid":
+        """
+        Returns a grid with the same occupancy that belongs to another game.
+        Units found in clones are replaced by their clone. Walls never change
+        and stay shared; any other unit missing from clones is copied and
+        added to it.
+        """
+        grid = Grid.__new__(Grid)
+        grid.gridSize = self.gridSize
+        grid.game = game
+        grid.width, grid.height = self.width, self.height
+        grid._codes = self._codes[:]
+        grid._units = self._units[:]
+        grid._changedCells = None
+        if clones is None:
+            return grid
+
+        units = grid._units
+        wallCode = ENTITY_CODES[Entity.WALL]
+        for index, code in enumerate(self._codes):
+            if code == EMPTY_ENTITY_CODE or code == wallCode: continue
+            unit = units[index]
+            clone = clones.get(unit)
+            if clone is None:
+                clone = clones[unit] = unit.copy()
+            units[index] = clone
+        return grid
+
+    @property
+    def units(self) -> list[Unit | None]:
+        """The flat occupant table, row-major. Read-only by convention."""
+        return self._units
+
     @property
     def grid(self) -> Iterator[list]:
-        for row in self._grid:
-            yield row
\ No newline at end of file
+        emptyCell = self.game.EMPTY_CELL_SYMBOL
+        width = self.width
+        for y in range(self.height):
+            yield [emptyCell if unit is None else unit for unit in self._units[y * width:(y + 1) * width]]
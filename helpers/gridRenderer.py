@@ -0,0 +1,79 @@
+import pygame
+from pygame import Rect, Surface
+from colors import COLOR_TYPE
+from data.enums.entity import EMPTY_ENTITY_CODE, ENTITIES_BY_CODE, Entity
+from helpers.grid import Grid
+from helpers.location import Location
+from units.unit import Unit
+
+
+class GridRenderer:
+    """
+    Draws the game field incrementally: only the cells the Grid reports as
+    changed since the previous frame are repainted (background first, then
+    the sprite or color of the new occupant). render returns the screen
+    rectangles it touched so they can be passed to pygame.display.update.
+    """
+
+    def __init__(self, screen: Surface, grid: Grid, backgroundImage: Surface, images: dict[Entity, Surface], rects: dict[Entity, COLOR_TYPE], cellSize: int, /, origin: tuple[int, int] = (0, 0)):
+        self.screen = screen
+        self.grid = grid
+        self.backgroundImage = backgroundImage
+        self.cellSize = cellSize
+        self.origin = origin
+        # Indexed by entity code, so drawing a cell is two list lookups.
+        self._imagesByCode: list[Surface | None] = [images.get(entity) if entity else None for entity in ENTITIES_BY_CODE]
+        self._colorsByCode: list[COLOR_TYPE | None] = [rects.get(entity) if entity else None for entity in ENTITIES_BY_CODE]
+        self.grid.trackChanges()
+
+    def getCellRect(self, index: int) -> Rect:
+        y, x = divmod(index, self.grid.width)
+        return Rect(self.origin[0] + x * self.cellSize, self.origin[1] + y * self.cellSize, self.cellSize, self.cellSize)
+
+    def getFieldRect(self) -> Rect:
+        return Rect(self.origin[0], self.origin[1], self.grid.width * self.cellSize, self.grid.height * self.cellSize)
+
+    def _drawCell(self, code: int, rect: Rect) -> None:
+        image = self._imagesByCode[code]
+        if image is not None:
+            self.screen.blit(image, rect)
+        elif self._colorsByCode[code] is not None:
+            pygame.draw.rect(self.screen, self._colorsByCode[code], rect)
+
+    def render(self) -> list[Rect]:
+        codes = self.grid.codes
+        changedRects: list[Rect] = []
+        for index in self.grid.consumeChangedCells():
+            rect = self.getCellRect(index)
+            self.screen.blit(self.backgroundImage, rect, rect.move(-self.origin[0], -self.origin[1]))
+            self._drawCell(codes[index], rect)
+            changedRects.append(rect)
+
+        # Past half of the field one big rectangle is cheaper for display.update than many small ones.
+        if len(changedRects) * 2 > len(codes):
+            return [self.getFieldRect()]
+        return changedRects
+
+    def renderInterpolated(self, previousLocations: dict[Unit, Location], alpha: float) -> list[Rect]:
+        """
+        Redraws the whole field for rendering faster than the simulation
+        ticks. A unit that moved by one cell on the last tick (previousLocations
+        holds where it was before) is drawn alpha of the way from its previous
+        cell to its current one; everything else is drawn in its cell.
+        """
+        self.grid.consumeChangedCells()
+        fieldRect = self.getFieldRect()
+        self.screen.blit(self.backgroundImage, fieldRect)
+
+        units = self.grid.units
+        for index, code in enumerate(self.grid.codes):
+            if code == EMPTY_ENTITY_CODE: continue
+            rect = self.getCellRect(index)
+            previousLocation = previousLocations.get(units[index])
+            if previousLocation is not None:
+                location = units[index].location
+                dx, dy = location.x - previousLocation.x, location.y - previousLocation.y
+                if abs(dx) + abs(dy) == 1:
+                    rect.move_ip(round((alpha - 1) * dx * self.cellSize), round((alpha - 1) * dy * self.cellSize))
+            self._drawCell(code, rect)
+        return [fieldRect]
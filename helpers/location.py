@@ -1,12 +1,49 @@
+from typing import Final
+from data.enums.direction import Direction
+
+
 class Location:
-    __slots__ = ["x", "y"]
-    def __init__(self, x: int = 0, y: int = 0) -> None:
-        self.x = x
-        self.y = y
-    def _isValidOperand(self, other: object) -> bool:
-        return (hasattr(other, "x") and
-                hasattr(other, "y"))
-    def __eq__(self, other):
-        if not self._isValidOperand(other):
-            return NotImplemented
-        return ((self.x, self.y) == (other.x, other.y))
\ No newline at end of file
+    """
+    Immutable grid coordinate. Locations are interned: Location(x, y) always
+    returns the same object for the same coordinates, so the default identity
+    equality and hashing are correct and a location can key a dict or a set.
+    Each location keeps a table of its four neighbors, built on the first
+    getNeighbor call, so stepping onto a visited cell allocates nothing.
+    """
+    # (dx, dy) of a step in each Direction, indexed by Direction.value.
+    DIRECTION_OFFSETS: Final[tuple[tuple[int, int], ...]] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+    __slots__ = ["x", "y", "_neighbors"]
+
+    _interned: dict[tuple[int, int], "Location"] = {}
+
+    def __new__(cls, x: int = 0, y: int = 0) -> "Location":
+        location = cls._interned.get((x, y))
+        if location is None:
+            location = object.__new__(cls)
+            object.__setattr__(location, "x", x)
+            object.__setattr__(location, "y", y)
+            object.__setattr__(location, "_neighbors", None)
+            cls._interned[(x, y)] = location
+        return location
+
+    def getNeighbor(self, direction: Direction) -> "Location":
+        neighbors = self._neighbors
+        if neighbors is None:
+            x, y = self.x, self.y
+            neighbors = tuple(Location(x + dx, y + dy) for dx, dy in self.DIRECTION_OFFSETS)
+            object.__setattr__(self, "_neighbors", neighbors)
+        return neighbors[direction.value]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Location is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Location is immutable")
+
+    def __reduce__(self):
+        # Unpickled and copied locations are interned again.
+        return (Location, (self.x, self.y))
+
+    def __repr__(self) -> str:
+        return f"Location({self.x}, {self.y})"
@@ -0,0 +1,91 @@
+import heapq
+import math
+from typing import Final
+
+
+class NotificationManager:
+    """
+    The notifications currently shown, in the order they were added. Each
+    text is shown at most once, found by a dict lookup. Expiry times sit in
+    a heap, so purge only looks at the entries that are actually due. At
+    most `capacity` notifications are kept; adding another one drops the
+    oldest one that expires, so texts shown until removed stay unless
+    nothing else is left to drop. `version` changes whenever the set of
+    texts does, so a view can skip redrawing while it stays the same.
+    """
+    DEFAULT_CAPACITY: Final[int] = 16
+
+    __slots__ = ["capacity", "version", "_entries", "_expiries", "_sequence", "_texts"]
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = capacity
+        self.version: int = 0
+        # text -> (expiresAt, sequence); the sequence tells a live heap record from a stale one.
+        self._entries: dict[str, tuple[float, int]] = {}
+        self._expiries: list[tuple[float, int, str]] = []
+        self._sequence = 0
+        self._texts: tuple[str, ...] | None = ()
+
+    def add(self, text: str, expiresAt: float) -> bool:
+        """Shows text until game time expiresAt (math.inf for until removed). Returns False if it is already shown."""
+        if text in self._entries:
+            return False
+        if len(self._entries) >= self.capacity:
+            entries = self._entries
+            self.remove(next((text for text, (expiresAt, _) in entries.items() if expiresAt != math.inf), next(iter(entries))))
+
+        self._sequence += 1
+        self._entries[text] = (expiresAt, self._sequence)
+        if expiresAt != math.inf:
+            heapq.heappush(self._expiries, (expiresAt, self._sequence, text))
+        self._onChanged()
+        return True
+
+    def remove(self, text: str) -> bool:
+        if self._entries.pop(text, None) is None:
+            return False
+        # Removed entries leave their heap record behind; rebuild once those dominate.
+        if len(self._expiries) > 2 * self.capacity:
+            self._expiries = [(expiresAt, sequence, text) for text, (expiresAt, sequence) in self._entries.items() if expiresAt != math.inf]
+            heapq.heapify(self._expiries)
+        self._onChanged()
+        return True
+
+    def purge(self, now: float) -> None:
+        """Drops every notification that has expired by game time now."""
+        expiries = self._expiries
+        while expiries and expiries[0][0] <= now:
+            _, sequence, text = heapq.heappop(expiries)
+            entry = self._entries.get(text)
+            if entry is not None and entry[1] == sequence:
+                del self._entries[text]
+                self._onChanged()
+
+    def _onChanged(self) -> None:
+        self.version += 1
+        self._texts = None
+
+    @property
+    def texts(self) -> tuple[str, ...]:
+        if self._texts is None:
+            self._texts = tuple(self._entries)
+        return self._texts
+
+    def items(self) -> list[tuple[str, float]]:
+        """(text, expiresAt) of every notification, oldest first."""
+        return [(text, expiresAt) for text, (expiresAt, _) in self._entries.items()]
+
+    def copy(self) -> "NotificationManager":
+        manager = NotificationManager(self.capacity)
+        manager.version = self.version
+        manager._entries = dict(self._entries)
+        manager._expiries = list(self._expiries)
+        manager._sequence = self._sequence
+        manager._texts = self._texts
+        return manager
+
+    def __contains__(self, text: object) -> bool:
+        return text in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
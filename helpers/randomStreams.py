@@ -0,0 +1,146 @@
+import random
+from typing import Any, Final
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# random.Random.random builds a double from two 32-bit Mersenne Twister words: (a >> 5) * 2**26 + (b >> 6), over 2**53.
+HIGH_WORD_SCALE: Final[float] = 67108864.0
+FLOAT_SCALE: Final[float] = 1.0 / 9007199254740992.0
+
+
+class RandomStream:
+    """
+    One seeded stream of random draws around a random.Random `generator`.
+
+    With a bufferSize, random() is served from blocks of bufferSize draws
+    generated at once with NumPy from the same Mersenne Twister words
+    random.Random.random would use, so a buffered stream yields exactly
+    the floats an unbuffered one does; take hands out many draws as one
+    array slice. A buffered stream serves random draws only: any other
+    use of the generator would consume words already in the buffer.
+    """
+    __slots__ = ["generator", "bufferSize", "random", "_blockStart", "_values", "_floats", "_position"]
+
+    def __init__(self, seed: Any = None, bufferSize: int = 0) -> None:
+        if bufferSize and np is None:
+            raise RuntimeError("Buffered random streams require numpy. Install it with 'pip install numpy'.")
+        self.generator = random.Random(seed)
+        self.bufferSize = bufferSize
+        # Unbuffered, random() is the generator's own method and costs nothing extra.
+        self.random = self._nextBuffered if bufferSize else self.generator.random
+        # Copy of the generator from before the current block, so the stream can be saved as state + position.
+        self._blockStart: random.Random | None = None
+        self._values = np.empty(0) if bufferSize else None
+        self._floats: list[float] = []
+        self._position = 0
+
+    def randint(self, a: int, b: int) -> int:
+        self._checkUnbuffered()
+        return self.generator.randint(a, b)
+
+    def choice(self, sequence: Any) -> Any:
+        self._checkUnbuffered()
+        return self.generator.choice(sequence)
+
+    def take(self, count: int) -> "np.ndarray":
+        """The next count draws of random() as a float64 array."""
+        if np is None:
+            raise RuntimeError("Bulk random draws require numpy. Install it with 'pip install numpy'.")
+        if not self.bufferSize:
+            generator = self.generator
+            return np.fromiter([generator.random() for _ in range(count)], np.float64, count)
+
+        position = self._position
+        remaining = len(self._floats) - position
+        if count <= remaining:
+            self._position = position + count
+            return self._values[position:position + count]
+        head = self._values[position:]
+        self._fill(max(self.bufferSize, count - remaining))
+        self._position = count - remaining
+        return np.concatenate((head, self._values[:self._position]))
+
+    def getState(self) -> tuple[Any, int, int]:
+        """(generator state a block was generated from, block size, position in it); the state alone when unbuffered."""
+        if self._blockStart is None:
+            return self.generator.getstate(), 0, 0
+        return self._blockStart.getstate(), len(self._floats), self._position
+
+    def setState(self, state: tuple[Any, int, int]) -> None:
+        generatorState, blockSize, position = state
+        self.generator.setstate(generatorState)
+        if not self.bufferSize:
+            # Skips the draws of the block that were already served (two words each).
+            if position:
+                self.generator.getrandbits(64 * position)
+            return
+        self._fill(blockSize)
+        self._position = position
+
+    def copy(self) -> "RandomStream":
+        stream = RandomStream(0, self.bufferSize)
+        stream.setState(self.getState())
+        return stream
+
+    def _nextBuffered(self) -> float:
+        position = self._position
+        if position == len(self._floats):
+            self._fill(self.bufferSize)
+            position = 0
+        self._position = position + 1
+        return self._floats[position]
+
+    def _fill(self, blockSize: int) -> None:
+        if self._blockStart is None:
+            self._blockStart = random.Random(0)
+        self._blockStart.setstate(self.generator.getstate())
+        words = np.frombuffer(self.generator.getrandbits(64 * blockSize).to_bytes(8 * blockSize, "little"), np.uint32) \
+            if blockSize else np.empty(0, np.uint32)
+        self._values = ((words[0::2] >> 5) * HIGH_WORD_SCALE + (words[1::2] >> 6)) * FLOAT_SCALE
+        self._floats = self._values.tolist()
+        self._position = 0
+
+    def _checkUnbuffered(self) -> None:
+        if self.bufferSize:
+            raise RuntimeError("A buffered stream only serves random() and take().")
+
+
+class RandomStreams:
+    """
+    The independent random streams of one match, so matches in one process
+    neither disturb nor correlate with each other: `spawn` places enemy
+    waves and crates, `movement` makes enemies drift and `loot` picks the
+    pickup in a crate. Each stream is seeded from the match seed and its
+    name (None seeds them from the OS).
+    """
+    __slots__ = ["seed", "spawn", "movement", "loot"]
+
+    def __init__(self, seed: int | None = None, movementBufferSize: int = 0) -> None:
+        self.seed = seed
+        self.spawn = RandomStream(self._getStreamSeed("spawn"))
+        self.movement = RandomStream(self._getStreamSeed("movement"), movementBufferSize)
+        self.loot = RandomStream(self._getStreamSeed("loot"))
+
+    def _getStreamSeed(self, name: str) -> str | None:
+        # String seeds are hashed with SHA-512, so the streams of a match are unrelated yet stable across runs.
+        return None if self.seed is None else f"{name}:{self.seed}"
+
+    @property
+    def streams(self) -> tuple[RandomStream, ...]:
+        return self.spawn, self.movement, self.loot
+
+    def getState(self) -> tuple[tuple[Any, int, int], ...]:
+        return tuple(stream.getState() for stream in self.streams)
+
+    def setState(self, state: tuple[tuple[Any, int, int], ...]) -> None:
+        for stream, streamState in zip(self.streams, state, strict=True):
+            stream.setState(streamState)
+
+    def copy(self) -> "RandomStreams":
+        streams = RandomStreams.__new__(RandomStreams)
+        streams.seed = self.seed
+        streams.spawn, streams.movement, streams.loot = (stream.copy() for stream in self.streams)
+        return streams
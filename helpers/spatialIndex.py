@@ -0,0 +1,133 @@
+from typing import Final, Iterable
+from data.enums.entity import Entity
+from helpers.location import Location
+from units.unit import Unit
+
+
+class SpatialIndex:
+    """
+    Uniform spatial hash of the units on the field: square buckets of
+    BUCKET_SIZE x BUCKET_SIZE cells, each holding the units inside it in
+    insertion order. Unlike Grid, a cell can hold any number of units. Adds
+    and removes are O(1), and most moves cost nothing beyond two divisions
+    because the unit stays in its bucket. Rectangle, radius, column and cell
+    queries only look at the buckets they overlap, so they cost time
+    proportional to the units near the query, not to all the units alive.
+
+    A unit is filed under unit.location, so move must be called before the
+    unit's location changes.
+    """
+    BUCKET_SIZE: Final[int] = 4
+
+    __slots__ = ["width", "height", "_bucketColumns", "_buckets", "_count"]
+
+    def __init__(self, gridSize: tuple[int, int]) -> None:
+        self.width, self.height = gridSize
+        self._bucketColumns = -(-self.width // self.BUCKET_SIZE)
+        self.clear()
+
+    def clear(self) -> None:
+        bucketRows = -(-self.height // self.BUCKET_SIZE)
+        # Buckets are created the first time a unit enters them.
+        self._buckets: list[dict[Unit, None] | None] = [None] * (self._bucketColumns * bucketRows)
+        self._count = 0
+
+    def isLocationInField(self, location: Location) -> bool:
+        return 0 <= location.x < self.width and 0 <= location.y < self.height
+
+    def _checkLocation(self, location: Location) -> None:
+        if not self.isLocationInField(location):
+            raise ValueError(f"Location ({location.x}, {location.y}) is outside the {self.width}x{self.height} field.")
+
+    def _getBucketIndex(self, location: Location) -> int:
+        size = self.BUCKET_SIZE
+        return location.y // size * self._bucketColumns + location.x // size
+
+    def _getBucket(self, location: Location) -> dict[Unit, None]:
+        return self._buckets[self._getBucketIndex(location)] or {}
+
+    def _getOrCreateBucket(self, bucketIndex: int) -> dict[Unit, None]:
+        bucket = self._buckets[bucketIndex]
+        if bucket is None:
+            bucket = self._buckets[bucketIndex] = {}
+        return bucket
+
+    def add(self, unit: Unit) -> None:
+        self._checkLocation(unit.location)
+        bucket = self._getOrCreateBucket(self._getBucketIndex(unit.location))
+        if unit in bucket:
+            raise ValueError(f"Unit {unit.unitId} is already indexed.")
+        bucket[unit] = None
+        self._count += 1
+
+    def remove(self, unit: Unit) -> bool:
+        """Returns False if the unit was not indexed."""
+        self._checkLocation(unit.location)
+        bucket = self._getBucket(unit.location)
+        if unit not in bucket:
+            return False
+        del bucket[unit]
+        self._count -= 1
+        return True
+
+    def move(self, unit: Unit, location: Location) -> None:
+        """Files an indexed unit under the location it is about to move to; units that are not indexed are ignored."""
+        self._checkLocation(location)
+        if not self.isLocationInField(unit.location): return
+        bucketIndex = self._getBucketIndex(unit.location)
+        targetIndex = self._getBucketIndex(location)
+        if targetIndex == bucketIndex: return
+        bucket = self._buckets[bucketIndex]
+        if bucket is None or unit not in bucket: return
+        del bucket[unit]
+        self._getOrCreateBucket(targetIndex)[unit] = None
+
+    def getUnitsAt(self, location: Location) -> list[Unit]:
+        if not self.isLocationInField(location):
+            return []
+        return [unit for unit in self._getBucket(location) if unit.location is location]
+
+    def queryRect(self, left: int, top: int, right: int, bottom: int, entityType: Entity | None = None) -> list[Unit]:
+        """Units with left <= x <= right and top <= y <= bottom, optionally of one entity type only."""
+        left, top = max(left, 0), max(top, 0)
+        right, bottom = min(right, self.width - 1), min(bottom, self.height - 1)
+        if left > right or top > bottom:
+            return []
+
+        size, bucketColumns, buckets = self.BUCKET_SIZE, self._bucketColumns, self._buckets
+        units: list[Unit] = []
+        for bucketRow in range(top // size, bottom // size + 1):
+            for bucketIndex in range(bucketRow * bucketColumns + left // size, bucketRow * bucketColumns + right // size + 1):
+                for unit in buckets[bucketIndex] or ():
+                    location = unit.location
+                    if left <= location.x <= right and top <= location.y <= bottom and (entityType is None or unit.entityType is entityType):
+                        units.append(unit)
+        return units
+
+    def queryRadius(self, center: Location, radius: float, entityType: Entity | None = None) -> list[Unit]:
+        """Units within Euclidean distance radius of center, optionally of one entity type only."""
+        reach = int(radius)
+        radiusSquared = radius * radius
+        cx, cy = center.x, center.y
+        return [
+            unit for unit in self.queryRect(cx - reach, cy - reach, cx + reach, cy + reach, entityType)
+            if (unit.location.x - cx) ** 2 + (unit.location.y - cy) ** 2 <= radiusSquared
+        ]
+
+    def queryColumn(self, x: int, top: int = 0, bottom: int | None = None, entityType: Entity | None = None) -> list[Unit]:
+        """Units in column x between rows top and bottom, nearest to the top first."""
+        units = self.queryRect(x, top, x, self.height - 1 if bottom is None else bottom, entityType)
+        units.sort(key=lambda unit: unit.location.y)
+        return units
+
+    def rebuild(self, units: Iterable[Unit]) -> None:
+        self.clear()
+        for unit in units:
+            self.add(unit)
+
+    def __contains__(self, unit: object) -> bool:
+        location = getattr(unit, "location", None)
+        return location is not None and self.isLocationInField(location) and unit in self._getBucket(location)
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+from typing import Final
+from pygame import Surface
+from pygame.font import Font
+from colors import COLOR_TYPE
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed by (font, text, color, antialias),
+    so a string that did not change between frames is rasterized only once.
+    Cached surfaces are shared: blit them, never draw on them.
+    """
+    DEFAULT_CAPACITY: Final[int] = 512
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = capacity
+        self.hits: int = 0
+        self.misses: int = 0
+        self._surfaces: OrderedDict[tuple[Font, str, COLOR_TYPE, bool], Surface] = OrderedDict()
+
+    def render(self, font: Font, text: str, color: COLOR_TYPE, antialias: bool = True) -> Surface:
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
+textCache: Final[TextCache] = TextCache()
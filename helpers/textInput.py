@@ -1,5 +1,6 @@
 import pygame
 from colors import LIGHT_COLOR
+from helpers.textCache import textCache
 
 class TextInput:
     def __init__(self, position: tuple[int, int], value: str, placeholder: str, font: pygame.font.Font, **options):
@@ -10,7 +11,7 @@ class TextInput:
         self.image = options.get("image", None)
         self.baseColor = options.get("baseColor", LIGHT_COLOR)
 
-        self.label = self.font.render(self.value if self.value else self.placeholder, True, self.baseColor)
+        self.label = textCache.render(self.font, self.value if self.value else self.placeholder, self.baseColor)
         if self.image is None:
             self.image = self.label
 
@@ -31,7 +32,7 @@ class TextInput:
             self.value += character
 
         display_text = self.value if self.value else self.placeholder
-        self.label = self.font.render(display_text, True, self.baseColor)
+        self.label = textCache.render(self.font, display_text, self.baseColor)
         self.labelRect = self.label.get_rect(center=(self.position[0], self.position[1]))
 
     def isEmpty(self) -> bool:
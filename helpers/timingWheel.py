@@ -0,0 +1,49 @@
+from typing import Final, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TimingWheel(Generic[T]):
+    """
+    Schedules items for future ticks in O(1). Ticks within `size` of the
+    current tick live in a ring of buckets; later ones wait in an overflow
+    table keyed by tick. advance must be called once per tick and returns
+    the items due on the new tick in the order they were scheduled. Items
+    cannot be cancelled: owners skip the entries they no longer want.
+    """
+    DEFAULT_SIZE: Final[int] = 64
+
+    __slots__ = ["currentTick", "_buckets", "_mask", "_overflow"]
+
+    def __init__(self, currentTick: int = 0, size: int = DEFAULT_SIZE) -> None:
+        if size & (size - 1):
+            raise ValueError(f"Timing wheel size must be a power of two, got {size}")
+        self.currentTick = currentTick
+        self._buckets: list[list[T]] = [[] for _ in range(size)]
+        self._mask = size - 1
+        self._overflow: dict[int, list[T]] = {}
+
+    def schedule(self, tick: int, item: T) -> None:
+        if tick <= self.currentTick:
+            raise ValueError(f"Cannot schedule for tick {tick}, the wheel is already at tick {self.currentTick}")
+        if tick - self.currentTick <= self._mask:
+            self._buckets[tick & self._mask].append(item)
+        else:
+            self._overflow.setdefault(tick, []).append(item)
+
+    def advance(self) -> list[T]:
+        """Moves to the next tick and returns its items. The list must not be modified."""
+        self.currentTick += 1
+        index = self.currentTick & self._mask
+        due = self._buckets[index]
+        if due:
+            self._buckets[index] = []
+        # Overflow entries were scheduled before any bucket entry of the same tick could be.
+        overflow = self._overflow.pop(self.currentTick, None)
+        if overflow is not None:
+            overflow.extend(due)
+            return overflow
+        return due
+
+    def __len__(self) -> int:
+        return sum(map(len, self._buckets)) + sum(map(len, self._overflow.values()))
@@ -0,0 +1,33 @@
+def writeVarint(buffer: bytearray, value: int) -> None:
+    """Appends a non-negative integer as LEB128: 7 bits per byte, high bit set on all but the last byte."""
+    if value < 0:
+        raise ValueError(f"Varints are unsigned, got {value}")
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def readVarint(data: bytes | memoryview, offset: int) -> tuple[int, int]:
+    """Decodes the varint at offset. Returns the value and the offset just past it."""
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+
+def zigzagEncode(value: int) -> int:
+    """Maps signed to unsigned integers so small magnitudes stay small: 0, -1, 1, -2 -> 0, 1, 2, 3."""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def zigzagDecode(value: int) -> int:
+    return value >> 1 if value & 1 == 0 else -(value >> 1) - 1
@@ -1,10 +1,16 @@
 import datetime
-import random
-import time
+import math
 
 from typing import TYPE_CHECKING, Final, Iterator
+from helpers.clock import TickClock
+from helpers.entityRegistry import EntityRegistry, EntityView
+from helpers.frameProfiler import FrameProfiler
 from helpers.grid import Grid
 from helpers.location import Location
+from helpers.notificationManager import NotificationManager
+from helpers.randomStreams import RandomStreams
+from helpers.spatialIndex import SpatialIndex
+from helpers.timingWheel import TimingWheel
 from repositories.scoreRepository import ScoreRepository
 from data.score import Score
 from units.unit import Unit
@@ -12,9 +18,13 @@ from units.enemy import Enemy
 from units.bullet import Bullet
 from units.pickups.crate import Crate
 from units.pickups.pickup import Pickup
+from units.unitPool import UnitPool
 from data.enums.direction import Direction
 from data.enums.entity import Entity
 
+from logic.moveSchedule import MoveSchedule
+from logic.vectorizedMovement import VectorizedMovement
+
 if TYPE_CHECKING:
     from units.player import Player
 
@@ -24,152 +34,299 @@ class Game:
     ENEMY_SPAWN_INTERVAL_DECREMENT: Final[float] = 0.04
     MIN_ENEMY_SPAWN_INTERVAL: Final[float] = 0.5
     MAX_NUMBER_OF_ENEMIES_TO_SPAWN: Final[int] = 4
+    CRATE_SPAWN_CHANCE: Final[float] = 0.0025
+    # x offsets from the wave anchor, tried in order until the wave is complete.
+    ENEMY_SPAWN_OFFSETS: Final[tuple[int, ...]] = (-7, -5, -3, -1, 0, 1, 3, 5, 7)
+
+    # Draws buffered at once for the movement stream of the NumPy engine, which takes one per enemy move in bulk.
+    MOVEMENT_RANDOM_BUFFER_SIZE: Final[int] = 512
+
+    # Units of these types are recycled instead of dropped when they leave the game.
+    POOLED_UNIT_TYPES: Final[tuple[type, ...]] = (Bullet, Enemy, Crate)
 
     SCORE_INCREMENT: Final[int] = 20
     EXTRA_SCORE_INCREMENT: Final[int] = 100
     SCORE_REWARD_FRAMES_INTERVAL: Final[int] = 30
 
-    __slots__ = ["player", "gridSize", "_grid", "_enemies", "_bullets", "_crates", "_pickups", "_gameStatus", "_notifications", "startTime", "gameDurationInSeconds", "_enemySpawnInterval", "_lastEnemySpawnTime", "_frameCounter"]
+    READY_TO_FIRE_NOTIFICATION: Final[str] = "Ready to fire"
+    RELOADING_NOTIFICATION: Final[str] = "Reloading"
+
+    # Events on the timer wheel.
+    FIRE_READY_EVENT: Final[str] = "fireReady"
+
+    __slots__ = ["player", "gridSize", "_grid", "_spatialIndex", "_entities", "_enemies", "_bullets", "_crates", "_gameStatus", "_notifications", "clock", "startTime", "gameDurationInSeconds", "_enemySpawnInterval", "_lastEnemySpawnTime", "_nextEnemySpawnTick", "_frameCounter", "_enemiesKilled", "_timers", "_moveSchedules", "_vectorizedMovement", "_pools", "random", "profiler"]
 
-    def __init__(self, player: "Player", gridSize: tuple[int, int], gameDurationInSeconds: int):
+    def __init__(self, player: "Player", gridSize: tuple[int, int], gameDurationInSeconds: int, clock: TickClock | None = None, vectorized: bool = False, seed: int | None = None):
         self.player = player
         self.gridSize = gridSize
+        # Timers count ticks, so game time has to advance in fixed steps.
+        self.clock: TickClock = clock if clock is not None else TickClock()
+        self.player.attachClock(self.clock)
 
         self._grid: Grid = Grid(gridSize, self)
         # self.initializeGrid()
+        # Registered units and the player by location, for area and proximity queries.
+        self._spatialIndex = SpatialIndex(gridSize)
+        self._spatialIndex.add(player)
 
-        self._enemies: list[Enemy] = []
-        self._bullets: list[Bullet] = []
-        self._crates: list[Crate] = []
-        self._pickups: list[Pickup] = []
+        self._entities = EntityRegistry()
+        self._enemies: EntityView = self._entities.view(Entity.ENEMY)
+        self._bullets: EntityView = self._entities.view(Entity.BULLET)
+        self._crates: EntityView = self._entities.view(Entity.CRATE)
 
         self._gameStatus: str = "Running"
-        self._notifications: list[dict] = []
-        self.startTime = time.time()
+        self._notifications = NotificationManager()
+        self.startTime = self.clock.now()
         self.gameDurationInSeconds = gameDurationInSeconds
 
-        self._enemySpawnInterval = 8.0
-        self._lastEnemySpawnTime = time.time()
         self._frameCounter = 0
+        self._enemiesKilled = 0
+        self._pools = self._createPools()
+        # Every random draw of the match comes from these streams (see helpers.randomStreams).
+        self.random = RandomStreams(seed, self.MOVEMENT_RANDOM_BUFFER_SIZE if vectorized else 0)
+
+        self._attachMovement(vectorized)
+        # Game events (the end of the fire cooldown) wait here for the tick they are due on.
+        self._timers: TimingWheel[str] = TimingWheel(self.clock.ticks)
+        self.setEnemySpawnTimer(8.0)
+        self._startFireCooldown()
+        # When set, update charges each of its phases to the profiler's current frame.
+        self.profiler: FrameProfiler | None = None
 
     @property
     def grid(self) -> Iterator[list]:
         return self._grid.grid
 
+    @property
+    def occupancyGrid(self) -> Grid:
+        return self._grid
+
+    @property
+    def spatialIndex(self) -> SpatialIndex:
+        return self._spatialIndex
+
+    @property
+    def entities(self) -> EntityRegistry:
+        return self._entities
+
+    @property
+    def enemies(self) -> EntityView:
+        return self._enemies
+
+    @property
+    def enemiesKilled(self) -> int:
+        return self._enemiesKilled
+
     @property
     def gameStatus(self) -> str:
         return self._gameStatus
 
     @property
-    def notifications(self) -> list[str]:
-        return [
-            n["text"] 
-            for n in self._notifications 
-            if n["expiresAt"] > time.time()
-        ]
+    def notifications(self) -> tuple[str, ...]:
+        return self._notifications.texts
+
+    @property
+    def notificationsVersion(self) -> int:
+        """Changes whenever the notifications shown change."""
+        return self._notifications.version
+
+    def _attachMovement(self, vectorized: bool) -> None:
+        # Optional NumPy structure-of-arrays movement engine for high-density matches;
+        # otherwise every view wakes only the units that move on a pass.
+        self._vectorizedMovement: VectorizedMovement | None = VectorizedMovement(self) if vectorized else None
+        self._moveSchedules: dict[Entity, MoveSchedule] | None = None if vectorized else {
+            entityType: MoveSchedule(view, self.clock.tickRate) for entityType, view in ((Entity.BULLET, self._bullets), (Entity.ENEMY, self._enemies), (Entity.CRATE, self._crates))
+        }
+
+    def rebuildDerivedState(self, vectorized: bool) -> None:
+        """
+        Rebuilds the movement engine, the spatial index, the timers and the
+        next enemy spawn tick from the game state, after it was assembled by
+        clone or a snapshot. Frame counters of the units must be up to date.
+        """
+        self._attachMovement(vectorized)
+        self._spatialIndex = SpatialIndex(self.gridSize)
+        self._spatialIndex.rebuild([self.player, *self._entities])
+        self._timers = TimingWheel(self.clock.ticks)
+        if not self.player.canFire():
+            self._scheduleFireReady()
+        self.setEnemySpawnTimer(self._enemySpawnInterval, self._lastEnemySpawnTime)
+
+    def syncFrameCounters(self) -> None:
+        """Writes the move cadence held by the movement engine back to the units' _frameCounter."""
+        if self._vectorizedMovement is not None:
+            self._vectorizedMovement.syncFrameCounters()
+        else:
+            for schedule in self._moveSchedules.values():
+                schedule.syncFrameCounters()
+
+    def clone(self) -> "Game":
+        """
+        Independent copy of the match for rollouts and search. Every unit is
+        copied once (shallowly); immutable data - walls, locations, pickups
+        in the inventory - is shared with the original.
+        The clone has no profiler and continues the random streams of the
+        original from where they are, independently of it.
+        """
+        self.syncFrameCounters()
+
+        game = Game.__new__(type(self))
+        clones: dict[Unit, Unit] = {unit: unit.copy() for unit in self._entities}
+        game.player = clones[self.player] = self.player.copy()
+        game.gridSize = self.gridSize
+        game.clock = game.player.clock = self.clock.copy()
+
+        game._grid = self._grid.copy(game, clones)
+        game._entities = self._entities.copy(clones)
+        game._enemies = game._entities.view(Entity.ENEMY)
+        game._bullets = game._entities.view(Entity.BULLET)
+        game._crates = game._entities.view(Entity.CRATE)
+
+        game._gameStatus = self._gameStatus
+        game._notifications = self._notifications.copy()
+        game.startTime = self.startTime
+        game.gameDurationInSeconds = self.gameDurationInSeconds
+        game._enemySpawnInterval = self._enemySpawnInterval
+        game._lastEnemySpawnTime = self._lastEnemySpawnTime
+        game._frameCounter = self._frameCounter
+        game._enemiesKilled = self._enemiesKilled
+        game._pools = self._createPools()
+        game.random = self.random.copy()
+        game.rebuildDerivedState(self._vectorizedMovement is not None)
+        game.profiler = None
+        return game
+
+    def getEntityCounts(self) -> dict[str, int]:
+        return {
+            "enemies": len(self._enemies),
+            "bullets": len(self._bullets),
+            "crates": len(self._crates),
+            "entities": len(self._entities),
+            # Pooled units constructed since the start, i.e. not served from a pool.
+            "allocations": sum(pool.allocations for pool in self._pools.values()),
+        }
 
     def getTimeLeft(self) -> float:
-        return self.startTime + self.gameDurationInSeconds - time.time()
+        return self.startTime + self.gameDurationInSeconds - self.clock.now()
 
     def isGameOver(self) -> bool:
         if self.player.health <= 0:
             self._gameStatus = "Game Over"
             self.addNotification("Game Over", 999)
             return True
-        elif time.time() - self.startTime > self.gameDurationInSeconds:
+        elif self.clock.now() - self.startTime > self.gameDurationInSeconds:
             self._gameStatus = "Victory"
             self.addNotification("Victory!", 999)
             return True
         return False
 
     def addNotification(self, text: str, duration: float = 1.5) -> None:
-        if any(n["text"] == text and n["expiresAt"] > time.time() for n in self._notifications):
-            return
-        self._notifications.append({
-            "text": text,
-            "expiresAt": time.time() + duration
-        })
+        self._notifications.add(text, self.clock.now() + duration)
+
+    def _startFireCooldown(self) -> None:
+        self._notifications.remove(self.READY_TO_FIRE_NOTIFICATION)
+        self.addNotification(self.RELOADING_NOTIFICATION, math.inf)
+        self._scheduleFireReady()
+
+    def _scheduleFireReady(self) -> None:
+        player = self.player
+        tick = self.clock.getFirstTickWhere(player.canFireAt, player.lastFireTime + player.FIRE_COOLDOWN)
+        self._timers.schedule(tick, self.FIRE_READY_EVENT)
+
+    def _runTimers(self) -> None:
+        for event in self._timers.advance():
+            match event:
+                case self.FIRE_READY_EVENT:
+                    self._notifications.remove(self.RELOADING_NOTIFICATION)
+                    self.addNotification(self.READY_TO_FIRE_NOTIFICATION, math.inf)
+
+    def _createPools(self) -> dict[type, UnitPool]:
+        return {unitType: UnitPool(unitType) for unitType in self.POOLED_UNIT_TYPES}
+
+    def createUnit(self, unitType: type, *arguments) -> Unit:
+        """unitType(*arguments), recycling a unit that left the game if unitType is pooled."""
+        pool = self._pools.get(unitType)
+        return unitType(*arguments) if pool is None else pool.acquire(*arguments)
+
+    def placeUnit(self, unit: Unit) -> None:
+        """Registers a new unit and puts it on the field at its location."""
+        self._entities.add(unit)
+        self._grid.setOccupyingUnit(unit.location, unit)
+        self._spatialIndex.add(unit)
 
     def _updateUnitPosition(self, unit: Unit, nextLocation: Location) -> None:
+        self._spatialIndex.move(unit, nextLocation)
+        self._grid.moveUnit(unit, nextLocation)
+    
+    def _removeUnit(self, unit: Unit) -> bool:
+        """
+        Takes a unit off the field and out of the registry without any death effects.
+        Returns False if the unit had already been removed.
+        """
         currentOccupant = self._grid.getOccupyingUnit(unit.location)
         if currentOccupant == unit:
             self._grid.setOccupyingUnit(unit.location, self.EMPTY_CELL_SYMBOL)
-        unit.location = nextLocation
-        self._grid.setOccupyingUnit(nextLocation, unit)
-    
+        if not self._entities.remove(unit):
+            return False
+        self._spatialIndex.remove(unit)
+        pool = self._pools.get(type(unit))
+        if pool is not None:
+            pool.release(unit)
+        return True
+
     def killUnit(self, unit: Unit, spawnPickup: bool = True) -> None:
         """
         Permanently removes a unit from the game.
-        Handles list removal, grid clearing, and death effects (like Crate drops).
+        Handles registry removal, grid clearing, and death effects (like Crate drops).
+        Killing a unit that is already dead does nothing.
         """
-        currentOccupant = self._grid.getOccupyingUnit(unit.location)
-        if currentOccupant == unit:
-            self._grid.setOccupyingUnit(unit.location, self.EMPTY_CELL_SYMBOL)
-        
+        if not self._removeUnit(unit): return
+
         match unit.entityType:
             case Entity.ENEMY:
-                if unit in self._enemies:
-                    self._enemies.remove(unit)
-            case Entity.BULLET:
-                if unit in self._bullets:
-                    self._bullets.remove(unit)
+                self._enemiesKilled += 1
             case Entity.CRATE:
-                if unit in self._crates:
-                    self._crates.remove(unit)
                 if not spawnPickup: return
-                
-                pickup: Pickup = unit.spawnPickup()
-                self._pickups.append(pickup)
-                self._grid.setOccupyingUnit(pickup.location, pickup)
-        # if isinstance(unit, Enemy):
-            
-        # elif isinstance(unit, Bullet):
-            
-        # elif isinstance(unit, Pickup):
-        #     if unit in self._pickups:
-        #         self._pickups.remove(unit)
-        # elif isinstance(unit, Crate):
-        # if unit in self._crates:
-        #             self._crates.remove(unit)
-        #         if not spawnPickup: return
-                
-        #         pickup: Pickup = unit.spawnPickup()
-        #         self._pickups.append(pickup)
-        #         self._grid.setOccupyingUnit(pickup.location, pickup)
-        
+
+                self.placeUnit(unit.spawnPickup())
+
     def moveEnemies(self):
-        enemiesToRemove = []
-        for enemy in self._enemies:
-            if not enemy.shouldMove():
-                continue
-            if not enemy.isAlive():
-                enemiesToRemove.append(enemy)
-                continue
-
-            targetLocation = enemy.getNextLocation()
-            if self._grid.isLocationAtLowerBorder(targetLocation):
-                self.addNotification("Enemy reached the base", 3)
-                enemiesToRemove.append(enemy)
-                self.player.takeDamage(1)
-                continue
-            if not self._grid.isLocationValid(targetLocation):
-                continue
-            
-            targetUnit = self._grid.getOccupyingUnit(targetLocation)
-            if targetUnit and hasattr(targetUnit, "onHitByEnemy"):
-                canMoveIn: bool = targetUnit.onHitByEnemy(enemy, self)
-                if canMoveIn:
-                    self._updateUnitPosition(enemy, targetLocation)
-            else:
-                self._updateUnitPosition(enemy, targetLocation)
+        if self._vectorizedMovement is not None:
+            with self._enemies.holdSlots():
+                self._vectorizedMovement.moveEnemies()
+            return
+
+        movers = self._moveSchedules[Entity.ENEMY].popMovers()
+        if not movers: return
+        with self._enemies.holdSlots():
+            for enemy in movers:
+                if enemy not in self._enemies:
+                    continue
+                if not enemy.isAlive():
+                    self._removeUnit(enemy)
+                    continue
+                self._advanceEnemy(enemy, enemy.getNextLocation(chance=self.random.movement.random()))
+
+    def _advanceEnemy(self, enemy: Enemy, targetLocation: Location) -> None:
+        if self._grid.isLocationAtLowerBorder(targetLocation):
+            self.addNotification("Enemy reached the base", 3)
+            self._removeUnit(enemy)
+            self.player.takeDamage(1)
+            return
+        if not self._grid.isLocationValid(targetLocation):
+            return
 
-        for enemy in enemiesToRemove:
-            if enemy in self._enemies:
-                self._enemies.remove(enemy)
-            self._grid.setOccupyingUnit(enemy.location, self.EMPTY_CELL_SYMBOL)
+        targetUnit = self._grid.getOccupyingUnit(targetLocation)
+        if targetUnit and hasattr(targetUnit, "onHitByEnemy"):
+            canMoveIn: bool = targetUnit.onHitByEnemy(enemy, self)
+            if canMoveIn:
+                self._updateUnitPosition(enemy, targetLocation)
+        else:
+            self._updateUnitPosition(enemy, targetLocation)
 
     def handlePickupCollection(self, pickup: Pickup) -> None:
-        self._pickups.remove(pickup)
+        self._entities.remove(pickup)
+        self._spatialIndex.remove(pickup)
         if self.player.isInventoryFull():
             self.addNotification(f"Can't add {pickup.name}. The inventory is full.")
             return
@@ -193,78 +350,92 @@ class Game:
             self._updateUnitPosition(self.player, nextLocation)
 
     def moveBullets(self) -> None:
-        bulletsToRemove = []
-        for bullet in self._bullets:
-            if not bullet.shouldMove(): 
-                continue
-
-            targetLocation = bullet.getNextLocation()
-            if not self._grid.isLocationValid(targetLocation):
-                bulletsToRemove.append(bullet)
-                continue
-            
-            targetUnit = self._grid.getOccupyingUnit(targetLocation)
-            if targetUnit and hasattr(targetUnit, 'onHitByBullet'):
-                canMoveIn: bool = targetUnit.onHitByBullet(bullet, self)
-                if canMoveIn:
-                    self._updateUnitPosition(bullet, targetLocation)
-                else:
-                    bulletsToRemove.append(bullet)
-            else:
-                self._updateUnitPosition(bullet, targetLocation)
+        if self._vectorizedMovement is not None:
+            with self._bullets.holdSlots():
+                self._vectorizedMovement.moveBullets()
+            return
 
-        for bullet in bulletsToRemove:
-            if bullet in self._bullets:
-                self._bullets.remove(bullet)
-            self._grid.setOccupyingUnit(bullet.location, self.EMPTY_CELL_SYMBOL)
+        movers = self._moveSchedules[Entity.BULLET].popMovers()
+        if not movers: return
+        with self._bullets.holdSlots():
+            for bullet in movers:
+                if bullet not in self._bullets:
+                    continue
+                self._advanceBullet(bullet, bullet.getNextLocation())
+
+    def _advanceBullet(self, bullet: Bullet, targetLocation: Location) -> None:
+        if not self._grid.isLocationValid(targetLocation):
+            self._removeUnit(bullet)
+            return
 
-    def moveCrates(self) -> None:
-        cratesToRemove = []
-
-        for crate in self._crates:
-            if not crate.shouldMove(): continue
-            if not crate.isAlive():
-                pickup: Pickup = crate.spawnPickup()
-                self._pickups.append(pickup)
-                self._grid.setOccupyingUnit(pickup.location, pickup)
-                cratesToRemove.append(crate)
-                crate.remove()
-                continue
-
-            targetLocation = crate.getNextLocation()
-            if self._grid.isLocationAtLowerBorder(targetLocation) or not self._grid.isLocationValid(targetLocation):
-                cratesToRemove.append(crate)
-                continue
-
-            targetUnit = self._grid.getOccupyingUnit(targetLocation)
-            if targetUnit and hasattr(targetUnit, "onHitByCrate"):
-                canMoveIn: bool = targetUnit.onHitByCrate(crate, self)
-                if canMoveIn:
-                    self._updateUnitPosition(crate, targetLocation)
+        targetUnit = self._grid.getOccupyingUnit(targetLocation)
+        if targetUnit and hasattr(targetUnit, 'onHitByBullet'):
+            canMoveIn: bool = targetUnit.onHitByBullet(bullet, self)
+            if canMoveIn:
+                self._updateUnitPosition(bullet, targetLocation)
             else:
-                self._updateUnitPosition(crate, targetLocation)
+                self._removeUnit(bullet)
+        else:
+            self._updateUnitPosition(bullet, targetLocation)
+
+    def moveCrates(self) -> None:
+        if self._vectorizedMovement is not None:
+            with self._crates.holdSlots():
+                self._vectorizedMovement.moveCrates()
+            return
+
+        movers = self._moveSchedules[Entity.CRATE].popMovers()
+        if not movers: return
+        with self._crates.holdSlots():
+            for crate in movers:
+                if crate not in self._crates: continue
+                if not crate.isAlive():
+                    self.killUnit(crate)
+                    continue
+                self._advanceCrate(crate, crate.getNextLocation())
+
+    def _advanceCrate(self, crate: Crate, targetLocation: Location) -> None:
+        if self._grid.isLocationAtLowerBorder(targetLocation) or not self._grid.isLocationValid(targetLocation):
+            self._removeUnit(crate)
+            return
 
-        for crate in cratesToRemove:
-            if crate in self._crates:
-                self._crates.remove(crate)
-            if not crate.isRemoved:
-                self._grid.setOccupyingUnit(crate.location, self.EMPTY_CELL_SYMBOL)
+        targetUnit = self._grid.getOccupyingUnit(targetLocation)
+        if targetUnit and hasattr(targetUnit, "onHitByCrate"):
+            canMoveIn: bool = targetUnit.onHitByCrate(crate, self)
+            # A crate destroyed by the hit must not be moved back onto the field.
+            if canMoveIn and crate in self._crates:
+                self._updateUnitPosition(crate, targetLocation)
+        else:
+            self._updateUnitPosition(crate, targetLocation)
 
     def update(self) -> None:
+        self.clock.tick()
         self._frameCounter += 1
         if self._frameCounter % self.SCORE_REWARD_FRAMES_INTERVAL == 0:
             self.player.incrementScore()
+        self._notifications.purge(self.clock.now())
+        self._runTimers()
+
+        profiler = self.profiler
+        if profiler is None:
+            self.trySpawnCrate()
+            self.trySpawnEnemies()
+            self.moveBullets()
+            self.moveEnemies()
+            self.moveCrates()
+            return
 
-        if self.player.canFire():
-            self.addNotification("Ready to fire", 1)
-        else:
-            self.addNotification("Reloading", 0.4)
-
+        profiler.lap("update")
         self.trySpawnCrate()
+        profiler.lap("trySpawnCrate")
         self.trySpawnEnemies()
+        profiler.lap("trySpawnEnemies")
         self.moveBullets()
+        profiler.lap("moveBullets")
         self.moveEnemies()
+        profiler.lap("moveEnemies")
         self.moveCrates()
+        profiler.lap("moveCrates")
 
     def spawnBullet(self) -> None:
         if not self.player.canFire(): return
@@ -275,23 +446,31 @@ class Game:
             return
 
         self.player.fire()
-        bullet = Bullet(bulletLocation)
-        self._bullets.append(bullet)
-        self._grid.setOccupyingUnit(bulletLocation, bullet)
+        self._startFireCooldown()
+        self.placeUnit(self.createUnit(Bullet, bulletLocation))
+
+    def setEnemySpawnTimer(self, interval: float, lastSpawnTime: float | None = None) -> None:
+        """Sets the time between enemy waves and, by default, restarts the wait for the next wave now."""
+        self._enemySpawnInterval = interval
+        self._lastEnemySpawnTime = lastSpawnTime = self.clock.now() if lastSpawnTime is None else lastSpawnTime
+        if math.isinf(interval):
+            self._nextEnemySpawnTick = math.inf
+            return
+        self._nextEnemySpawnTick = self.clock.getFirstTickWhere(lambda now: now - lastSpawnTime >= interval, lastSpawnTime + interval)
 
     def trySpawnEnemies(self) -> None:
-        if time.time() - self._lastEnemySpawnTime < self._enemySpawnInterval: return
-
-        self._lastEnemySpawnTime = time.time()
-        if self._enemySpawnInterval > self.MIN_ENEMY_SPAWN_INTERVAL:
-            self._enemySpawnInterval -= self.ENEMY_SPAWN_INTERVAL_DECREMENT
+        if self.clock.ticks < self._nextEnemySpawnTick: return
 
-        anchorX = random.randint(1, self.gridSize[0] - 2)
-        count = random.randint(1, self.MAX_NUMBER_OF_ENEMIES_TO_SPAWN)
-        possibleOffsets = [-7, -5, -3, -1, 0, 1, 3, 5, 7]
+        interval = self._enemySpawnInterval
+        if interval > self.MIN_ENEMY_SPAWN_INTERVAL:
+            interval -= self.ENEMY_SPAWN_INTERVAL_DECREMENT
+        self.setEnemySpawnTimer(interval)
 
+        spawnRandom = self.random.spawn
+        anchorX = spawnRandom.randint(1, self.gridSize[0] - 2)
+        count = spawnRandom.randint(1, self.MAX_NUMBER_OF_ENEMIES_TO_SPAWN)
         locations: list[Location] = []
-        for offset in possibleOffsets:
+        for offset in self.ENEMY_SPAWN_OFFSETS:
             x: int = anchorX + offset
             currentLocation = Location(x, 1)
 
@@ -300,21 +479,18 @@ class Game:
             if len(locations) == count: break
 
         for location in locations:
-            enemy = Enemy(location, 4)
-            self._enemies.append(enemy)
-            self._grid.setOccupyingUnit(location, enemy)
+            self.placeUnit(self.createUnit(Enemy, location, 4))
 
     def trySpawnCrate(self):
-        if random.random() > 0.0025: return
+        spawnRandom = self.random.spawn
+        if spawnRandom.random() > self.CRATE_SPAWN_CHANCE: return
 
-        x = random.randint(1, self.gridSize[0] - 2)
+        x = spawnRandom.randint(1, self.gridSize[0] - 2)
         targetLocation = Location(x, 1)
 
         if not self._grid.isLocationValid(targetLocation) or self._grid.isBlocked(targetLocation): return
 
-        crate = Crate(targetLocation)
-        self._crates.append(crate)
-        self._grid.setOccupyingUnit(targetLocation, crate)
+        self.placeUnit(self.createUnit(Crate, targetLocation, self.random.loot.choice(Crate.PICKUP_TYPES)))
 
     def tryActivatePickup(self, pickupIndex: int) -> None:
         try:
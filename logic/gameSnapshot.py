@@ -0,0 +1,275 @@
+import json
+from typing import Any, Final
+
+from data.enums.entity import ENTITIES_BY_CODE, ENTITY_CODES, Entity
+from helpers.byteStream import ByteReader, ByteWriter
+from helpers.clock import TickClock
+from helpers.grid import GridSnapshot
+from helpers.notificationManager import NotificationManager
+from helpers.location import Location
+from logic.game import Game
+from logic.simulation import createBalancedGameType
+from units.bullet import Bullet
+from units.enemy import Enemy
+from units.pickups.crate import Crate
+from units.pickups.extraScore import ExtraScore
+from units.pickups.heart import Heart
+from units.pickups.megabomb import Megabomb
+from units.player import Player
+from units.unit import Unit
+from units.unitWithHealth import UnitWithHealth
+from units.wall import Wall
+
+# Binary snapshot of a whole Game, built from varints (helpers.byteStream):
+# header (including the match seed), game fields, notifications, the unit table (player first, then the
+# registry in registration order), the slot layout of every EntityView, the
+# occupied grid cells as references into the unit table and, optionally, the
+# state of the game's random streams. A mid-match default game is about 10 KB,
+# most of it the random state.
+MAGIC: Final[bytes] = b"SFZS"
+FORMAT_VERSION: Final[int] = 3
+
+PICKUP_TYPES: Final[dict[Entity, type]] = {Entity.HEART: Heart, Entity.EXTRA_SCORE: ExtraScore, Entity.MEGABOMB: Megabomb}
+PICKUP_ENTITIES: Final[dict[type, Entity]] = {pickupType: entity for entity, pickupType in PICKUP_TYPES.items()}
+
+# Grid cell references: 0 is a wall, n > 0 is entry n - 1 of the unit table.
+WALL_REFERENCE: Final[int] = 0
+
+
+def _writeUnit(writer: ByteWriter, unit: Unit) -> None:
+    writer.writeUnsigned(ENTITY_CODES[unit.entityType])
+    writer.writeUnsigned(unit.unitId)
+    writer.writeUnsigned(unit.location.x)
+    writer.writeUnsigned(unit.location.y)
+    writer.writeUnsigned(unit.speed)
+    writer.writeUnsigned(unit._frameCounter)
+    if isinstance(unit, UnitWithHealth):
+        writer.writeSigned(unit.health)
+
+    match unit.entityType:
+        case Entity.ENEMY:
+            writer.writeSigned(unit._damage)
+        case Entity.CRATE:
+            writer.writeUnsigned(ENTITY_CODES[PICKUP_ENTITIES[unit.pickup]])
+            writer.writeUnsigned(unit.isRemoved)
+        case Entity.PLAYER:
+            writer.writeString(unit.name)
+            writer.writeUnsigned(unit.score)
+            writer.writeSigned(unit.damage)
+            writer.writeFloat(unit.lastFireTime)
+            writer.writeUnsigned(unit.damageTaken)
+            writer.writeUnsigned(len(unit.inventory))
+            for item in unit.inventory:
+                _writeUnit(writer, item)
+
+
+def _readUnit(reader: ByteReader, clock: TickClock) -> Unit:
+    entity = ENTITIES_BY_CODE[reader.readUnsigned()]
+    unitId = reader.readUnsigned()
+    location = Location(reader.readUnsigned(), reader.readUnsigned())
+    speed = reader.readUnsigned()
+    frameCounter = reader.readUnsigned()
+
+    unit: Unit
+    match entity:
+        case Entity.PLAYER:
+            health = reader.readSigned()
+            unit = Player(reader.readString(), location, health, speed, clock=clock)
+            unit.score = reader.readUnsigned()
+            unit.damage = reader.readSigned()
+            unit.lastFireTime = reader.readFloat()
+            unit.damageTaken = reader.readUnsigned()
+            unit.inventory = [_readUnit(reader, clock) for _ in range(reader.readUnsigned())]
+        case Entity.ENEMY:
+            health = reader.readSigned()
+            unit = Enemy(location, speed, health=health, damage=reader.readSigned())
+        case Entity.CRATE:
+            health = reader.readSigned()
+            unit = Crate(location, PICKUP_TYPES[ENTITIES_BY_CODE[reader.readUnsigned()]], speed=speed, health=health)
+            if reader.readUnsigned():
+                unit.remove()
+        case Entity.BULLET:
+            unit = Bullet(location)
+        case Entity.WALL:
+            unit = Wall(location)
+        case _ if entity in PICKUP_TYPES:
+            unit = PICKUP_TYPES[entity](location)
+        case _:
+            raise ValueError(f"Unknown entity in snapshot: {entity}")
+
+    unit.unitId = unitId
+    unit.speed = speed
+    unit._frameCounter = frameCounter
+    return unit
+
+
+def _getBalance(game: Game) -> dict[str, Any]:
+    # Tuning constants overridden by a createBalancedGameType subclass.
+    return {name: value for name, value in vars(type(game)).items() if name.isupper()} if type(game) is not Game else {}
+
+
+def encodeGame(game: Game, includeRandomState: bool = True) -> bytes:
+    """
+    Serializes the complete state of a game on a TickClock. With
+    includeRandomState the game's random streams are saved as well, so the
+    restored game continues exactly like the original would have.
+    """
+    if not isinstance(game.clock, TickClock):
+        raise ValueError("Only games driven by a TickClock can be saved.")
+    game.syncFrameCounters()
+
+    writer = ByteWriter(MAGIC)
+    writer.writeUnsigned(FORMAT_VERSION)
+    writer.writeString(json.dumps(_getBalance(game)))
+    for value in (*game.gridSize, game.gameDurationInSeconds, game.clock.tickRate, game.clock.ticks):
+        writer.writeUnsigned(value)
+    writer.writeUnsigned(game._vectorizedMovement is not None)
+    writer.writeUnsigned(game.random.seed is not None)
+    if game.random.seed is not None:
+        writer.writeSigned(game.random.seed)
+    writer.writeFloat(game.startTime)
+    writer.writeString(game._gameStatus)
+    writer.writeFloat(game._enemySpawnInterval)
+    writer.writeFloat(game._lastEnemySpawnTime)
+    writer.writeUnsigned(game._frameCounter)
+    writer.writeUnsigned(game._enemiesKilled)
+
+    # Expired notifications are never shown or matched again, so they are left out.
+    now = game.clock.now()
+    notifications = [(text, expiresAt) for text, expiresAt in game._notifications.items() if expiresAt > now]
+    writer.writeUnsigned(len(notifications))
+    for text, expiresAt in notifications:
+        writer.writeString(text)
+        writer.writeFloat(expiresAt)
+
+    grid = game.occupancyGrid
+    units: list[Unit] = [game.player, *game.entities]
+    # Units still on the field after leaving the registry are kept as well.
+    knownUnits = set(units)
+    for unit in grid._units:
+        if unit is not None and unit.entityType is not Entity.WALL and unit not in knownUnits:
+            units.append(unit)
+            knownUnits.add(unit)
+    references = {unit: index + 1 for index, unit in enumerate(units)}
+
+    writer.writeUnsigned(len(units))
+    writer.writeUnsigned(len(game.entities))
+    for unit in units:
+        _writeUnit(writer, unit)
+
+    writer.writeUnsigned(game.entities.nextId)
+    writer.writeUnsigned(len(game.entities.views))
+    for entityType, view in game.entities.views.items():
+        writer.writeUnsigned(ENTITY_CODES[entityType])
+        writer.writeUnsigned(len(view.slots))
+        for unit in view.slots:
+            writer.writeUnsigned(0 if unit is None else references[unit])
+        writer.writeUnsigned(len(view.freeSlots))
+        for slot in view.freeSlots:
+            writer.writeUnsigned(slot)
+
+    occupiedCells = [(index, unit) for index, unit in enumerate(grid._units) if unit is not None]
+    writer.writeUnsigned(len(occupiedCells))
+    previousIndex = 0
+    for index, unit in occupiedCells:
+        writer.writeUnsigned(index - previousIndex)
+        writer.writeUnsigned(WALL_REFERENCE if unit.entityType is Entity.WALL else references[unit])
+        previousIndex = index
+
+    writer.writeUnsigned(includeRandomState)
+    if includeRandomState:
+        for (version, internalState, gaussNext), blockSize, position in game.random.getState():
+            writer.writeUnsigned(version)
+            writer.writeUnsigned(len(internalState))
+            for value in internalState:
+                writer.writeUnsigned(value)
+            writer.writeUnsigned(gaussNext is not None)
+            if gaussNext is not None:
+                writer.writeFloat(gaussNext)
+            writer.writeUnsigned(blockSize)
+            writer.writeUnsigned(position)
+    return writer.getBytes()
+
+
+def decodeGame(data: bytes) -> Game:
+    """
+    Rebuilds a game saved by encodeGame. Its random streams are restored if
+    they were saved, and otherwise start over from the match seed.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a game snapshot")
+    reader = ByteReader(data, len(MAGIC))
+    version = reader.readUnsigned()
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format version {version}")
+
+    balance = json.loads(reader.readString())
+    width, height, duration, tickRate, ticks = (reader.readUnsigned() for _ in range(5))
+    isVectorized = bool(reader.readUnsigned())
+    seed = reader.readSigned() if reader.readUnsigned() else None
+    startTime = reader.readFloat()
+    gameStatus = reader.readString()
+    enemySpawnInterval = reader.readFloat()
+    lastEnemySpawnTime = reader.readFloat()
+    frameCounter = reader.readUnsigned()
+    enemiesKilled = reader.readUnsigned()
+    notifications = NotificationManager()
+    for _ in range(reader.readUnsigned()):
+        notifications.add(reader.readString(), reader.readFloat())
+
+    clock = TickClock(tickRate, ticks)
+    unitCount = reader.readUnsigned()
+    registeredCount = reader.readUnsigned()
+    units = [_readUnit(reader, clock) for _ in range(unitCount)]
+    player = units[0]
+    lastFireTime = player.lastFireTime
+
+    gameType = createBalancedGameType(balance) if balance else Game
+    game = gameType(player, (width, height), duration, clock, isVectorized, seed)
+    # The constructor restarts the fire cooldown on the clock.
+    player.lastFireTime = lastFireTime
+    game.startTime = startTime
+    game._gameStatus = gameStatus
+    game._enemySpawnInterval = enemySpawnInterval
+    game._lastEnemySpawnTime = lastEnemySpawnTime
+    game._frameCounter = frameCounter
+    game._enemiesKilled = enemiesKilled
+    game._notifications = notifications
+
+    game.entities.restore(units[1:1 + registeredCount], reader.readUnsigned())
+    for _ in range(reader.readUnsigned()):
+        view = game.entities.view(ENTITIES_BY_CODE[reader.readUnsigned()])
+        slots = [reader.readUnsigned() for _ in range(reader.readUnsigned())]
+        freeSlots = [reader.readUnsigned() for _ in range(reader.readUnsigned())]
+        view.restoreSlots([units[reference - 1] if reference else None for reference in slots], freeSlots)
+
+    grid = game.occupancyGrid
+    cells: list[Unit | None] = [None] * (width * height)
+    index = 0
+    for _ in range(reader.readUnsigned()):
+        index += reader.readUnsigned()
+        reference = reader.readUnsigned()
+        cells[index] = Wall(Location(index % width, index // width)) if reference == WALL_REFERENCE else units[reference - 1]
+    codes = bytes(0 if unit is None else ENTITY_CODES[unit.entityType] for unit in cells)
+    grid.restore(GridSnapshot((width, height), codes, tuple(cells)))
+    game.rebuildDerivedState(isVectorized)
+
+    if reader.readUnsigned():
+        streamStates = []
+        for _ in game.random.streams:
+            randomVersion = reader.readUnsigned()
+            internalState = tuple(reader.readUnsigned() for _ in range(reader.readUnsigned()))
+            gaussNext = reader.readFloat() if reader.readUnsigned() else None
+            streamStates.append(((randomVersion, internalState, gaussNext), reader.readUnsigned(), reader.readUnsigned()))
+        game.random.setState(tuple(streamStates))
+    return game
+
+
+def saveGame(game: Game, path: str, includeRandomState: bool = True) -> None:
+    with open(path, "wb") as snapshotFile:
+        snapshotFile.write(encodeGame(game, includeRandomState))
+
+
+def loadGame(path: str) -> Game:
+    with open(path, "rb") as snapshotFile:
+        return decodeGame(snapshotFile.read())
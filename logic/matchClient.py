@@ -0,0 +1,91 @@
+import asyncio
+import random
+from typing import Any, Final
+
+from data.enums.direction import Direction
+from helpers.byteStream import ByteReader
+from logic.matchProtocol import (
+    ERROR_MESSAGE, GAME_OVER_MESSAGE, INPUT_MESSAGE, JOIN_MESSAGE, STATE_MESSAGE, WATCH_MESSAGE, WELCOME_MESSAGE,
+    RemoteField, createMessage, encodeMessage, readMessage,
+)
+from logic.replay import FIRE_ACTION, getMoveAction
+
+
+class StandInClient:
+    """
+    Scripted remote player for tests and load tests. It joins a match (or
+    watches one), mirrors it in a RemoteField and, as a player, answers a
+    share of the states with a random move or shot drawn from its own
+    seeded random.Random.
+    """
+    ACTIONS: Final[tuple[int, ...]] = (*(getMoveAction(direction) for direction in Direction), FIRE_ACTION, FIRE_ACTION)
+
+    def __init__(self, playerName: str = "Bot", seed: int | None = None, actionChance: float = 0.3, clientSeed: int = 0) -> None:
+        self.playerName = playerName
+        self.seed = seed
+        self.actionChance = actionChance
+        self.field: RemoteField | None = None
+        self.states: int = 0
+        self.bytesReceived: int = 0
+        self._random = random.Random(clientSeed)
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def play(self, host: str, port: int) -> dict[str, Any]:
+        """Plays one match to the end and returns how it went."""
+        join = createMessage(JOIN_MESSAGE)
+        join.writeString(self.playerName)
+        join.writeUnsigned(0 if self.seed is None else self.seed + 1)
+        return await self._run(host, port, encodeMessage(join), isPlayer=True)
+
+    async def watch(self, host: str, port: int, matchId: int) -> dict[str, Any]:
+        """Follows a running match as a spectator until it ends."""
+        watch = createMessage(WATCH_MESSAGE)
+        watch.writeUnsigned(matchId)
+        return await self._run(host, port, encodeMessage(watch), isPlayer=False)
+
+    def sendAction(self, action: int) -> None:
+        if self._writer is None:
+            raise RuntimeError("The client is not connected.")
+        message = createMessage(INPUT_MESSAGE)
+        message.writeUnsigned(action)
+        self._writer.write(encodeMessage(message))
+
+    async def _run(self, host: str, port: int, request: bytes, isPlayer: bool) -> dict[str, Any]:
+        reader, self._writer = await asyncio.open_connection(host, port)
+        self._writer.write(request)
+        try:
+            while True:
+                message = await readMessage(reader)
+                if message is None:
+                    raise ConnectionError("The server closed the connection")
+                messageType, payload = message
+                self.bytesReceived += len(payload.data)
+                if messageType == WELCOME_MESSAGE:
+                    self.field = RemoteField(payload)
+                elif messageType == STATE_MESSAGE:
+                    self._onState(payload, isPlayer)
+                elif messageType == GAME_OVER_MESSAGE:
+                    return self._getResult(payload)
+                elif messageType == ERROR_MESSAGE:
+                    raise RuntimeError(f"Server error: {payload.readString()}")
+        finally:
+            self._writer.close()
+            self._writer = None
+
+    def _onState(self, state: ByteReader, isPlayer: bool) -> None:
+        if self.field is None:
+            raise ValueError("State received before the welcome message")
+        self.field.applyState(state)
+        self.states += 1
+        if isPlayer and self._random.random() < self.actionChance:
+            self.sendAction(self._random.choice(self.ACTIONS))
+
+    def _getResult(self, gameOver: ByteReader) -> dict[str, Any]:
+        return {
+            "matchId": self.field.matchId if self.field is not None else None,
+            "status": gameOver.readString(),
+            "score": gameOver.readUnsigned(),
+            "ticks": gameOver.readUnsigned(),
+            "states": self.states,
+            "bytesReceived": self.bytesReceived,
+        }
@@ -0,0 +1,93 @@
+import asyncio
+from typing import Final
+
+from helpers.byteStream import ByteReader, ByteWriter
+from helpers.varint import writeVarint
+from logic.stateStream import StateStreamDecoder
+
+# Wire protocol of the match server. Every message is a varint payload
+# length followed by the payload, whose first varint is the message type.
+#
+# Client to server:
+#   JOIN     player name, seed + 1 (0 lets the server pick the seed)
+#   WATCH    match id, to follow a running match as a spectator
+#   INPUT    one action as encoded by logic.replay (move, fire or pickup)
+# Server to client:
+#   WELCOME  match id, seed, tick rate, grid width and height, match duration
+#   STATE    one frame of the match's state stream (logic.stateStream): a
+#            delta, or a keyframe for a view that joins or falls behind
+#   GAME_OVER  final status, score and tick
+#   ERROR    reason; the server closes the connection after it
+JOIN_MESSAGE: Final[int] = 1
+WATCH_MESSAGE: Final[int] = 2
+INPUT_MESSAGE: Final[int] = 3
+WELCOME_MESSAGE: Final[int] = 16
+STATE_MESSAGE: Final[int] = 17
+GAME_OVER_MESSAGE: Final[int] = 18
+ERROR_MESSAGE: Final[int] = 19
+
+MAX_MESSAGE_SIZE: Final[int] = 1 << 20
+
+
+def encodeMessage(writer: ByteWriter) -> bytes:
+    """Frames the payload of writer with its length."""
+    frame = bytearray()
+    writeVarint(frame, len(writer.buffer))
+    frame += writer.buffer
+    return bytes(frame)
+
+
+def createMessage(messageType: int) -> ByteWriter:
+    writer = ByteWriter()
+    writer.writeUnsigned(messageType)
+    return writer
+
+
+async def readMessage(reader: asyncio.StreamReader) -> tuple[int, ByteReader] | None:
+    """Reads the next framed message: its type and a reader over the rest. Returns None on a clean end of stream."""
+    length = 0
+    shift = 0
+    while True:
+        byte = await reader.read(1)
+        if not byte:
+            if shift == 0: return None
+            raise ValueError("Truncated message length")
+        length |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80: break
+        shift += 7
+        if shift > 28:
+            raise ValueError("Message length is too long")
+    if length > MAX_MESSAGE_SIZE:
+        raise ValueError(f"Message of {length} bytes exceeds the limit of {MAX_MESSAGE_SIZE}")
+    message = ByteReader(await reader.readexactly(length))
+    return message.readUnsigned(), message
+
+
+def encodeState(frame: bytes) -> bytes:
+    writer = createMessage(STATE_MESSAGE)
+    writer.buffer += frame
+    return encodeMessage(writer)
+
+
+class RemoteField:
+    """
+    A client's copy of a match: the settings from WELCOME and a
+    StateStreamDecoder fed with the STATE messages. Deltas received before
+    the first keyframe are ignored.
+    """
+    __slots__ = ["matchId", "seed", "tickRate", "width", "height", "gameDurationInSeconds", "state"]
+
+    def __init__(self, welcome: ByteReader) -> None:
+        self.matchId = welcome.readUnsigned()
+        self.seed = welcome.readUnsigned()
+        self.tickRate = welcome.readUnsigned()
+        self.width = welcome.readUnsigned()
+        self.height = welcome.readUnsigned()
+        self.gameDurationInSeconds = welcome.readUnsigned()
+        self.state = StateStreamDecoder((self.width, self.height))
+
+    def applyState(self, message: ByteReader) -> None:
+        self.state.applyFrame(message)
+
+    def getTimeLeft(self) -> float:
+        return self.gameDurationInSeconds - self.state.tick / self.tickRate
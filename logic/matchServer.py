@@ -0,0 +1,301 @@
+import asyncio
+import os
+import random
+import time
+from typing import Any, Final
+
+from config import FRAME_RATE, GAME_DURATION_IN_SECONDS, GAME_FIELD_SIZE
+from helpers.byteStream import ByteReader
+from helpers.fixedTimestep import FixedTimestep
+from logic.matchProtocol import (
+    ERROR_MESSAGE, GAME_OVER_MESSAGE, INPUT_MESSAGE, JOIN_MESSAGE, WATCH_MESSAGE, WELCOME_MESSAGE,
+    createMessage, encodeMessage, encodeState, readMessage,
+)
+from logic.replay import PICKUP_ACTION_BASE, Replay, applyAction
+from logic.simulation import Simulation
+from logic.stateStream import StateStreamEncoder
+from units.player import Player
+
+
+class Connection:
+    """
+    One client socket. Messages are written without waiting for the socket:
+    a client whose unsent output grows past MAX_BUFFERED_BYTES stops getting
+    deltas and is sent a keyframe once it has caught up, so a slow reader
+    costs the server memory for one backlog, never a stalled tick.
+    """
+    MAX_BUFFERED_BYTES: Final[int] = 64 * 1024
+
+    __slots__ = ["writer", "match", "isPlayer", "needsKeyframe", "skippedStates"]
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.match: "Match | None" = None
+        self.isPlayer = False
+        self.needsKeyframe = True
+        self.skippedStates: int = 0
+
+    def isBackedUp(self) -> bool:
+        return self.writer.transport.get_write_buffer_size() > self.MAX_BUFFERED_BYTES
+
+    def send(self, message: bytes) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(message)
+
+    def sendError(self, reason: str) -> None:
+        writer = createMessage(ERROR_MESSAGE)
+        writer.writeString(reason)
+        self.send(encodeMessage(writer))
+        self.writer.close()
+
+
+class Match:
+    """
+    A Game played by one remote player and watched by any number of
+    spectators. Inputs received between two ticks are applied in arrival
+    order at the start of the next one, exactly like the keyboard handler
+    of the local game, and recorded in a Replay. The game draws from its
+    own random streams, so every match replays from its seed.
+    """
+    MAX_ACTIONS_PER_TICK: Final[int] = 8
+
+    __slots__ = ["matchId", "seed", "simulation", "game", "replay", "connections", "pendingActions", "stream"]
+
+    def __init__(self, matchId: int, playerName: str, seed: int, gridSize: tuple[int, int], gameDurationInSeconds: int, tickRate: int) -> None:
+        self.matchId = matchId
+        self.seed = seed
+        self.simulation = Simulation(playerName, seed, gridSize, gameDurationInSeconds, tickRate)
+        self.game = self.simulation.game
+        self.replay = Replay(seed, playerName, gridSize, gameDurationInSeconds, tickRate)
+        self.connections: list[Connection] = []
+        self.pendingActions: list[int] = []
+        # Views get a keyframe when they join or catch up, so the stream itself needs none.
+        self.stream = StateStreamEncoder(self.game, keyframeInterval=0)
+
+    def queueAction(self, action: int) -> None:
+        if len(self.pendingActions) < self.MAX_ACTIONS_PER_TICK:
+            self.pendingActions.append(action)
+
+    def step(self) -> bytes:
+        """Plays one tick and returns the STATE delta it produced."""
+        game = self.game
+        for action in self.pendingActions:
+            self.replay.record(game.clock.ticks, action)
+            applyAction(game, action)
+        self.pendingActions.clear()
+        self.simulation.step()
+        return encodeState(self.stream.encodeTick())
+
+    def getKeyframe(self) -> bytes:
+        return encodeState(self.stream.encodeKeyframe())
+
+    def getWelcome(self) -> bytes:
+        writer = createMessage(WELCOME_MESSAGE)
+        for value in (self.matchId, self.seed, self.game.clock.tickRate, *self.game.gridSize, self.game.gameDurationInSeconds):
+            writer.writeUnsigned(value)
+        return encodeMessage(writer)
+
+    def getGameOver(self, status: str) -> bytes:
+        writer = createMessage(GAME_OVER_MESSAGE)
+        writer.writeString(status)
+        writer.writeUnsigned(self.game.player.score)
+        writer.writeUnsigned(self.game.clock.ticks)
+        return encodeMessage(writer)
+
+    def broadcast(self, state: bytes) -> None:
+        keyframe: bytes | None = None
+        for connection in self.connections:
+            if connection.isBackedUp():
+                connection.needsKeyframe = True
+                connection.skippedStates += 1
+            elif connection.needsKeyframe:
+                if keyframe is None:
+                    keyframe = self.getKeyframe()
+                connection.send(keyframe)
+                connection.needsKeyframe = False
+            else:
+                connection.send(state)
+
+
+class MatchServer:
+    """
+    Authoritative server for many concurrent matches. One asyncio task ticks
+    every match at the same fixed rate; each connection has its own reader
+    task that only queues inputs, so neither a busy nor a slow client can
+    hold up the tick. After a tick every match broadcasts the frame of its
+    state stream (see logic.stateStream and logic.matchProtocol).
+    """
+    MAX_PLAYER_NAME_LENGTH: Final[int] = 32
+    ABANDONED_STATUS: Final[str] = "Abandoned"
+    MAX_ACTION: Final[int] = PICKUP_ACTION_BASE + Player.INVENTORY_MAX_SIZE
+
+    def __init__(
+        self,
+        tickRate: int = FRAME_RATE,
+        gridSize: tuple[int, int] = (GAME_FIELD_SIZE, GAME_FIELD_SIZE),
+        gameDurationInSeconds: int = GAME_DURATION_IN_SECONDS,
+        maxMatches: int = 1000,
+        replayDirectory: str | None = None
+    ) -> None:
+        self.tickRate = tickRate
+        self.gridSize = gridSize
+        self.gameDurationInSeconds = gameDurationInSeconds
+        self.maxMatches = maxMatches
+        self.replayDirectory = replayDirectory
+        self.matches: dict[int, Match] = {}
+        self.ticks: int = 0
+        self.finishedMatches: int = 0
+        self.busySeconds: float = 0.0
+        self.slowestTickSeconds: float = 0.0
+        self._nextMatchId = 1
+        self._seeds = random.Random()
+        self._timestep: FixedTimestep | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._tickTask: asyncio.Task | None = None
+        self._connectionTasks: dict[Connection, asyncio.Task] = {}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        """Starts listening and ticking. Returns the address the server listens on (port 0 picks a free one)."""
+        if self._server is not None:
+            raise RuntimeError("The server is already running.")
+        self._server = await asyncio.start_server(self._serveConnection, host, port)
+        self._tickTask = asyncio.create_task(self._runTicks())
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self) -> None:
+        if self._tickTask is not None:
+            self._tickTask.cancel()
+            self._tickTask = None
+        if self._server is not None:
+            self._server.close()
+            # Closed sockets end the connection tasks, which are awaited rather than cancelled.
+            tasks = list(self._connectionTasks.values())
+            for connection in list(self._connectionTasks):
+                connection.writer.close()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    def getStats(self) -> dict[str, Any]:
+        return {
+            "matches": len(self.matches),
+            "finishedMatches": self.finishedMatches,
+            "ticks": self.ticks,
+            "droppedTicks": self._timestep.droppedTicks if self._timestep is not None else 0,
+            "averageTickMilliseconds": self.busySeconds / max(1, self.ticks) * 1000,
+            "slowestTickMilliseconds": self.slowestTickSeconds * 1000,
+        }
+
+    async def _runTicks(self) -> None:
+        secondsPerTick = 1.0 / self.tickRate
+        self._timestep = FixedTimestep(self.tickRate, timeSource=asyncio.get_running_loop().time)
+        while True:
+            for _ in range(self._timestep.advance()):
+                self.tick()
+            await asyncio.sleep(secondsPerTick * (1.0 - self._timestep.alpha))
+
+    def tick(self) -> None:
+        """Advances every match by one tick and sends out the results."""
+        startedAt = time.perf_counter()
+        for match in list(self.matches.values()):
+            state = match.step()
+            match.broadcast(state)
+            if match.game.isGameOver():
+                self._finishMatch(match)
+        self.ticks += 1
+        elapsed = time.perf_counter() - startedAt
+        self.busySeconds += elapsed
+        self.slowestTickSeconds = max(self.slowestTickSeconds, elapsed)
+
+    def _finishMatch(self, match: Match, status: str | None = None) -> None:
+        del self.matches[match.matchId]
+        self.finishedMatches += 1
+        gameOver = match.getGameOver(status or match.game.gameStatus)
+        for connection in match.connections:
+            connection.send(gameOver)
+            connection.match = None
+            # Closing flushes what is still buffered first.
+            connection.writer.close()
+        match.connections.clear()
+
+        if self.replayDirectory is not None:
+            match.replay.finish(match.game)
+            os.makedirs(self.replayDirectory, exist_ok=True)
+            match.replay.save(os.path.join(self.replayDirectory, f"match-{match.matchId}-{match.seed}{Replay.FILE_EXTENSION}"))
+
+    async def _serveConnection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = Connection(writer)
+        self._connectionTasks[connection] = asyncio.current_task()
+        try:
+            while not writer.is_closing():
+                message = await readMessage(reader)
+                if message is None: break
+                self._handleMessage(connection, *message)
+        except (ValueError, asyncio.IncompleteReadError) as error:
+            connection.sendError(str(error) or "Malformed message")
+        except ConnectionError:
+            pass
+        finally:
+            del self._connectionTasks[connection]
+            self._disconnect(connection)
+
+    def _handleMessage(self, connection: Connection, messageType: int, message: ByteReader) -> None:
+        if messageType == JOIN_MESSAGE:
+            self._join(connection, message)
+        elif messageType == WATCH_MESSAGE:
+            self._watch(connection, message.readUnsigned())
+        elif messageType == INPUT_MESSAGE:
+            action = message.readUnsigned()
+            if not connection.isPlayer or connection.match is None:
+                connection.sendError("Only the player of a match can send inputs")
+            elif action > self.MAX_ACTION:
+                connection.sendError(f"Unknown action {action}")
+            else:
+                connection.match.queueAction(action)
+        else:
+            connection.sendError(f"Unknown message type {messageType}")
+
+    def _join(self, connection: Connection, message: ByteReader) -> None:
+        playerName = message.readString()[:self.MAX_PLAYER_NAME_LENGTH]
+        seedPlusOne = message.readUnsigned()
+        if connection.match is not None:
+            connection.sendError("Already in a match")
+            return
+        if len(self.matches) >= self.maxMatches:
+            connection.sendError("The server is full")
+            return
+
+        seed = seedPlusOne - 1 if seedPlusOne else self._seeds.randrange(2 ** 32)
+        match = Match(self._nextMatchId, playerName, seed, self.gridSize, self.gameDurationInSeconds, self.tickRate)
+        self._nextMatchId += 1
+        self.matches[match.matchId] = match
+        connection.isPlayer = True
+        self._subscribe(connection, match)
+
+    def _watch(self, connection: Connection, matchId: int) -> None:
+        match = self.matches.get(matchId)
+        if connection.match is not None:
+            connection.sendError("Already in a match")
+        elif match is None:
+            connection.sendError(f"No match {matchId}")
+        else:
+            self._subscribe(connection, match)
+
+    def _subscribe(self, connection: Connection, match: Match) -> None:
+        connection.match = match
+        connection.needsKeyframe = False
+        match.connections.append(connection)
+        connection.send(match.getWelcome())
+        connection.send(match.getKeyframe())
+
+    def _disconnect(self, connection: Connection) -> None:
+        match = connection.match
+        connection.match = None
+        if not connection.writer.is_closing():
+            connection.writer.close()
+        if match is None: return
+
+        match.connections.remove(connection)
+        # Nobody plays an abandoned match; its spectators are told it is over.
+        if connection.isPlayer and match.matchId in self.matches:
+            self._finishMatch(match, self.ABANDONED_STATUS)
@@ -0,0 +1,332 @@
+import multiprocessing
+import os
+import traceback
+from array import array
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Final, Sequence
+
+from config import FRAME_RATE, GAME_DURATION_IN_SECONDS, GAME_FIELD_SIZE
+from logic.policies import createPolicy
+from logic.replay import applyAction
+from logic.simulation import Simulation
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Layout of the shared block: a header of HEADER_FIELDS int32 (match count,
+# grid width, grid height, unused), then FIELD_COUNT int32 per match (the
+# *_FIELD indices below), then the row-major entity codes of every match's
+# grid, one byte per cell (see helpers.grid.Grid.codes).
+HEADER_FIELDS: Final[int] = 4
+ACTION_FIELD: Final[int] = 0
+REWARD_FIELD: Final[int] = 1
+DONE_FIELD: Final[int] = 2
+SCORE_FIELD: Final[int] = 3
+HEALTH_FIELD: Final[int] = 4
+TICKS_FIELD: Final[int] = 5
+EPISODE_FIELD: Final[int] = 6
+FIELD_COUNT: Final[int] = 7
+
+# Action slot value of a match that gets no input this tick.
+NO_ACTION: Final[int] = -1
+
+STEP_COMMAND: Final[str] = "step"
+RESET_COMMAND: Final[str] = "reset"
+CLOSE_COMMAND: Final[str] = "close"
+
+
+class SharedMatchState:
+    """
+    The state of a batch of matches in one multiprocessing.shared_memory
+    block: per match its action slot, last reward, done flag, score,
+    health, tick and episode, and its grid's entity codes. The process that
+    creates the block owns it and unlinks it on close; any other process
+    can attach by name and read the grids without copying or pickling.
+
+    A process that did not start from the owner has its own resource
+    tracker, which would unlink the block when that process exits; attach
+    with isTracked=False there, and with True in processes the owner started.
+    """
+    __slots__ = ["memory", "matchCount", "gridSize", "cellCount", "fields", "_codes", "_isOwner"]
+
+    def __init__(self, memory: SharedMemory, isOwner: bool) -> None:
+        self.memory = memory
+        self._isOwner = isOwner
+        header = memory.buf[:HEADER_FIELDS * 4].cast("i")
+        self.matchCount, width, height = header[0], header[1], header[2]
+        header.release()
+        self.gridSize = (width, height)
+        self.cellCount = width * height
+        fieldsEnd = (HEADER_FIELDS + self.matchCount * FIELD_COUNT) * 4
+        self.fields = memory.buf[HEADER_FIELDS * 4:fieldsEnd].cast("i")
+        self._codes = memory.buf[fieldsEnd:fieldsEnd + self.matchCount * self.cellCount]
+
+    @classmethod
+    def create(cls, matchCount: int, gridSize: tuple[int, int]) -> "SharedMatchState":
+        width, height = gridSize
+        memory = SharedMemory(create=True, size=(HEADER_FIELDS + matchCount * FIELD_COUNT) * 4 + matchCount * width * height)
+        header = memory.buf[:HEADER_FIELDS * 4].cast("i")
+        header[0], header[1], header[2] = matchCount, width, height
+        header.release()
+        return cls(memory, isOwner=True)
+
+    @classmethod
+    def attach(cls, name: str, isTracked: bool = False) -> "SharedMatchState":
+        memory = SharedMemory(name)
+        if not isTracked:
+            resource_tracker.unregister(memory._name, "shared_memory")
+        return cls(memory, isOwner=False)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def getCodes(self, matchIndex: int) -> memoryview:
+        """Zero-copy view of one match's entity codes, row-major like Grid.codes. It changes with every step."""
+        return self._codes[matchIndex * self.cellCount:(matchIndex + 1) * self.cellCount]
+
+    def getField(self, matchIndex: int, field: int) -> int:
+        return self.fields[matchIndex * FIELD_COUNT + field]
+
+    def getFieldColumn(self, field: int) -> list[int]:
+        """The value of one field for every match."""
+        return self.fields[field::FIELD_COUNT].tolist()
+
+    def getCodesArray(self) -> "np.ndarray":
+        """Zero-copy (matches, height, width) uint8 array over every grid. Drop it before closing the state."""
+        if np is None:
+            raise RuntimeError("Array views require numpy. Install it with 'pip install numpy'.")
+        width, height = self.gridSize
+        return np.frombuffer(self._codes, np.uint8).reshape(self.matchCount, height, width)
+
+    def getFieldsArray(self) -> "np.ndarray":
+        """Zero-copy (matches, FIELD_COUNT) int32 array over the per-match fields. Drop it before closing the state."""
+        if np is None:
+            raise RuntimeError("Array views require numpy. Install it with 'pip install numpy'.")
+        return np.frombuffer(self.fields, np.int32).reshape(self.matchCount, FIELD_COUNT)
+
+    def close(self) -> None:
+        self.fields.release()
+        self._codes.release()
+        self.memory.close()
+        if self._isOwner:
+            self.memory.unlink()
+
+
+class Shard:
+    """
+    The matches of one worker process, stepped in lockstep. A finished match
+    restarts on the next step with the seed of its next episode. Every game
+    draws from its own random streams, so each one plays out like a
+    Simulation with the same seed.
+    """
+    __slots__ = ["state", "firstMatch", "settings", "seed", "simulations"]
+
+    def __init__(self, state: SharedMatchState, firstMatch: int, matchCount: int, settings: dict[str, Any]) -> None:
+        self.state = state
+        self.firstMatch = firstMatch
+        self.settings = settings
+        self.seed = 0
+        self.simulations: list[Simulation | None] = [None] * matchCount
+
+    def reset(self, seed: int) -> None:
+        self.seed = seed
+        fields = self.state.fields
+        for offset in range(len(self.simulations)):
+            fields[(self.firstMatch + offset) * FIELD_COUNT + EPISODE_FIELD] = 0
+            self._start(offset)
+
+    def step(self) -> None:
+        fields = self.state.fields
+        for offset, simulation in enumerate(self.simulations):
+            matchIndex = self.firstMatch + offset
+            base = matchIndex * FIELD_COUNT
+            if fields[base + DONE_FIELD]:
+                fields[base + EPISODE_FIELD] += 1
+                self._start(offset)
+                simulation = self.simulations[offset]
+
+            game = simulation.game
+            score = game.player.score
+            action = fields[base + ACTION_FIELD]
+            if action != NO_ACTION:
+                applyAction(game, action)
+            simulation.step()
+            fields[base + REWARD_FIELD] = game.player.score - score
+            self._publish(matchIndex, simulation)
+
+    def _start(self, offset: int) -> None:
+        matchIndex = self.firstMatch + offset
+        episode = self.state.getField(matchIndex, EPISODE_FIELD)
+        seed = self.seed + matchIndex + episode * self.state.matchCount
+        settings = self.settings
+        policy = createPolicy(settings["policy"], seed) if settings["policy"] is not None else None
+        simulation = Simulation(
+            f"Bot {matchIndex}", seed, self.state.gridSize, settings["gameDurationInSeconds"], settings["tickRate"],
+            policy=policy, vectorized=settings["vectorized"],
+        )
+        self.simulations[offset] = simulation
+        self.state.fields[matchIndex * FIELD_COUNT + REWARD_FIELD] = 0
+        self._publish(matchIndex, simulation)
+
+    def _publish(self, matchIndex: int, simulation: Simulation) -> None:
+        fields = self.state.fields
+        base = matchIndex * FIELD_COUNT
+        game = simulation.game
+        fields[base + DONE_FIELD] = game.isGameOver()
+        fields[base + SCORE_FIELD] = game.player.score
+        fields[base + HEALTH_FIELD] = game.player.health
+        fields[base + TICKS_FIELD] = game.clock.ticks
+        # Grid keeps its own bytearray (find and count scan it), so publishing is one memcpy per match.
+        self.state.getCodes(matchIndex)[:] = game.occupancyGrid.codes
+
+
+def runShard(stateName: str, firstMatch: int, matchCount: int, settings: dict[str, Any], connection: Connection) -> None:
+    """Worker entry point: serves the commands of a ShardedMatches until it closes."""
+    state = SharedMatchState.attach(stateName, isTracked=True)
+    shard = Shard(state, firstMatch, matchCount, settings)
+    try:
+        while True:
+            command, argument = connection.recv()
+            if command == CLOSE_COMMAND: break
+            try:
+                if command == STEP_COMMAND:
+                    shard.step()
+                elif command == RESET_COMMAND:
+                    shard.reset(argument)
+                else:
+                    raise ValueError(f"Unknown shard command '{command}'")
+                connection.send(None)
+            except Exception:
+                connection.send(traceback.format_exc())
+    finally:
+        shard.simulations.clear()
+        state.close()
+        connection.close()
+
+
+class ShardedMatches:
+    """
+    Many headless matches split into contiguous shards, one per worker
+    process, so the pure-Python Game.update of different matches runs on
+    different cores. step advances every match by one tick in lockstep.
+
+    Actions, rewards, scores and grids all live in a SharedMatchState, so a
+    step only sends a short command to each worker: the main process and
+    any observer (e.g. a renderer attached by state.name) read the results
+    in place. Match i of episode e uses seed + i + e * matchCount.
+    """
+    __slots__ = ["matchCount", "state", "_processes", "_connections", "_noActions"]
+
+    def __init__(
+        self,
+        matchCount: int,
+        workers: int | None = None,
+        seed: int = 0,
+        gridSize: tuple[int, int] = (GAME_FIELD_SIZE, GAME_FIELD_SIZE),
+        gameDurationInSeconds: int = GAME_DURATION_IN_SECONDS,
+        tickRate: int = FRAME_RATE,
+        policy: str | None = None,
+        vectorized: bool = False
+    ) -> None:
+        if matchCount < 1:
+            raise ValueError("At least one match is needed.")
+        if policy is not None:
+            createPolicy(policy)
+        self.matchCount = matchCount
+        self.state = SharedMatchState.create(matchCount, gridSize)
+        self._processes: list[multiprocessing.Process] = []
+        self._connections: list[Connection] = []
+        self._noActions = array("i", [NO_ACTION]) * matchCount
+
+        settings = {"gameDurationInSeconds": gameDurationInSeconds, "tickRate": tickRate, "policy": policy, "vectorized": vectorized}
+        workers = max(1, min(workers or os.cpu_count() or 1, matchCount))
+        for worker in range(workers):
+            firstMatch = matchCount * worker // workers
+            lastMatch = matchCount * (worker + 1) // workers
+            connection, workerConnection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=runShard, args=(self.state.name, firstMatch, lastMatch - firstMatch, settings, workerConnection),
+                name=f"shard-{worker}", daemon=True,
+            )
+            process.start()
+            workerConnection.close()
+            self._processes.append(process)
+            self._connections.append(connection)
+        self.reset(seed)
+
+    @property
+    def workers(self) -> int:
+        return len(self._processes)
+
+    def __enter__(self) -> "ShardedMatches":
+        return self
+
+    def __exit__(self, *exceptionInfo) -> None:
+        self.close()
+
+    def reset(self, seed: int = 0) -> None:
+        """Restarts every match: match i plays seed + i."""
+        self._runCommand(RESET_COMMAND, seed)
+
+    def step(self, actions: Sequence[int] | None = None) -> tuple[list[int], list[bool]]:
+        """
+        Applies one action per match (NO_ACTION for none; actions=None for
+        none at all) and advances every match by one tick. Returns the score
+        gained by each match and whether it ended; a match that ended
+        restarts on the next step.
+        """
+        fields = self.state.fields
+        if actions is None:
+            fields[ACTION_FIELD::FIELD_COUNT] = self._noActions
+        elif len(actions) != self.matchCount:
+            raise ValueError(f"Expected {self.matchCount} actions, got {len(actions)}")
+        else:
+            fields[ACTION_FIELD::FIELD_COUNT] = array("i", actions)
+        self._runCommand(STEP_COMMAND)
+        return self.state.getFieldColumn(REWARD_FIELD), [done != 0 for done in self.state.getFieldColumn(DONE_FIELD)]
+
+    def getStats(self) -> dict[str, Any]:
+        scores = self.state.getFieldColumn(SCORE_FIELD)
+        return {
+            "matches": self.matchCount,
+            "workers": self.workers,
+            "ticks": sum(self.state.getFieldColumn(TICKS_FIELD)),
+            "episodes": sum(self.state.getFieldColumn(EPISODE_FIELD)),
+            "averageScore": sum(scores) / self.matchCount,
+        }
+
+    def close(self) -> None:
+        if not self._processes: return
+        for connection in self._connections:
+            try:
+                connection.send((CLOSE_COMMAND, None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process, connection in zip(self._processes, self._connections):
+            process.join()
+            connection.close()
+        self._processes.clear()
+        self._connections.clear()
+        self.state.close()
+
+    def _runCommand(self, command: str, argument: Any = None) -> None:
+        if not self._processes:
+            raise RuntimeError("The matches are closed.")
+        # Every shard gets the command before any reply is awaited, so they all work at once.
+        for connection in self._connections:
+            connection.send((command, argument))
+        failures: list[str] = []
+        for worker, connection in enumerate(self._connections):
+            try:
+                failure = connection.recv()
+            except EOFError:
+                failure = "the worker process exited"
+            if failure is not None:
+                failures.append(f"Shard {worker} failed: {failure}")
+        if failures:
+            raise RuntimeError("\n".join(failures))
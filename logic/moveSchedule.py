@@ -0,0 +1,78 @@
+from operator import attrgetter
+from typing import TYPE_CHECKING, Final
+
+from helpers.timingWheel import TimingWheel
+from units.unit import Unit
+
+if TYPE_CHECKING:
+    from helpers.entityRegistry import EntityView
+
+
+class MoveSchedule:
+    """
+    Move timing for the units of an EntityView, each of which moves once
+    every getMovePeriod passes: a unit waits on a timing wheel for the pass
+    it moves on next, so a pass costs O(movers) instead of O(units). Movers
+    come out in slot order, like a pass over the view. Owns the frame
+    counters of its units while attached, like UnitArrays; a unit's
+    _frameCounter is brought up to date when it moves, leaves the view or on
+    sync. A unit's speed is read when it is added.
+    """
+    SLOT_ORDER: Final = attrgetter("registrySlot")
+
+    __slots__ = ["view", "tickRate", "passes", "_wheel", "_entries"]
+
+    def __init__(self, view: "EntityView", tickRate: int) -> None:
+        self.view = view
+        self.tickRate = tickRate
+        self.passes: int = 0
+        self._wheel: TimingWheel[Unit] = TimingWheel()
+        # unit -> (pass it moves on next, pass its _frameCounter was last brought up to date on)
+        self._entries: dict[Unit, tuple[int, int]] = {}
+
+        view.observer = self
+        for slot, unit in enumerate(view.slots):
+            if unit is not None:
+                self.onUnitAdded(unit, slot)
+
+    def onUnitAdded(self, unit: Unit, slot: int) -> None:
+        period = unit.getMovePeriod(self.tickRate)
+        duePass = self.passes + period - unit._frameCounter % period
+        self._entries[unit] = (duePass, self.passes)
+        self._wheel.schedule(duePass, unit)
+
+    def onUnitRemoved(self, unit: Unit, slot: int) -> None:
+        countedPass = self._entries.pop(unit)[1]
+        unit._frameCounter += self.passes - countedPass
+
+    def onSlotsCompacted(self, previousSlots: list[int]) -> None:
+        # Units are tracked by identity; slots are only read to order the movers.
+        pass
+
+    def popMovers(self) -> list[Unit]:
+        """Starts the next pass and returns the units that move on it, in slot order."""
+        self.passes += 1
+        passes = self.passes
+        entries = self._entries
+        wheel = self._wheel
+        tickRate = self.tickRate
+        movers: list[Unit] = []
+        for unit in wheel.advance():
+            entry = entries.get(unit)
+            # Left the view, or re-added with a new schedule, since this wake-up was set.
+            if entry is None or entry[0] != passes: continue
+
+            unit._frameCounter += passes - entry[1]
+            nextPass = passes + unit.getMovePeriod(tickRate)
+            entries[unit] = (nextPass, passes)
+            wheel.schedule(nextPass, unit)
+            movers.append(unit)
+        movers.sort(key=self.SLOT_ORDER)
+        return movers
+
+    def syncFrameCounters(self) -> None:
+        passes = self.passes
+        entries = self._entries
+        for unit, (duePass, countedPass) in entries.items():
+            unit._frameCounter += passes - countedPass
+            entries[unit] = (duePass, passes)
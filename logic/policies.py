@@ -0,0 +1,91 @@
+import random
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Final
+from data.enums.direction import Direction
+from data.enums.entity import Entity
+
+if TYPE_CHECKING:
+    from logic.game import Game
+
+
+class Policy(ABC):
+    """
+    Plays the player's side of a headless match. act is called once per tick,
+    before Game.update, and may only drive the game through movePlayer,
+    spawnBullet and tryActivatePickup - the same surface the keyboard uses.
+    """
+    name: str = "policy"
+
+    def __init__(self, seed: int | None = None) -> None:
+        pass
+
+    @abstractmethod
+    def act(self, game: "Game") -> None:
+        pass
+
+
+class IdlePolicy(Policy):
+    name = "idle"
+
+    def act(self, game: "Game") -> None:
+        pass
+
+
+class RandomPolicy(Policy):
+    """Mashes random keys. Uses its own RNG so it never disturbs the game's."""
+    name = "random"
+
+    MOVE_CHANCE: Final[float] = 0.2
+    FIRE_CHANCE: Final[float] = 0.3
+    PICKUP_CHANCE: Final[float] = 0.01
+
+    def __init__(self, seed: int | None = None) -> None:
+        self._random = random.Random(seed)
+
+    def act(self, game: "Game") -> None:
+        if self._random.random() < self.MOVE_CHANCE:
+            game.movePlayer(self._random.choice(list(Direction)))
+        if self._random.random() < self.FIRE_CHANCE:
+            game.spawnBullet()
+        if game.player.inventory and self._random.random() < self.PICKUP_CHANCE:
+            game.tryActivatePickup(self._random.randint(1, len(game.player.inventory)))
+
+
+class HunterPolicy(Policy):
+    """Lines up under the lowest enemy, fires on cooldown and bombs crowded waves."""
+    name = "hunter"
+
+    MEGABOMB_ENEMY_THRESHOLD: Final[int] = 6
+
+    def act(self, game: "Game") -> None:
+        player = game.player
+        enemies = game.enemies
+
+        if len(enemies) >= self.MEGABOMB_ENEMY_THRESHOLD:
+            for index, item in enumerate(player.inventory):
+                if item.entityType == Entity.MEGABOMB:
+                    game.tryActivatePickup(index + 1)
+                    break
+
+        if enemies:
+            target = max(enemies, key=lambda enemy: enemy.location.y)
+            if target.location.x < player.location.x:
+                game.movePlayer(Direction.LEFT)
+            elif target.location.x > player.location.x:
+                game.movePlayer(Direction.RIGHT)
+
+        if player.canFire():
+            game.spawnBullet()
+
+
+POLICIES: Final[dict[str, type[Policy]]] = {
+    IdlePolicy.name: IdlePolicy,
+    RandomPolicy.name: RandomPolicy,
+    HunterPolicy.name: HunterPolicy,
+}
+
+
+def createPolicy(name: str, seed: int | None = None) -> Policy:
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy '{name}'. Available: {', '.join(POLICIES)}")
+    return POLICIES[name](seed)
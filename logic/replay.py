@@ -0,0 +1,168 @@
+from typing import TYPE_CHECKING, Final
+
+from data.enums.direction import Direction
+from helpers.varint import readVarint, writeVarint
+from logic.policies import Policy
+from logic.simulation import Simulation
+
+if TYPE_CHECKING:
+    from logic.game import Game
+
+# One input is one small integer: a Direction value for a move, FIRE_ACTION
+# for a shot, or PICKUP_ACTION_BASE + index to activate inventory slot index
+# (slots count from 1, as on the keyboard).
+FIRE_ACTION: Final[int] = 4
+PICKUP_ACTION_BASE: Final[int] = FIRE_ACTION + 1
+DIRECTIONS_BY_ACTION: Final[dict[int, Direction]] = {direction.value: direction for direction in Direction}
+
+
+def getMoveAction(direction: Direction) -> int:
+    return direction.value
+
+
+def getPickupAction(pickupIndex: int) -> int:
+    if pickupIndex < 1:
+        raise ValueError(f"Inventory slots are numbered from 1, got {pickupIndex}")
+    return PICKUP_ACTION_BASE + pickupIndex
+
+
+def applyAction(game: "Game", action: int) -> None:
+    """Feeds one recorded input to the game exactly like the keyboard handler does."""
+    if action in DIRECTIONS_BY_ACTION:
+        game.movePlayer(DIRECTIONS_BY_ACTION[action])
+    elif action == FIRE_ACTION:
+        game.spawnBullet()
+    else:
+        game.tryActivatePickup(action - PICKUP_ACTION_BASE)
+
+
+class Replay:
+    """
+    Everything needed to re-simulate a match: the seed of the game's random
+    streams, the match settings and the inputs of every tick that had any.
+    The final tick count and score are kept to stop at the same point and
+    to detect a replay that no longer plays out the same way.
+
+    Binary layout: MAGIC, FORMAT_VERSION, then varints for seed, tickRate,
+    grid width and height, duration, ticks, score, the UTF-8 player name
+    (length first) and the number of input ticks. Each input tick follows as
+    the tick distance to the previous input tick, the action count and the
+    actions, so a tick with input usually costs three or four bytes.
+    """
+    MAGIC: Final[bytes] = b"SFZR"
+    FORMAT_VERSION: Final[int] = 3
+    FILE_EXTENSION: Final[str] = ".sfzr"
+
+    __slots__ = ["seed", "playerName", "gridSize", "gameDurationInSeconds", "tickRate", "ticks", "score", "inputs"]
+
+    def __init__(self, seed: int, playerName: str, gridSize: tuple[int, int], gameDurationInSeconds: int, tickRate: int) -> None:
+        self.seed = seed
+        self.playerName = playerName
+        self.gridSize = gridSize
+        self.gameDurationInSeconds = gameDurationInSeconds
+        self.tickRate = tickRate
+        self.ticks: int = 0
+        self.score: int = 0
+        # (tick, actions) in increasing tick order.
+        self.inputs: list[tuple[int, list[int]]] = []
+
+    def record(self, tick: int, action: int) -> None:
+        if self.inputs and self.inputs[-1][0] == tick:
+            self.inputs[-1][1].append(action)
+            return
+        if self.inputs and self.inputs[-1][0] > tick:
+            raise ValueError(f"Input for tick {tick} recorded after tick {self.inputs[-1][0]}")
+        self.inputs.append((tick, [action]))
+
+    def finish(self, game: "Game") -> None:
+        self.ticks = game.clock.ticks
+        self.score = game.player.score
+
+    def getActionsByTick(self) -> dict[int, list[int]]:
+        return dict(self.inputs)
+
+    def encode(self) -> bytes:
+        buffer = bytearray(self.MAGIC)
+        buffer.append(self.FORMAT_VERSION)
+        name = self.playerName.encode("utf-8")
+        for value in (self.seed, self.tickRate, *self.gridSize, self.gameDurationInSeconds, self.ticks, self.score, len(name)):
+            writeVarint(buffer, value)
+        buffer += name
+
+        writeVarint(buffer, len(self.inputs))
+        previousTick = 0
+        for tick, actions in self.inputs:
+            writeVarint(buffer, tick - previousTick)
+            writeVarint(buffer, len(actions))
+            for action in actions:
+                writeVarint(buffer, action)
+            previousTick = tick
+        return bytes(buffer)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "Replay":
+        if data[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError("Not a replay file")
+        offset = len(cls.MAGIC)
+        if data[offset] != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported replay format version {data[offset]}")
+        offset += 1
+
+        header: list[int] = []
+        for _ in range(8):
+            value, offset = readVarint(data, offset)
+            header.append(value)
+        seed, tickRate, width, height, duration, ticks, score, nameLength = header
+        playerName = data[offset:offset + nameLength].decode("utf-8")
+        offset += nameLength
+
+        replay = cls(seed, playerName, (width, height), duration, tickRate)
+        replay.ticks = ticks
+        replay.score = score
+
+        inputCount, offset = readVarint(data, offset)
+        tick = 0
+        for _ in range(inputCount):
+            tickDelta, offset = readVarint(data, offset)
+            actionCount, offset = readVarint(data, offset)
+            tick += tickDelta
+            actions: list[int] = []
+            for _ in range(actionCount):
+                action, offset = readVarint(data, offset)
+                actions.append(action)
+            replay.inputs.append((tick, actions))
+        return replay
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as replayFile:
+            replayFile.write(self.encode())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as replayFile:
+            return cls.decode(replayFile.read())
+
+
+class ReplayPolicy(Policy):
+    """Plays back the recorded inputs of a Replay, tick by tick."""
+    name = "replay"
+
+    def __init__(self, replay: Replay) -> None:
+        self._actionsByTick = replay.getActionsByTick()
+
+    def act(self, game: "Game") -> None:
+        for action in self._actionsByTick.get(game.clock.ticks, ()):
+            applyAction(game, action)
+
+
+def createReplaySimulation(replay: Replay, vectorized: bool = False) -> Simulation:
+    """A headless Simulation that re-plays the recorded match when stepped up to replay.ticks."""
+    return Simulation(
+        playerName=replay.playerName,
+        seed=replay.seed,
+        gridSize=replay.gridSize,
+        gameDurationInSeconds=replay.gameDurationInSeconds,
+        tickRate=replay.tickRate,
+        policy=ReplayPolicy(replay),
+        vectorized=vectorized,
+    )
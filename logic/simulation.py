@@ -0,0 +1,85 @@
+from typing import Any
+
+from config import FRAME_RATE, GAME_DURATION_IN_SECONDS, GAME_FIELD_SIZE, PLAYER_START_POSITION, PLAYER_HEALTH
+from helpers.clock import TickClock
+from helpers.location import Location
+from logic.game import Game
+from logic.policies import Policy
+from units.player import Player
+
+
+class Simulation:
+    """
+    Headless driver for a Game: no pygame, no display and no frame limiter.
+    Time is a TickClock, so a full match runs as fast as the CPU allows and
+    plays out exactly like the live game for the same seed and inputs.
+    """
+    __slots__ = ["seed", "clock", "player", "game", "policy"]
+
+    def __init__(
+        self,
+        playerName: str = "Bot",
+        seed: int | None = None,
+        gridSize: tuple[int, int] = (GAME_FIELD_SIZE, GAME_FIELD_SIZE),
+        gameDurationInSeconds: int = GAME_DURATION_IN_SECONDS,
+        tickRate: int = FRAME_RATE,
+        policy: Policy | None = None,
+        balance: dict[str, Any] | None = None,
+        vectorized: bool = False
+    ) -> None:
+        self.seed = seed
+        self.policy = policy
+
+        gameType = createBalancedGameType(balance) if balance else Game
+        self.clock = TickClock(tickRate)
+        self.player = Player(playerName, getPlayerStartLocation(gridSize), PLAYER_HEALTH)
+        self.game = gameType(self.player, gridSize, gameDurationInSeconds, self.clock, vectorized, seed)
+
+    @property
+    def ticks(self) -> int:
+        return self.clock.ticks
+
+    def step(self) -> bool:
+        """Advances the match by one tick. Returns False once the match is over."""
+        if self.game.isGameOver(): return False
+        if self.policy is not None:
+            self.policy.act(self.game)
+        self.game.update()
+        return True
+
+    def run(self, maxTicks: int | None = None) -> Game:
+        """Plays the match until it ends or maxTicks ticks have been simulated."""
+        while maxTicks is None or self.clock.ticks < maxTicks:
+            if not self.step(): break
+        return self.game
+
+    def getResult(self) -> dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "status": self.game.gameStatus,
+            "score": self.player.score,
+            "survivalTime": round(self.clock.now() - self.game.startTime, 3),
+            "ticks": self.clock.ticks,
+            "kills": self.game.enemiesKilled,
+            "damageTaken": self.player.damageTaken,
+            "health": self.player.health,
+        }
+
+
+def getPlayerStartLocation(gridSize: tuple[int, int]) -> Location:
+    """PLAYER_START_POSITION when it is inside the field, otherwise the centre column two rows above the bottom wall."""
+    width, height = gridSize
+    if width < 3 or height < 3:
+        raise ValueError(f"A {width}x{height} grid has no room inside its walls for the player.")
+    x, y = PLAYER_START_POSITION
+    if 0 < x < width - 1 and 0 < y < height - 1:
+        return Location(x, y)
+    return Location(width // 2, max(1, height - 3))
+
+
+def createBalancedGameType(balance: dict[str, Any]) -> type[Game]:
+    """Builds a Game subclass with some of its tuning constants overridden."""
+    unknownNames = [name for name in balance if not name.isupper() or not hasattr(Game, name)]
+    if unknownNames:
+        raise ValueError(f"Unknown balance parameters: {', '.join(unknownNames)}")
+    return type("BalancedGame", (Game,), {"__slots__": (), **balance})
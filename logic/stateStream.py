@@ -0,0 +1,254 @@
+from typing import TYPE_CHECKING, Final
+
+from data.enums.entity import ENTITY_CODES, Entity
+from helpers.byteStream import ByteReader, ByteWriter
+
+if TYPE_CHECKING:
+    from logic.game import Game
+
+# Tick-by-tick stream of what a remote view of a Game shows: the entities on
+# the field (every unit the grid shows except walls, identified by unitId;
+# the player is 0) and the player stats. One frame per tick, built from
+# varints (helpers.byteStream):
+#
+#   tick, flags
+#   keyframe:  entity count, then per entity in cell order the cell index
+#              gap (distance to the previous cell minus one), unitId, code
+#   delta:     spawned count, per entity cell index, unitId, code;
+#              moved count, per entity unitId, new cell index;
+#              killed count, per entity unitId
+#   FLAG_STATS:          score, health (signed), inventory entity codes
+#   FLAG_NOTIFICATIONS:  count, then the texts
+#
+# Cells are row-major indices into the field; walls are implied by its
+# size. A keyframe is self-contained, so a view can start at any keyframe.
+FLAG_KEYFRAME: Final[int] = 1
+FLAG_STATS: Final[int] = 2
+FLAG_NOTIFICATIONS: Final[int] = 4
+
+WALL_CODE: Final[int] = ENTITY_CODES[Entity.WALL]
+NO_ENTITY: Final[int] = -1
+
+
+def getPlayerStats(game: "Game") -> tuple[int, int, tuple[int, ...]]:
+    """(score, health, entity codes of the inventory), the player state a remote view shows."""
+    player = game.player
+    return player.score, player.health, tuple(ENTITY_CODES[item.entityType] for item in player.inventory)
+
+
+def createWallCodes(gridSize: tuple[int, int]) -> bytearray:
+    """Entity codes of an empty field: walls around the border, nothing inside."""
+    width, height = gridSize
+    codes = bytearray(width * height)
+    codes[:width] = codes[-width:] = bytes([WALL_CODE]) * width
+    codes[::width] = codes[width - 1::width] = bytes([WALL_CODE]) * height
+    return codes
+
+
+class StateStreamEncoder:
+    """
+    Encodes the frames of a Game's state stream. It takes over the grid's
+    change tracking (so it cannot share a Game with a GridRenderer) and
+    turns the cells that changed during a tick into spawned, moved and
+    killed entities, so a delta costs time and bytes in proportion to what
+    changed, not to the size of the field. A unit the grid stops showing is
+    reported killed, and spawned again if it reappears.
+
+    encodeTick must be called once after every Game.update. Every
+    keyframeInterval ticks (0 for never) it emits a keyframe instead of a
+    delta; encodeKeyframe makes one on demand, for a view that joins late.
+    """
+    DEFAULT_KEYFRAME_INTERVAL: Final[int] = 150
+
+    __slots__ = ["game", "keyframeInterval", "_cellOwners", "_entities", "_stats", "_notificationsVersion"]
+
+    def __init__(self, game: "Game", keyframeInterval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        self.game = game
+        self.keyframeInterval = keyframeInterval
+        grid = game.occupancyGrid
+        codes = grid.codes
+        # unitId shown in every cell, and (cell index, code) of every entity shown.
+        self._cellOwners: list[int] = [NO_ENTITY] * len(codes)
+        self._entities: dict[int, tuple[int, int]] = {}
+        for index, code in enumerate(codes):
+            unit = grid.getUnitAtIndex(index)
+            if unit is not None and code != WALL_CODE:
+                self._cellOwners[index] = unit.unitId
+                self._entities[unit.unitId] = (index, code)
+        grid.trackChanges()
+        grid.consumeChangedCells()
+        self._stats = getPlayerStats(game)
+        self._notificationsVersion = game.notificationsVersion
+
+    def encodeTick(self) -> bytes:
+        game = self.game
+        spawned, moved, killed = self._applyChanges()
+        stats = getPlayerStats(game)
+        isStatsChanged = stats != self._stats
+        isNotificationsChanged = game.notificationsVersion != self._notificationsVersion
+        self._stats = stats
+        self._notificationsVersion = game.notificationsVersion
+        if self.keyframeInterval and game.clock.ticks % self.keyframeInterval == 0:
+            return self.encodeKeyframe()
+
+        writer = ByteWriter()
+        writer.writeUnsigned(game.clock.ticks)
+        writer.writeUnsigned((FLAG_STATS if isStatsChanged else 0) | (FLAG_NOTIFICATIONS if isNotificationsChanged else 0))
+        writer.writeUnsigned(len(spawned))
+        for index, unitId, code in spawned:
+            writer.writeUnsigned(index)
+            writer.writeUnsigned(unitId)
+            writer.writeUnsigned(code)
+        writer.writeUnsigned(len(moved))
+        for unitId, index in moved:
+            writer.writeUnsigned(unitId)
+            writer.writeUnsigned(index)
+        writer.writeUnsigned(len(killed))
+        for unitId in killed:
+            writer.writeUnsigned(unitId)
+        self._writeStats(writer, isStatsChanged, isNotificationsChanged)
+        return writer.getBytes()
+
+    def encodeKeyframe(self) -> bytes:
+        """The state as of the last encodeTick. It does not advance the stream, so it can go to a single view."""
+        writer = ByteWriter()
+        writer.writeUnsigned(self.game.clock.ticks)
+        writer.writeUnsigned(FLAG_KEYFRAME | FLAG_STATS | FLAG_NOTIFICATIONS)
+        writer.writeUnsigned(len(self._entities))
+        previousIndex = -1
+        for index, unitId, code in sorted((index, unitId, code) for unitId, (index, code) in self._entities.items()):
+            writer.writeUnsigned(index - previousIndex - 1)
+            writer.writeUnsigned(unitId)
+            writer.writeUnsigned(code)
+            previousIndex = index
+        self._writeStats(writer, True, True)
+        return writer.getBytes()
+
+    def _applyChanges(self) -> tuple[list[tuple[int, int, int]], list[tuple[int, int]], list[int]]:
+        grid = self.game.occupancyGrid
+        changedCells = grid.consumeChangedCells()
+        if not changedCells:
+            return [], [], []
+
+        codes = grid.codes
+        cellOwners, entities = self._cellOwners, self._entities
+        vacated: list[int] = []
+        spawned: list[tuple[int, int, int]] = []
+        moved: list[tuple[int, int]] = []
+        for index in sorted(changedCells):
+            unit = grid.getUnitAtIndex(index)
+            unitId = NO_ENTITY if unit is None or codes[index] == WALL_CODE else unit.unitId
+            owner = cellOwners[index]
+            if owner == unitId: continue
+            cellOwners[index] = unitId
+            if owner != NO_ENTITY:
+                vacated.append(owner)
+            if unitId == NO_ENTITY: continue
+            if unitId in entities:
+                moved.append((unitId, index))
+            else:
+                spawned.append((index, unitId, codes[index]))
+            entities[unitId] = (index, codes[index])
+
+        # A unit that left a cell and did not land in another one is gone.
+        killed: list[int] = []
+        for unitId in vacated:
+            entry = entities.get(unitId)
+            if entry is not None and cellOwners[entry[0]] != unitId:
+                del entities[unitId]
+                killed.append(unitId)
+        return spawned, moved, killed
+
+    def _writeStats(self, writer: ByteWriter, isStatsIncluded: bool, isNotificationsIncluded: bool) -> None:
+        if isStatsIncluded:
+            score, health, inventory = self._stats
+            writer.writeUnsigned(score)
+            writer.writeSigned(health)
+            writer.writeBytes(bytes(inventory))
+        if isNotificationsIncluded:
+            notifications = self.game.notifications
+            writer.writeUnsigned(len(notifications))
+            for text in notifications:
+                writer.writeString(text)
+
+
+class StateStreamDecoder:
+    """
+    Rebuilds a renderable field from a state stream: `codes` holds the
+    entity code of every cell, row-major like Grid.codes, next to the
+    player stats and notifications. Frames before the first keyframe are
+    skipped.
+    """
+    __slots__ = ["gridSize", "codes", "tick", "score", "health", "inventory", "notifications", "isSynchronized", "_cellOwners", "_entities"]
+
+    def __init__(self, gridSize: tuple[int, int]) -> None:
+        self.gridSize = gridSize
+        self.tick: int = 0
+        self.score: int = 0
+        self.health: int = 0
+        self.inventory: tuple[int, ...] = ()
+        self.notifications: tuple[str, ...] = ()
+        self.isSynchronized = False
+        self._clear()
+
+    def _clear(self) -> None:
+        self.codes = createWallCodes(self.gridSize)
+        self._cellOwners: list[int] = [NO_ENTITY] * len(self.codes)
+        # unitId -> (cell index, code) of every entity shown.
+        self._entities: dict[int, tuple[int, int]] = {}
+
+    def applyFrame(self, frame: bytes | ByteReader) -> bool:
+        """Applies one frame. Returns False if it was skipped while waiting for a keyframe."""
+        reader = frame if isinstance(frame, ByteReader) else ByteReader(frame)
+        tick = reader.readUnsigned()
+        flags = reader.readUnsigned()
+        if flags & FLAG_KEYFRAME:
+            self._clear()
+            index = -1
+            for _ in range(reader.readUnsigned()):
+                index += reader.readUnsigned() + 1
+                self._place(reader.readUnsigned(), index, reader.readUnsigned())
+            self.isSynchronized = True
+        elif not self.isSynchronized:
+            return False
+        else:
+            self._applyDelta(reader)
+
+        self.tick = tick
+        if flags & FLAG_STATS:
+            self.score = reader.readUnsigned()
+            self.health = reader.readSigned()
+            self.inventory = tuple(reader.readBytes())
+        if flags & FLAG_NOTIFICATIONS:
+            self.notifications = tuple(reader.readString() for _ in range(reader.readUnsigned()))
+        return True
+
+    def _applyDelta(self, reader: ByteReader) -> None:
+        spawned = [(reader.readUnsigned(), reader.readUnsigned(), reader.readUnsigned()) for _ in range(reader.readUnsigned())]
+        moved = [(reader.readUnsigned(), reader.readUnsigned()) for _ in range(reader.readUnsigned())]
+        killed = [reader.readUnsigned() for _ in range(reader.readUnsigned())]
+
+        # Everything leaves its old cell before anything lands, so chains of moves resolve in any order.
+        movedCodes = [self._lift(unitId) for unitId, _ in moved]
+        for unitId in killed:
+            self._lift(unitId)
+        for (unitId, index), code in zip(moved, movedCodes):
+            self._place(unitId, index, code)
+        for index, unitId, code in spawned:
+            self._place(unitId, index, code)
+
+    def _lift(self, unitId: int) -> int:
+        """Takes an entity off the field and returns its code."""
+        entry = self._entities.pop(unitId, None)
+        if entry is None:
+            raise ValueError(f"Frame refers to unknown entity {unitId}")
+        index, code = entry
+        if self._cellOwners[index] == unitId:
+            self._cellOwners[index] = NO_ENTITY
+            self.codes[index] = 0
+        return code
+
+    def _place(self, unitId: int, index: int, code: int) -> None:
+        self._entities[unitId] = (index, code)
+        self._cellOwners[index] = unitId
+        self.codes[index] = code
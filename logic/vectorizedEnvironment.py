@@ -0,0 +1,186 @@
+from typing import TYPE_CHECKING, Any, Final, Sequence
+
+from config import FRAME_RATE, GAME_DURATION_IN_SECONDS, GAME_FIELD_SIZE, PLAYER_HEALTH
+from data.enums.direction import Direction
+from data.enums.entity import ENTITY_CODES, Entity
+from logic.replay import FIRE_ACTION, applyAction, getMoveAction, getPickupAction
+from logic.simulation import Simulation
+from units.player import Player
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from logic.game import Game
+
+
+class VectorizedEnvironment:
+    """
+    Gym-style batch of `count` headless matches for training agents. reset
+    and step follow the vector API of gymnasium (without depending on it):
+    step takes one action index per match and returns observations,
+    rewards, terminated and truncated flags and an info dict. A match that
+    ends restarts right away, so the observation returned for it is the
+    first one of its next episode; the info arrays keep the score and
+    length of the episode that ended. Match i of episode e plays seed
+    + i + e * count.
+
+    An observation is one float32 array of shape (count, CHANNELS, height,
+    width): a 0/1 plane per entity type (ENTITY_CODES order), then one
+    constant plane per entry of STAT_CHANNELS. The batch arrays are
+    allocated once and overwritten by every step, so copy what you keep.
+    Rewards are the score each match gained during the step.
+    """
+    # Action index -> replay action (None for no input), then the pickups used by entity type.
+    ACTIONS: Final[tuple[int | None, ...]] = (None, *(getMoveAction(direction) for direction in Direction), FIRE_ACTION)
+    PICKUP_ACTIONS: Final[tuple[Entity, ...]] = (Entity.HEART, Entity.EXTRA_SCORE, Entity.MEGABOMB)
+    ACTION_COUNT: Final[int] = len(ACTIONS) + len(PICKUP_ACTIONS)
+
+    ENTITY_CHANNELS: Final[int] = len(ENTITY_CODES)
+    # Health relative to the start, share of the match left, weapon ready, then the held pickups of PICKUP_ACTIONS.
+    STAT_CHANNELS: Final[tuple[str, ...]] = ("health", "timeLeft", "canFire", "hearts", "extraScores", "megabombs")
+    CHANNELS: Final[int] = ENTITY_CHANNELS + len(STAT_CHANNELS)
+
+    __slots__ = [
+        "count", "gridSize", "gameDurationInSeconds", "tickRate", "vectorized", "seed", "simulations",
+        "observations", "rewards", "terminated", "truncated", "infos",
+        "_episodes", "_scores", "_gridCodes", "_codes", "_codeRows", "_channelCodes",
+        "_entityPlanes", "_statPlanes", "_stats", "_statRows",
+    ]
+
+    def __init__(
+        self,
+        count: int,
+        gridSize: tuple[int, int] = (GAME_FIELD_SIZE, GAME_FIELD_SIZE),
+        gameDurationInSeconds: int = GAME_DURATION_IN_SECONDS,
+        tickRate: int = FRAME_RATE,
+        vectorized: bool = False
+    ) -> None:
+        if np is None:
+            raise RuntimeError("The vectorized environment requires numpy. Install it with 'pip install numpy'.")
+        if count < 1:
+            raise ValueError("At least one match is needed.")
+        self.count = count
+        self.gridSize = gridSize
+        self.gameDurationInSeconds = gameDurationInSeconds
+        self.tickRate = tickRate
+        self.vectorized = vectorized
+        self.seed = 0
+        self.simulations: list[Simulation | None] = [None] * count
+        self._episodes: list[int] = [0] * count
+        self._scores: list[int] = [0] * count
+
+        width, height = gridSize
+        self.observations = np.zeros((count, self.CHANNELS, height, width), np.float32)
+        self.rewards = np.zeros(count, np.float32)
+        self.terminated = np.zeros(count, np.bool_)
+        self.truncated = np.zeros(count, np.bool_)
+        self.infos: dict[str, Any] = {
+            "episodes": np.zeros(count, np.int64),
+            "episodeScores": np.zeros(count, np.int64),
+            "episodeTicks": np.zeros(count, np.int64),
+        }
+
+        # Everything observe touches is allocated here: the grids are gathered into _codes, expanded
+        # into the entity planes by one broadcast comparison, and _stats is broadcast over the stat planes.
+        self._gridCodes: list[Any] = [None] * count
+        self._codes = np.zeros((count, 1, height, width), np.uint8)
+        self._codeRows = [self._codes[index, 0] for index in range(count)]
+        self._channelCodes = np.array(sorted(ENTITY_CODES.values()), np.uint8).reshape(1, self.ENTITY_CHANNELS, 1, 1)
+        self._entityPlanes = self.observations[:, :self.ENTITY_CHANNELS]
+        self._statPlanes = self.observations[:, self.ENTITY_CHANNELS:]
+        self._stats = np.zeros((count, len(self.STAT_CHANNELS), 1, 1), np.float32)
+        self._statRows = [self._stats[index, :, 0, 0] for index in range(count)]
+
+    def reset(self, seed: int | None = None) -> tuple["np.ndarray", dict[str, Any]]:
+        """Starts a new episode in every match; match i plays seed + i (the previous seed if None)."""
+        if seed is not None:
+            self.seed = seed
+        for index in range(self.count):
+            self._episodes[index] = 0
+            self._start(index)
+        self.rewards.fill(0)
+        self.terminated.fill(False)
+        self.truncated.fill(False)
+        for values in self.infos.values():
+            values.fill(0)
+        self._observe()
+        return self.observations, self.infos
+
+    def step(self, actions: Sequence[int]) -> tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", dict[str, Any]]:
+        if len(actions) != self.count:
+            raise ValueError(f"Expected {self.count} actions, got {len(actions)}")
+        if self.simulations[0] is None:
+            raise RuntimeError("Call reset before step.")
+
+        rewards, terminated, truncated, scores = self.rewards, self.terminated, self.truncated, self._scores
+        for index, simulation in enumerate(self.simulations):
+            game = simulation.game
+            self._applyAction(game, actions[index])
+            simulation.step()
+
+            score = game.player.score
+            rewards[index] = score - scores[index]
+            scores[index] = score
+            if game.isGameOver():
+                isDead = game.player.health <= 0
+                terminated[index] = isDead
+                truncated[index] = not isDead
+                self._episodes[index] += 1
+                self.infos["episodes"][index] = self._episodes[index]
+                self.infos["episodeScores"][index] = score
+                self.infos["episodeTicks"][index] = game.clock.ticks
+                self._start(index)
+            else:
+                terminated[index] = False
+                truncated[index] = False
+                self._fillStats(index, game)
+        self._observe()
+        return self.observations, self.rewards, self.terminated, self.truncated, self.infos
+
+    def _applyAction(self, game: "Game", action: int) -> None:
+        if action < len(self.ACTIONS):
+            replayAction = self.ACTIONS[action]
+            if replayAction is not None:
+                applyAction(game, replayAction)
+            return
+        entityType = self.PICKUP_ACTIONS[action - len(self.ACTIONS)]
+        for slot, item in enumerate(game.player.inventory, start=1):
+            if item.entityType == entityType:
+                applyAction(game, getPickupAction(slot))
+                return
+
+    def _start(self, index: int) -> None:
+        seed = self.seed + index + self._episodes[index] * self.count
+        simulation = Simulation(f"Agent {index}", seed, self.gridSize, self.gameDurationInSeconds, self.tickRate, vectorized=self.vectorized)
+        self.simulations[index] = simulation
+        self._scores[index] = simulation.player.score
+        width, height = self.gridSize
+        self._gridCodes[index] = np.frombuffer(simulation.game.occupancyGrid.codes, np.uint8).reshape(height, width)
+        self._fillStats(index, simulation.game)
+
+    def _fillStats(self, index: int, game: "Game") -> None:
+        player = game.player
+        stats = self._statRows[index]
+        stats[0] = player.health / PLAYER_HEALTH
+        stats[1] = max(0.0, game.getTimeLeft()) / game.gameDurationInSeconds
+        stats[2] = player.canFire()
+        hearts = extraScores = megabombs = 0
+        for item in player.inventory:
+            if item.entityType == Entity.HEART:
+                hearts += 1
+            elif item.entityType == Entity.EXTRA_SCORE:
+                extraScores += 1
+            elif item.entityType == Entity.MEGABOMB:
+                megabombs += 1
+        stats[3] = hearts / Player.INVENTORY_MAX_SIZE
+        stats[4] = extraScores / Player.INVENTORY_MAX_SIZE
+        stats[5] = megabombs / Player.INVENTORY_MAX_SIZE
+
+    def _observe(self) -> None:
+        for codeRow, gridCodes in zip(self._codeRows, self._gridCodes):
+            np.copyto(codeRow, gridCodes)
+        np.equal(self._codes, self._channelCodes, out=self._entityPlanes)
+        np.copyto(self._statPlanes, self._stats)
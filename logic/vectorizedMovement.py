@@ -0,0 +1,246 @@
+from typing import TYPE_CHECKING, Callable, Final
+from data.enums.entity import EMPTY_ENTITY_CODE, Entity
+from helpers.location import Location
+from units.enemy import Enemy
+from units.unit import Unit
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from helpers.entityRegistry import EntityView
+    from logic.game import Game
+
+
+class UnitArrays:
+    """
+    Structure-of-arrays mirror of an EntityView with one row per view slot.
+    Owns the frame counters of its units while attached; a unit's own
+    _frameCounter is brought up to date when it leaves the view or on sync.
+    """
+    INITIAL_CAPACITY: Final[int] = 64
+
+    __slots__ = ["view", "tickRate", "frameCounters", "movePeriods", "isActive"]
+
+    def __init__(self, view: "EntityView", tickRate: int) -> None:
+        self.view = view
+        self.tickRate = tickRate
+        self.frameCounters = np.zeros(self.INITIAL_CAPACITY, np.int64)
+        self.movePeriods = np.ones(self.INITIAL_CAPACITY, np.int64)
+        self.isActive = np.zeros(self.INITIAL_CAPACITY, np.bool_)
+
+        view.observer = self
+        for slot, unit in enumerate(view.slots):
+            if unit is not None:
+                self.onUnitAdded(unit, slot)
+
+    def _ensureCapacity(self, size: int) -> None:
+        capacity = len(self.isActive)
+        if size <= capacity: return
+        while capacity < size:
+            capacity *= 2
+        extra = capacity - len(self.isActive)
+        self.frameCounters = np.concatenate([self.frameCounters, np.zeros(extra, np.int64)])
+        self.movePeriods = np.concatenate([self.movePeriods, np.ones(extra, np.int64)])
+        self.isActive = np.concatenate([self.isActive, np.zeros(extra, np.bool_)])
+
+    def onUnitAdded(self, unit: Unit, slot: int) -> None:
+        self._ensureCapacity(slot + 1)
+        self.frameCounters[slot] = unit._frameCounter
+        self.movePeriods[slot] = unit.getMovePeriod(self.tickRate)
+        self.isActive[slot] = True
+
+    def onUnitRemoved(self, unit: Unit, slot: int) -> None:
+        unit._frameCounter = int(self.frameCounters[slot])
+        self.isActive[slot] = False
+
+    def onSlotsCompacted(self, previousSlots: list[int]) -> None:
+        count = len(previousSlots)
+        previous = np.asarray(previousSlots, np.intp)
+        self.frameCounters[:count] = self.frameCounters[previous]
+        self.movePeriods[:count] = self.movePeriods[previous]
+        self.isActive[:count] = True
+        self.isActive[count:] = False
+
+    def advance(self) -> list[int]:
+        """Counts a pass for every unit of the view at once and returns the slots whose move period is up."""
+        slotCount = len(self.view.slots)
+        isActive = self.isActive[:slotCount]
+        frameCounters = self.frameCounters[:slotCount]
+        frameCounters += isActive
+        return np.flatnonzero(isActive & (frameCounters % self.movePeriods[:slotCount] == 0)).tolist()
+
+    def syncFrameCounters(self) -> None:
+        for slot, unit in enumerate(self.view.slots):
+            if unit is not None:
+                unit._frameCounter = int(self.frameCounters[slot])
+
+
+class VectorizedMovement:
+    """
+    Drop-in replacement for Game.moveBullets/moveEnemies/moveCrates that
+    resolves every due unit of a pass with array operations.
+
+    A pass computes all targets first, then splits the movers in two groups.
+    Fast movers step into a cell that was empty, that nobody else targets,
+    and leave a cell that nobody targets, so their order cannot matter and
+    they are applied in bulk. Every other mover (collisions, the base line,
+    contested cells) goes through the scalar Game._advance* methods in the
+    original slot order. Random draws happen in the same order as in the
+    scalar path, so a seeded match plays out identically.
+    """
+    MIN_BULK_MOVERS: Final[int] = 48
+
+    MOVE: Final[int] = 0
+    VACATE: Final[int] = 1
+    STAY: Final[int] = 2
+    SPECIAL: Final[int] = 3
+
+    __slots__ = ["game", "_bullets", "_enemies", "_crates", "_targetCounts"]
+
+    def __init__(self, game: "Game") -> None:
+        if np is None:
+            raise RuntimeError("Vectorized movement requires numpy. Install it with 'pip install numpy'.")
+        self.game = game
+        tickRate = game.clock.tickRate
+        self._bullets = UnitArrays(game.entities.view(Entity.BULLET), tickRate)
+        self._enemies = UnitArrays(game.entities.view(Entity.ENEMY), tickRate)
+        self._crates = UnitArrays(game.entities.view(Entity.CRATE), tickRate)
+        self._targetCounts = np.zeros(game.gridSize[0] * game.gridSize[1], np.int32)
+
+    def syncFrameCounters(self) -> None:
+        """Writes the array-held frame counters back to the unit objects."""
+        for arrays in (self._bullets, self._enemies, self._crates):
+            arrays.syncFrameCounters()
+
+    def _gatherMovers(self, arrays: UnitArrays) -> list[Unit]:
+        slots = arrays.view.slots
+        return [slots[slot] for slot in arrays.advance()]
+
+    def _getPositions(self, movers: list[Unit]) -> tuple["np.ndarray", "np.ndarray"]:
+        count = len(movers)
+        xs = np.fromiter([unit.location.x for unit in movers], np.int64, count)
+        ys = np.fromiter([unit.location.y for unit in movers], np.int64, count)
+        return xs, ys
+
+    def _stepEach(self, view: "EntityView", movers: list[Unit], step: Callable[[Unit], None]) -> None:
+        # Below MIN_BULK_MOVERS the fixed cost of the array operations outweighs the scalar steps.
+        for unit in movers:
+            if unit in view:
+                step(unit)
+
+    def _isInside(self, xs: "np.ndarray", ys: "np.ndarray") -> "np.ndarray":
+        width, height = self.game.gridSize
+        return (xs > 0) & (xs < width - 1) & (ys > 0) & (ys < height - 1)
+
+    def _resolve(
+        self,
+        view: "EntityView",
+        movers: list[Unit],
+        xs: "np.ndarray",
+        ys: "np.ndarray",
+        targetXs: "np.ndarray",
+        targetYs: "np.ndarray",
+        outcomes: "np.ndarray",
+        stepSlowly: Callable[[Unit, Location], None]
+    ) -> None:
+        game = self.game
+        width = game.gridSize[0]
+        codes = np.frombuffer(game._grid.codes, np.uint8)
+
+        isMove = outcomes == self.MOVE
+        sources = ys * width + xs
+        targets = np.where(isMove, targetYs * width + targetXs, 0)
+        moveTargets = targets[isMove]
+
+        # How many movers aim at each cell, counted in a per-cell scratch table.
+        targetCounts = self._targetCounts
+        np.add.at(targetCounts, moveTargets, 1)
+        isContested = targetCounts[targets] > 1
+        isSourceTargeted = targetCounts[sources] > 0
+        targetCounts[moveTargets] = 0
+
+        isFastMove = isMove & (codes[targets] == EMPTY_ENTITY_CODE) & ~isContested
+        isFast = (outcomes == self.STAY) | (~isSourceTargeted & (isFastMove | (outcomes == self.VACATE)))
+
+        fastMoves = np.flatnonzero(isFast & isFastMove)
+        for index, x, y in zip(fastMoves.tolist(), targetXs[fastMoves].tolist(), targetYs[fastMoves].tolist()):
+            game._updateUnitPosition(movers[index], Location(x, y))
+
+        # Removals free registry slots, so they keep the slot order of the scalar path.
+        isFastVacate = isFast & (outcomes == self.VACATE)
+        rest = np.flatnonzero(~isFast | isFastVacate)
+        for index, isVacate, x, y in zip(rest.tolist(), isFastVacate[rest].tolist(), targetXs[rest].tolist(), targetYs[rest].tolist()):
+            unit = movers[index]
+            if isVacate:
+                game._removeUnit(unit)
+            elif unit in view:
+                stepSlowly(unit, Location(x, y))
+
+    def moveBullets(self) -> None:
+        movers = self._gatherMovers(self._bullets)
+        if len(movers) < self.MIN_BULK_MOVERS:
+            self._stepEach(self._bullets.view, movers, self._stepBullet)
+            return
+
+        xs, ys = self._getPositions(movers)
+        targetYs = ys - 1
+        outcomes = np.where(self._isInside(xs, targetYs), self.MOVE, self.VACATE)
+        self._resolve(self._bullets.view, movers, xs, ys, xs, targetYs, outcomes, self._stepBullet)
+
+    def _stepBullet(self, bullet: Unit, targetLocation: Location | None = None) -> None:
+        self.game._advanceBullet(bullet, targetLocation or bullet.getNextLocation())
+
+    def moveEnemies(self) -> None:
+        movers = self._gatherMovers(self._enemies)
+        if len(movers) < self.MIN_BULK_MOVERS:
+            self._stepEach(self._enemies.view, movers, self._stepEnemy)
+            return
+
+        xs, ys = self._getPositions(movers)
+
+        isAlive = np.fromiter([enemy.isAlive() for enemy in movers], np.bool_, len(movers))
+        aliveCount = int(isAlive.sum())
+        chances = self.game.random.movement.take(aliveCount)
+
+        left, right = Enemy.DRIFT_LEFT_CHANCE, Enemy.DRIFT_RIGHT_CHANCE
+        drifts = np.zeros(len(movers), np.int64)
+        drifts[isAlive] = np.where(
+            (left[0] < chances) & (chances < left[1]), -1,
+            np.where((right[0] < chances) & (chances < right[1]), 1, 0)
+        )
+        targetXs = xs + drifts
+        targetYs = ys + 1
+
+        outcomes = np.where(self._isInside(targetXs, targetYs), self.MOVE, self.STAY)
+        outcomes[targetYs >= self.game.gridSize[1] - 1] = self.SPECIAL
+        outcomes[~isAlive] = self.VACATE
+        self._resolve(self._enemies.view, movers, xs, ys, targetXs, targetYs, outcomes, self._stepEnemy)
+
+    def _stepEnemy(self, enemy: Unit, targetLocation: Location | None = None) -> None:
+        if not enemy.isAlive():
+            self.game._removeUnit(enemy)
+        else:
+            self.game._advanceEnemy(enemy, targetLocation or enemy.getNextLocation(chance=self.game.random.movement.random()))
+
+    def moveCrates(self) -> None:
+        movers = self._gatherMovers(self._crates)
+        if len(movers) < self.MIN_BULK_MOVERS:
+            self._stepEach(self._crates.view, movers, self._stepCrate)
+            return
+
+        xs, ys = self._getPositions(movers)
+        isAlive = np.fromiter([crate.isAlive() for crate in movers], np.bool_, len(movers))
+        targetYs = ys + 1
+
+        outcomes = np.where(self._isInside(xs, targetYs), self.MOVE, self.VACATE)
+        outcomes[~isAlive] = self.SPECIAL
+        self._resolve(self._crates.view, movers, xs, ys, xs, targetYs, outcomes, self._stepCrate)
+
+    def _stepCrate(self, crate: Unit, targetLocation: Location | None = None) -> None:
+        if not crate.isAlive():
+            self.game.killUnit(crate)
+        else:
+            self.game._advanceCrate(crate, targetLocation or crate.getNextLocation())
@@ -1,54 +1,85 @@
 import sys
 import pygame
 import os
+import random
+import time
 
-from config import DB_PATH
+from config import DB_PATH, FRAME_RATE, GAME_DURATION_IN_SECONDS, GAME_FIELD_SIZE, MAX_TICKS_PER_FRAME, PLAYER_START_POSITION, PLAYER_HEALTH, RENDER_FRAME_RATE, RENDER_INTERPOLATION
 from collections import defaultdict
-from typing import Iterator, Final
+from typing import Final
 from pygame import Surface, Rect
 from pygame.font import Font
 from pygame.time import Clock
 from data.enums.entity import Entity
+from helpers.assetManager import AssetManager
 from helpers.button import Button
+from helpers.clock import TickClock
+from helpers.fixedTimestep import FixedTimestep
+from helpers.frameProfiler import FrameProfiler
+from helpers.gridRenderer import GridRenderer
+from helpers.textCache import textCache
 from helpers.location import Location
 from helpers.textInput import TextInput
 from repositories.scoreRepository import ScoreRepository
 from data.score import Score
 from units.player import Player
+from units.unit import Unit
 from logic.game import Game
+from logic.replay import FIRE_ACTION, Replay, applyAction, getMoveAction, getPickupAction
 from data.enums.direction import Direction
 from helpers.timeHelper import formatTimeInSeconds
 from colors import DARK_COLOR, GREY_COLOR, LIGHT_COLOR, RED_COLOR, COLOR_TYPE
 
 USERNAME_FILE_PATH: Final[str] = "username.txt"
 
-FRAME_RATE: Final[int] = 30
-GAME_DURATION_IN_SECONDS: Final[int] = 180
-GAME_FIELD_SIZE: Final[int] = 26
 CELL_SIZE: Final[int] = 24
 TOP_SCORES_LENGTH: Final[int] = 6
 
 SCREEN_WIDTH: Final[int] = 1280
 SCREEN_HEIGHT: Final[int] = 720
 
+PROFILER_OVERLAY_KEY: Final[int] = pygame.K_F3
+PROFILER_TRACE_KEY: Final[int] = pygame.K_F4
+PROFILER_OVERLAY_RECT: Final[Rect] = Rect(GAME_FIELD_SIZE * CELL_SIZE + 40, 360, 400, 300)
+PROFILER_OVERLAY_REFRESH_FRAMES: Final[int] = 10
+PROFILER_TRACE_PATH: Final[str] = "data/frameTrace-{}.csv"
+
+REPLAY_DIRECTORY: Final[str] = "data/replays"
+
+ENTITY_SPRITE_PATHS: Final[dict[Entity, str]] = {
+    Entity.PLAYER: "./assets/player-ship.png",
+    Entity.ENEMY: "./assets/enemy-ship.png",
+    Entity.CRATE: "./assets/crate.png",
+    Entity.BULLET: "./assets/laser-bullet.png",
+    Entity.HEART: "./assets/pickups/heart.png",
+    Entity.EXTRA_SCORE: "./assets/pickups/pixel-star.png",
+    Entity.MEGABOMB: "./assets/pickups/megabomb.png",
+}
+INPUT_IMAGE_PATH: Final[str] = "./assets/input-placeholder.png"
+INPUT_IMAGE_SIZE: Final[tuple[int, int]] = (320, 180)
+BUTTON_IMAGE_PATH: Final[str] = "./assets/button-placeholder.png"
+BUTTON_IMAGE_SIZE: Final[tuple[int, int]] = (280, 160)
+BACKGROUND_IMAGE_PATH: Final[str] = "./assets/backgrounds/bg1.gif"
+
 def displayMainMenuScreen(screen: pygame.Surface, buttonPlaceholderImage: pygame.Surface, titleFont: pygame.font.Font, paragraphFont: pygame.font.Font) -> None:
     pygame.display.set_caption("Star Force Zero - Main Menu")
 
+    playButton = Button((SCREEN_WIDTH // 2, 320), "Play", paragraphFont, image=buttonPlaceholderImage,
+                        baseColor=DARK_COLOR, hoveringColor=GREY_COLOR)
+
     running: bool = True
     while running:
         screen.fill(DARK_COLOR)
         playerMousePosition = pygame.mouse.get_pos()
 
-        title = titleFont.render("Star Force Zero", True, LIGHT_COLOR)
+        title = textCache.render(titleFont, "Star Force Zero", LIGHT_COLOR)
         titleRect = title.get_rect(center=(SCREEN_WIDTH / 2, 160))
         screen.blit(title, titleRect)
 
-        text = paragraphFont.render("Welcome to Star Force Zero! Use W/A/S/D or Arrow keys to move.\nPress the corresponding numeric button to activate a pickup.\nPress Close to exit the game.", True, LIGHT_COLOR)
+        text = textCache.render(paragraphFont, "Welcome to Star Force Zero! Use W/A/S/D or Arrow keys to move.\nPress the corresponding numeric button to activate a pickup.\nPress Close to exit the game.", LIGHT_COLOR)
         textRect = text.get_rect(center=(SCREEN_WIDTH / 2, 240))
         screen.blit(text, textRect)
 
-        playButton = Button((SCREEN_WIDTH // 2, 320), "Play", paragraphFont, image=buttonPlaceholderImage,
-                            baseColor=DARK_COLOR, hoveringColor=GREY_COLOR)
         playButton.changeColor(playerMousePosition)
         playButton.update(screen)
 
@@ -65,15 +96,15 @@ def displayMainMenuScreen(screen: pygame.Surface, buttonPlaceholderImage: pygame
 def displayGameOverScreen(screen: Surface, game: Game, scoreRepository: ScoreRepository, gameImages: dict[str, Surface], titleFont: pygame.font.Font, paragraphFont: pygame.font.Font) -> bool:
     def displayTopScoresTable(topScores: list[Score], screen: Surface, paragraphFont: Font,
                               position: tuple[int, int]) -> None:
-        header = paragraphFont.render("Top 6 Scores", True, LIGHT_COLOR)
+        header = textCache.render(paragraphFont, "Top 6 Scores", LIGHT_COLOR)
         headerRect = header.get_rect(center=(position[0], position[1]))
         screen.blit(header, headerRect)
 
         startY: int = position[1] + 28
         rowHeight: int = 28
 
-        nameText = paragraphFont.render("Name", True, LIGHT_COLOR)
-        scoreText = paragraphFont.render("Score", True, LIGHT_COLOR)
+        nameText = textCache.render(paragraphFont, "Name", LIGHT_COLOR)
+        scoreText = textCache.render(paragraphFont, "Score", LIGHT_COLOR)
 
         screen.blit(nameText, (SCREEN_WIDTH // 2 - 200, startY))
         screen.blit(scoreText, (SCREEN_WIDTH // 2 + 100, startY))
@@ -84,8 +115,8 @@ def displayGameOverScreen(screen: Surface, game: Game, scoreRepository: ScoreRep
         for i, score in enumerate(topScores):
             y = startY + 35 + i * rowHeight
 
-            name_surface = paragraphFont.render(score.playerName, True, LIGHT_COLOR)
-            score_surface = paragraphFont.render(str(score.score), True, LIGHT_COLOR)
+            name_surface = textCache.render(paragraphFont, score.playerName, LIGHT_COLOR)
+            score_surface = textCache.render(paragraphFont, str(score.score), LIGHT_COLOR)
 
             screen.blit(name_surface, (SCREEN_WIDTH // 2 - 200, y))
             screen.blit(score_surface, (SCREEN_WIDTH // 2 + 100, y))
@@ -101,58 +132,58 @@ def displayGameOverScreen(screen: Surface, game: Game, scoreRepository: ScoreRep
     saveProgressText: str = "Enter your name to save the results"
     saveResultButton = Button((SCREEN_WIDTH // 2 + 148, 260), "Save", paragraphFont,
                               baseColor=DARK_COLOR, hoveringColor=GREY_COLOR, image=gameImages["button"])
+    playAgainButton = Button((SCREEN_WIDTH // 2, 408), "Play Again", paragraphFont, image=gameImages["button"],
+        baseColor=DARK_COLOR, hoveringColor=GREY_COLOR)
+    usernameInput = TextInput((SCREEN_WIDTH // 2 - 120, 260), userText, "Enter your username", paragraphFont, baseColor=DARK_COLOR, image=gameImages["input"])
+    topScores = scoreRepository.getTop(TOP_SCORES_LENGTH)
 
     while running:
         screen.fill(DARK_COLOR)
         playerMousePosition = pygame.mouse.get_pos()
 
-        title = titleFont.render(game.gameStatus, True, LIGHT_COLOR)
+        title = textCache.render(titleFont, game.gameStatus, LIGHT_COLOR)
         titleRect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
         screen.blit(title, titleRect)
 
-        text = paragraphFont.render(f"Your score: {score.score} points", True, LIGHT_COLOR)
+        text = textCache.render(paragraphFont, f"Your score: {score.score} points", LIGHT_COLOR)
         textRect = text.get_rect(center=(SCREEN_WIDTH // 2, 120))
         screen.blit(text, textRect)
 
-        text = paragraphFont.render(saveProgressText, True, LIGHT_COLOR)
+        text = textCache.render(paragraphFont, saveProgressText, LIGHT_COLOR)
         textRect = text.get_rect(center=(SCREEN_WIDTH // 2, 200))
         screen.blit(text, textRect)
 
-        usernameInput: TextInput | None = None
         if not isSaved:
-            usernameInput = TextInput((SCREEN_WIDTH // 2 - 120, 260), userText, "Enter your username", paragraphFont, baseColor=DARK_COLOR, image=gameImages["input"])
             usernameInput.update(screen)
             if userTextError:
-                errorText = paragraphFont.render(userTextError, True, RED_COLOR)
+                errorText = textCache.render(paragraphFont, userTextError, RED_COLOR)
                 errorTextRect = errorText.get_rect(center=(SCREEN_WIDTH // 2 - 120, 300))
                 screen.blit(errorText, errorTextRect)
 
             saveResultButton.changeColor(playerMousePosition)
             saveResultButton.update(screen)
 
-        text = paragraphFont.render("Would you like to try again?", True, LIGHT_COLOR)
+        text = textCache.render(paragraphFont, "Would you like to try again?", LIGHT_COLOR)
         textRect = text.get_rect(center=(SCREEN_WIDTH // 2, 360))
         screen.blit(text, textRect)
 
-        playAgainButton = Button((SCREEN_WIDTH // 2, 408), "Play Again", paragraphFont, image=gameImages["button"],
-            baseColor=DARK_COLOR, hoveringColor=GREY_COLOR)
         playAgainButton.changeColor(playerMousePosition)
         playAgainButton.update(screen)
 
-        displayTopScoresTable(scoreRepository.getTop(TOP_SCORES_LENGTH), screen, paragraphFont, (SCREEN_WIDTH // 2, 480))
+        displayTopScoresTable(topScores, screen, paragraphFont, (SCREEN_WIDTH // 2, 480))
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_BACKSPACE: userText = userText[:-1]
-                else: userText += event.unicode
+                usernameInput.inputValue(event.key, event.unicode)
+                userText = usernameInput.value
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if playAgainButton.checkForInput(playerMousePosition):
                     running = False
                     return True
                 elif saveResultButton.checkForInput(playerMousePosition):
-                    if usernameInput and usernameInput.isEmpty(): 
+                    if not isSaved and usernameInput.isEmpty(): 
                         userTextError = "Username cannot be empty!"
                         continue
                     saveResultButton.isEnabled = False
@@ -163,44 +194,107 @@ def displayGameOverScreen(screen: Surface, game: Game, scoreRepository: ScoreRep
                     saveUsername(userText)
                     game.player.name = userText
                     game.saveProgress(scoreRepository)
+                    topScores = scoreRepository.getTop(TOP_SCORES_LENGTH)
 
                     isSaved = True
+                    usernameInput.isEnabled = False
 
         pygame.display.update()
 
     return False
 
-def displayGameScreen(game, screen, images: dict[Entity, Surface], backgroundImage: Surface, rects: dict[Entity, COLOR_TYPE], paragraphFont):
+def displayGameScreen(game, screen, images: dict[Entity, Surface], backgroundImage: Surface, rects: dict[Entity, COLOR_TYPE], paragraphFont, replay: Replay):
     pygame.display.set_caption("Sky Force Zero - Game")
 
-    displayGrid(screen, game.grid, images, rects)
+    gridRenderer = GridRenderer(screen, game.occupancyGrid, backgroundImage, images, rects, CELL_SIZE)
+    screen.fill(DARK_COLOR)
+    gridRenderer.render()
+    pygame.display.flip()
+
     clock: Clock = Clock()
+    timestep = FixedTimestep(FRAME_RATE, MAX_TICKS_PER_FRAME)
+    previousLocations: dict[Unit, Location] = {}
+    # Where the last tick left the player; input moves it between ticks.
+    playerLocation: Location = game.player.location
     running: bool = True
+    statsRects: list[Rect] = []
+    previousHudState: tuple | None = None
 
-    while running and not game.isGameOver():
-        screen.fill(DARK_COLOR)
-        screen.blit(backgroundImage, (0, 0))
+    profiler = FrameProfiler()
+    game.profiler = profiler
+    profilerFont = createFont(20)
+    isProfilerShown: bool = False
 
-        for event in pygame.event.get():
+    while running and not game.isGameOver():
+        profiler.beginFrame()
+        overlayRects: list[Rect] = []
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT: running = False
             elif event.type == pygame.KEYDOWN:
                 key = event.key
-                direction = parseUserDirection(key)
-                if direction:
-                    game.movePlayer(direction)
-                if key == pygame.K_SPACE:
-                    game.spawnBullet()
-                if pygame.K_0 < key <= pygame.K_9:
-                    index: int = key - pygame.K_0
-                    game.tryActivatePickup(index)
-
-        game.update()
-
-        displayGameStats(screen, game, paragraphFont)
-        displayGrid(screen, game.grid, images, rects)
-
-        pygame.display.flip()
-        clock.tick(FRAME_RATE)
+                action = parseUserAction(key)
+                if action is not None:
+                    replay.record(game.clock.ticks, action)
+                    applyAction(game, action)
+                if key == PROFILER_OVERLAY_KEY:
+                    isProfilerShown = not isProfilerShown
+                    if not isProfilerShown:
+                        screen.fill(DARK_COLOR, PROFILER_OVERLAY_RECT)
+                        overlayRects.append(PROFILER_OVERLAY_RECT)
+                if key == PROFILER_TRACE_KEY:
+                    tracePath = PROFILER_TRACE_PATH.format(time.strftime("%Y%m%d-%H%M%S"))
+                    profiler.dumpTrace(tracePath)
+                    game.addNotification(f"Frame trace saved to {tracePath}", 3)
+        profiler.lap("events")
+
+        # The simulation advances in fixed ticks of real time, however fast frames are drawn.
+        ticks = timestep.advance()
+        for _ in range(ticks):
+            if game.isGameOver(): break
+            if RENDER_INTERPOLATION:
+                previousLocations = {unit: unit.location for unit in game.entities}
+                previousLocations[game.player] = playerLocation
+            game.update()
+            playerLocation = game.player.location
+
+        # Only the cells that changed and, if anything on it changed, the HUD text (old and new positions) are repainted.
+        hudRects: list[Rect] = []
+        hudState = getHudState(game)
+        if hudState != previousHudState:
+            previousHudState = hudState
+            for rect in statsRects:
+                screen.fill(DARK_COLOR, rect)
+            previousStatsRects = statsRects
+            statsRects = displayGameStats(screen, game, paragraphFont)
+            hudRects = previousStatsRects + statsRects
+        profiler.lap("displayGameStats")
+
+        if RENDER_INTERPOLATION:
+            gridRects = gridRenderer.renderInterpolated(previousLocations, timestep.alpha)
+        else:
+            gridRects = gridRenderer.render()
+        profiler.lap("displayGrid")
+
+        if isProfilerShown and profiler.frameIndex % PROFILER_OVERLAY_REFRESH_FRAMES == 0:
+            overlayRects.append(displayProfilerOverlay(screen, profiler, profilerFont))
+            profiler.lap("profilerOverlay")
+
+        pygame.display.update(gridRects + hudRects + overlayRects)
+        profiler.lap("display.update")
+        clock.tick(RENDER_FRAME_RATE)
+        profiler.lap("idle")
+        profiler.endFrame(game.getEntityCounts())
+
+def parseUserAction(key: int) -> int | None:
+    direction = parseUserDirection(key)
+    if direction:
+        return getMoveAction(direction)
+    if key == pygame.K_SPACE:
+        return FIRE_ACTION
+    if pygame.K_0 < key <= pygame.K_9:
+        return getPickupAction(key - pygame.K_0)
+    return None
 
 def parseUserDirection(key: int) -> Direction | None:
     if key == pygame.K_UP or key == pygame.K_w:
@@ -213,8 +307,8 @@ def parseUserDirection(key: int) -> Direction | None:
         return Direction.RIGHT
     return None
 
-def displayGameStats(screen: Surface, game: Game, paragraphFont: Font) -> None:
-    def displayInventory(screen: Surface, player: Player, paragraphFont: Font) -> None:
+def displayGameStats(screen: Surface, game: Game, paragraphFont: Font) -> list[Rect]:
+    def displayInventory(screen: Surface, player: Player, paragraphFont: Font) -> Rect:
         PADDING_X: Final[int] = 20
         PADDING_Y: Final[int] = 20
 
@@ -226,43 +320,75 @@ def displayGameStats(screen: Surface, game: Game, paragraphFont: Font) -> None:
             [f"[{index + 1}]: {key} x{inventoryFrequencyList[key]}" for (index, key) in
              enumerate(inventoryFrequencyList.keys())]))
 
-        text = paragraphFont.render(inventoryString, True, LIGHT_COLOR)
+        text = textCache.render(paragraphFont, inventoryString, LIGHT_COLOR)
         textRect = text.get_rect()
         textRect.bottomleft = (PADDING_X, SCREEN_HEIGHT - PADDING_Y)
         screen.blit(text, textRect)
+        return textRect
 
     PADDING_X: Final[int] = 20
     START_Y: Final[int] = 60
     LINE_SPACING: Final[int] = 30
 
-    stats: list[str] = game.notifications
-    stats.extend([
+    stats: list[str] = [
+        *game.notifications,
         f"Time left: {formatTimeInSeconds(game.getTimeLeft())}",
         f"Score: {game.player.score}",
         f"Health: {game.player.health}",
-    ])
+    ]
 
+    drawnRects: list[Rect] = []
     for i, line in enumerate(stats):
-        text = paragraphFont.render(line, True, LIGHT_COLOR)
+        text = textCache.render(paragraphFont, line, LIGHT_COLOR)
         textRect = text.get_rect()
         textRect.topright = (SCREEN_WIDTH - PADDING_X, START_Y + i * LINE_SPACING)
         screen.blit(text, textRect)
-
-    displayInventory(screen, game.player, paragraphFont)
-
-def displayGrid(screen: Surface, grid: Iterator[list], images: dict[Entity, Surface], rects: dict[Entity, COLOR_TYPE]) -> None:
-    matrix = list(grid)
-    for y in range(len(matrix)):
-        for x in range(len(matrix[y])):
-            cell = matrix[y][x]
-            if isinstance(cell, str):
-                continue
-
-            rect = Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-            if cell.entityType in images:
-                screen.blit(images[cell.entityType], rect)
-            elif cell.entityType in rects:
-                pygame.draw.rect(screen, rects[cell.entityType], rect)
+        drawnRects.append(textRect)
+
+    drawnRects.append(displayInventory(screen, game.player, paragraphFont))
+    return drawnRects
+
+def getHudState(game: Game) -> tuple:
+    """Everything displayGameStats shows; the HUD is redrawn only when this changes."""
+    player = game.player
+    return (
+        game.notificationsVersion,
+        formatTimeInSeconds(game.getTimeLeft()),
+        player.score,
+        player.health,
+        tuple(item.name for item in player.inventory),
+    )
+
+def displayProfilerOverlay(screen: Surface, profiler: FrameProfiler, font: Font) -> Rect:
+    PADDING: Final[int] = 8
+    LINE_SPACING: Final[int] = 18
+    COLUMN_WIDTH: Final[int] = 60
+
+    screen.fill(DARK_COLOR, PROFILER_OVERLAY_RECT)
+    pygame.draw.rect(screen, GREY_COLOR, PROFILER_OVERLAY_RECT, 1)
+
+    # The numbers change every refresh, so these surfaces bypass the text cache.
+    x, y = PROFILER_OVERLAY_RECT.left + PADDING, PROFILER_OVERLAY_RECT.top + PADDING
+    header = ["ms", *(f"p{percentile}" for percentile in profiler.PERCENTILES)]
+    rows = [header] + [
+        [phase, *(f"{value:.2f}" for value in profiler.getPercentiles(phase))]
+        for phase in profiler.phases
+    ]
+    for i, row in enumerate(rows):
+        screen.blit(font.render(row[0], True, LIGHT_COLOR), (x, y + i * LINE_SPACING))
+        for column, value in enumerate(row[1:]):
+            screen.blit(font.render(value, True, LIGHT_COLOR), (x + 160 + column * COLUMN_WIDTH, y + i * LINE_SPACING))
+
+    countsText = ", ".join(f"{name}: {count}" for name, count in profiler.counts.items())
+    screen.blit(font.render(countsText, True, LIGHT_COLOR), (x, y + len(rows) * LINE_SPACING + PADDING))
+    return PROFILER_OVERLAY_RECT
+
+def saveReplay(replay: Replay, game: Game) -> str:
+    replay.finish(game)
+    os.makedirs(REPLAY_DIRECTORY, exist_ok=True)
+    path = os.path.join(REPLAY_DIRECTORY, f"replay-{time.strftime('%Y%m%d-%H%M%S')}-{replay.seed}{Replay.FILE_EXTENSION}")
+    replay.save(path)
+    return path
 
 def saveUsername(name: str) -> None:
     with open(USERNAME_FILE_PATH, 'w') as f:
@@ -274,14 +400,11 @@ def getUsername() -> str:
     with open(USERNAME_FILE_PATH, 'r') as f:
         return f.readline().strip()
 
-def createImage(path: str, size: tuple[int, int] = (CELL_SIZE, CELL_SIZE)) -> Surface:
-    image = pygame.image.load(path).convert_alpha()
-    return pygame.transform.scale(image, size)
-
 def createFont(size: int) -> Font:
     return  Font(None, size)
 
 def main() -> None:
+    startTime = time.perf_counter()
     scoreRepository = ScoreRepository(DB_PATH)
     pygame.init()
     pygame.font.init()
@@ -290,34 +413,43 @@ def main() -> None:
     paragraphFont = createFont(28)
 
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    
-    objectImages: dict[Entity, Surface] = {
-        Entity.PLAYER: createImage("./assets/player-ship.png"),
-        Entity.ENEMY: createImage("./assets/enemy-ship.png"),
-        Entity.CRATE: createImage("./assets/crate.png"),
-        Entity.BULLET: createImage("./assets/laser-bullet.png"),
-        Entity.HEART: createImage("./assets/pickups/heart.png"),
-        Entity.EXTRA_SCORE: createImage("./assets/pickups/pixel-star.png"),
-        Entity.MEGABOMB: createImage("./assets/pickups/megabomb.png"),
-    }
+
+    # The menu only needs the button; everything else loads in the background while it is shown.
+    assets = AssetManager()
+    fieldImageSize = (GAME_FIELD_SIZE * CELL_SIZE, GAME_FIELD_SIZE * CELL_SIZE)
+    assets.preloadAtlas(ENTITY_SPRITE_PATHS, (CELL_SIZE, CELL_SIZE))
+    assets.preloadImage(BACKGROUND_IMAGE_PATH, fieldImageSize)
+    assets.preloadImage(INPUT_IMAGE_PATH, INPUT_IMAGE_SIZE)
+    buttonImage = assets.getImage(BUTTON_IMAGE_PATH, BUTTON_IMAGE_SIZE)
+    print(f"Menu ready in {(time.perf_counter() - startTime) * 1000:.0f} ms")
+    displayMainMenuScreen(screen, buttonImage, titleFont, paragraphFont)
+
+    objectImages: dict[Entity, Surface] = assets.getAtlas(ENTITY_SPRITE_PATHS, (CELL_SIZE, CELL_SIZE))
     objectRects: dict[Entity, COLOR_TYPE] = {
         Entity.WALL: GREY_COLOR
     }
     uiImages: dict[str, Surface] = {
-        "input": createImage("./assets/input-placeholder.png", (320, 180)),
-        "button": createImage("./assets/button-placeholder.png", (280, 160)),
-        "background": createImage("./assets/backgrounds/bg1.gif", (GAME_FIELD_SIZE * CELL_SIZE, GAME_FIELD_SIZE * CELL_SIZE))
+        "input": assets.getImage(INPUT_IMAGE_PATH, INPUT_IMAGE_SIZE),
+        "button": buttonImage,
+        "background": assets.getImage(BACKGROUND_IMAGE_PATH, fieldImageSize)
     }
-    displayMainMenuScreen(screen, uiImages["button"], titleFont, paragraphFont)
+    assets.close()
+    print(f"Loaded {len(assets.loadTimes)} assets in {sum(assets.loadTimes.values()) * 1000:.0f} ms "
+          f"({assets.cacheHits} from the cache, {assets.cacheMisses} rescaled)")
 
     while True:
-        player = Player(getUsername(), Location(10, 20), 4)
-        game = Game(player, (GAME_FIELD_SIZE, GAME_FIELD_SIZE), GAME_DURATION_IN_SECONDS)
-        displayGameScreen(game, screen, objectImages, uiImages["background"], objectRects, paragraphFont)
+        # Seeded so that the recorded inputs replay into exactly the same match.
+        seed = random.randrange(2 ** 32)
+        player = Player(getUsername(), Location(*PLAYER_START_POSITION), PLAYER_HEALTH)
+        game = Game(player, (GAME_FIELD_SIZE, GAME_FIELD_SIZE), GAME_DURATION_IN_SECONDS, TickClock(FRAME_RATE), seed=seed)
+        replay = Replay(seed, player.name, game.gridSize, GAME_DURATION_IN_SECONDS, FRAME_RATE)
+        displayGameScreen(game, screen, objectImages, uiImages["background"], objectRects, paragraphFont, replay)
+        saveReplay(replay, game)
 
         isGameContinued = displayGameOverScreen(screen, game, scoreRepository, uiImages, titleFont, paragraphFont)
         if not isGameContinued: break
 
+    scoreRepository.close()
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,49 @@
+import argparse
+import json
+import sys
+import time
+
+from logic.replay import Replay, createReplaySimulation
+
+
+def parseArguments(arguments: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-simulate a recorded Star Force Zero match without a display.")
+    parser.add_argument("path", help="replay file recorded by the game (data/replays/*.sfzr)")
+    parser.add_argument("--realtime", action="store_true", help="pace the replay at the recorded tick rate instead of running flat out")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed factor for --realtime")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy movement engine")
+    return parser.parse_args(arguments)
+
+
+def main(arguments: list[str]) -> None:
+    arguments = parseArguments(arguments)
+    replay = Replay.load(arguments.path)
+    simulation = createReplaySimulation(replay, arguments.vectorized)
+
+    startedAt = time.perf_counter()
+    if not arguments.realtime:
+        simulation.run(replay.ticks)
+    else:
+        tickInterval = 1 / (replay.tickRate * arguments.speed)
+        nextTickAt = startedAt
+        while simulation.ticks < replay.ticks and simulation.step():
+            if simulation.ticks % replay.tickRate == 0:
+                print(f"\rTime {simulation.ticks // replay.tickRate}s  score {simulation.player.score}  "
+                      f"health {simulation.player.health}", end="", flush=True)
+            nextTickAt += tickInterval
+            time.sleep(max(0.0, nextTickAt - time.perf_counter()))
+        print()
+    elapsed = time.perf_counter() - startedAt
+
+    # The live loop checks for the end of the match after its last update; settle the status the same way.
+    simulation.game.isGameOver()
+    result = simulation.getResult()
+    print(json.dumps(result))
+    print(f"Replayed {simulation.ticks} ticks in {elapsed:.2f}s")
+    if simulation.ticks != replay.ticks or result["score"] != replay.score:
+        print(f"Desync: recorded {replay.ticks} ticks and score {replay.score}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,56 @@
+import sqlite3
+from typing import Final
+
+# Append only: the position of a migration is the schema version it produces
+# (stored in PRAGMA user_version), so shipped entries must never change.
+MIGRATIONS: Final[tuple[tuple[str, ...], ...]] = (
+    # 1: the original table created by createDatabase.py.
+    (
+        """
+        Create Table If Not Exists Scores (
+            Id Integer Primary Key AUTOINCREMENT,
+            PlayerName Text NOT NULL,
+            Score Integer NOT NULL,
+            CreatedAt Text NOT NULL
+        )
+        """,
+    ),
+    # 2: one row per (PlayerName, Score), enforced by the database instead of a check-then-insert;
+    # the score index serves the top-N query.
+    (
+        "DELETE FROM Scores WHERE Id NOT IN (SELECT MIN(Id) FROM Scores GROUP BY PlayerName, Score)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS UX_Scores_PlayerName_Score ON Scores (PlayerName, Score)",
+        "CREATE INDEX IF NOT EXISTS IX_Scores_Score_CreatedAt ON Scores (Score DESC, CreatedAt ASC)",
+    ),
+)
+
+SCHEMA_VERSION: Final[int] = len(MIGRATIONS)
+
+
+def getSchemaVersion(connection: sqlite3.Connection) -> int:
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def applyMigrations(connection: sqlite3.Connection) -> int:
+    """
+    Brings the database up to SCHEMA_VERSION, one transaction per migration,
+    and switches it to WAL journaling. Returns the version it started from.
+    """
+    # Persistent per database file and not allowed inside a transaction.
+    connection.execute("PRAGMA journal_mode = WAL")
+
+    startVersion = getSchemaVersion(connection)
+    if startVersion > SCHEMA_VERSION:
+        raise RuntimeError(f"Database schema version {startVersion} is newer than the supported version {SCHEMA_VERSION}.")
+
+    for version in range(startVersion + 1, SCHEMA_VERSION + 1):
+        connection.execute("BEGIN")
+        try:
+            for statement in MIGRATIONS[version - 1]:
+                connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {version}")
+        except sqlite3.Error:
+            connection.rollback()
+            raise
+        connection.commit()
+    return startVersion
@@ -1,36 +1,69 @@
 import sqlite3
+from collections.abc import Iterable
 from data.score import Score
+from repositories.schemaMigrations import applyMigrations
 
 class ScoreRepository:
+    """
+    Scores table access over one long-lived connection. The best scores are
+    kept in memory: getTop only touches the database after addScore changed
+    the table or when more rows are requested than are cached. The schema is
+    migrated to the current version when the repository is opened.
+    """
     def __init__(self, dbPath: str):
         self.dbPath = dbPath
-    def addScore(self, score: Score):
-        if self.scoreExists(score.playerName, score.score): return
+        self._connection = sqlite3.connect(dbPath)
+        self._topScores: list[Score] | None = None
+        self._topScoresLimit: int = 0
+        applyMigrations(self._connection)
 
-        with sqlite3.connect(self.dbPath) as connection:
-            cursor = connection.cursor()
-
-            cursor.execute(
-                "INSERT INTO scores (PlayerName, Score, CreatedAt) VALUES (?, ?, ?)",
+    def addScore(self, score: Score) -> bool:
+        """Returns False when the player already has this score; the unique index rejects the row."""
+        with self._connection as connection:
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO scores (PlayerName, Score, CreatedAt) VALUES (?, ?, ?)",
                 (score.playerName, score.score, score.createdAt)
             )
+        if cursor.rowcount == 0: return False
 
-            connection.commit()
-    def getTop(self, number: int) -> list[Score]:
-        with sqlite3.connect(self.dbPath) as connection:
-            cursor = connection.cursor()
+        score.id = cursor.lastrowid
+        self._topScores = None
+        return True
+
+    def addScores(self, scores: Iterable[Score]) -> int:
+        """Inserts many scores in a single transaction and returns how many were new."""
+        with self._connection as connection:
+            cursor = connection.executemany(
+                "INSERT OR IGNORE INTO scores (PlayerName, Score, CreatedAt) VALUES (?, ?, ?)",
+                ((score.playerName, score.score, score.createdAt) for score in scores)
+            )
+        if cursor.rowcount > 0:
+            self._topScores = None
+        return cursor.rowcount
 
-            scores = cursor.execute(
-                "SELECT PlayerName, Score, CreatedAt FROM scores ORDER BY Score DESC, CreatedAt ASC"
-            ).fetchmany(number)
-        return [Score(row[0], row[1], row[2]) for row in scores]
+    def getTop(self, number: int) -> list[Score]:
+        # A cached query with a larger LIMIT also answers smaller ones, even when the table had fewer rows.
+        if self._topScores is None or self._topScoresLimit < number:
+            rows = self._connection.execute(
+                "SELECT PlayerName, Score, CreatedAt FROM scores ORDER BY Score DESC, CreatedAt ASC LIMIT ?",
+                (number,)
+            ).fetchall()
+            self._topScores = [Score(row[0], row[1], row[2]) for row in rows]
+            self._topScoresLimit = number
+        return self._topScores[:number]
 
     def scoreExists(self, playerName: str, score: int) -> bool:
-        with (sqlite3.connect(self.dbPath) as connection):
-            cursor = connection.cursor()
-
-            result = cursor.execute(
-                "Select PlayerName, Score, CreatedAt FROM scores WHERE PlayerName = ? AND Score = ?",
-                (playerName, score)
-            ).fetchone()
-        return result is not None
\ No newline at end of file
+        result = self._connection.execute(
+            "Select 1 FROM scores WHERE PlayerName = ? AND Score = ? LIMIT 1",
+            (playerName, score)
+        ).fetchone()
+        return result is not None
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "ScoreRepository":
+        return self
+
+    def __exit__(self, *exceptionInfo) -> None:
+        self.close()
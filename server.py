@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import sys
+import time
+
+from config import GAME_DURATION_IN_SECONDS
+from logic.matchClient import StandInClient
+from logic.matchServer import MatchServer
+
+
+def parseArguments(arguments: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Host Star Force Zero matches for remote players.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on (0 picks a free one)")
+    parser.add_argument("--max-matches", type=int, default=1000, help="matches played at the same time")
+    parser.add_argument("--duration", type=int, default=GAME_DURATION_IN_SECONDS, help="match length in seconds")
+    parser.add_argument("--replays", metavar="DIRECTORY", help="save the replay of every finished match here")
+    parser.add_argument("--bots", type=int, default=0,
+                        help="load test: play this many matches with local stand-in clients, print the server stats and exit")
+    return parser.parse_args(arguments)
+
+
+async def runLoadTest(server: MatchServer, host: str, port: int, bots: int) -> None:
+    startedAt = time.perf_counter()
+    clients = [StandInClient(f"Bot {i}", seed=i, clientSeed=i) for i in range(bots)]
+    results = await asyncio.gather(*(client.play(host, port) for client in clients), return_exceptions=True)
+    elapsed = time.perf_counter() - startedAt
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    finished = [result for result in results if not isinstance(result, BaseException)]
+    stats = server.getStats()
+    print(f"Played {len(finished)} matches concurrently in {elapsed:.2f}s, {len(failures)} clients failed")
+    print(f"Server ticks {stats['ticks']}, dropped {stats['droppedTicks']}, "
+          f"average {stats['averageTickMilliseconds']:.2f} ms, slowest {stats['slowestTickMilliseconds']:.2f} ms per tick")
+    if finished:
+        states = sum(result["states"] for result in finished)
+        received = sum(result["bytesReceived"] for result in finished)
+        print(f"Clients received {states} states, {received / max(1, states):.1f} bytes per state on average")
+    for failure in failures[:5]:
+        print(f"  {failure!r}")
+
+
+async def serve(arguments: argparse.Namespace) -> None:
+    server = MatchServer(
+        gameDurationInSeconds=arguments.duration,
+        maxMatches=max(arguments.max_matches, arguments.bots),
+        replayDirectory=arguments.replays,
+    )
+    host, port = await server.start(arguments.host, arguments.port)
+    try:
+        if arguments.bots:
+            await runLoadTest(server, host, port, arguments.bots)
+            return
+        print(f"Serving matches on {host}:{port}")
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main(arguments: list[str]) -> None:
+    try:
+        asyncio.run(serve(parseArguments(arguments)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,93 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from typing import Any, Final
+from config import GAME_DURATION_IN_SECONDS
+from logic.policies import POLICIES, createPolicy
+from logic.simulation import Simulation
+
+DEFAULT_RESULTS_PATH: Final[str] = "data/simulationResults.jsonl"
+
+
+def playMatch(matchSettings: dict[str, Any]) -> dict[str, Any]:
+    """Worker entry point: plays one headless match and returns its result row."""
+    startedAt = time.perf_counter()
+    simulation = Simulation(
+        seed=matchSettings["seed"],
+        gameDurationInSeconds=matchSettings["duration"],
+        policy=createPolicy(matchSettings["policy"], matchSettings["seed"]),
+        balance=matchSettings["balance"],
+        vectorized=matchSettings["vectorized"],
+    )
+    simulation.run()
+
+    result = simulation.getResult()
+    result["match"] = matchSettings["match"]
+    result["policy"] = matchSettings["policy"]
+    result["balance"] = matchSettings["balance"]
+    result["wallTime"] = round(time.perf_counter() - startedAt, 4)
+    return result
+
+
+def parseArguments(arguments: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Play many headless Star Force Zero matches in parallel.")
+    parser.add_argument("-n", "--matches", type=int, default=100, help="number of matches to play")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("-p", "--policy", choices=sorted(POLICIES), default="hunter", help="player policy")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the first match; match i uses seed + i")
+    parser.add_argument("-o", "--output", default=DEFAULT_RESULTS_PATH, help="JSON Lines file results are streamed to")
+    parser.add_argument("--duration", type=int, default=GAME_DURATION_IN_SECONDS, help="match length in seconds")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy movement engine (for dense matches)")
+    parser.add_argument("--spawn-interval-decrement", type=float, help="override Game.ENEMY_SPAWN_INTERVAL_DECREMENT")
+    parser.add_argument("--max-enemies", type=int, help="override Game.MAX_NUMBER_OF_ENEMIES_TO_SPAWN")
+    parser.add_argument("--crate-chance", type=float, help="override Game.CRATE_SPAWN_CHANCE")
+    return parser.parse_args(arguments)
+
+
+def getBalance(arguments: argparse.Namespace) -> dict[str, Any]:
+    balance: dict[str, Any] = {
+        "ENEMY_SPAWN_INTERVAL_DECREMENT": arguments.spawn_interval_decrement,
+        "MAX_NUMBER_OF_ENEMIES_TO_SPAWN": arguments.max_enemies,
+        "CRATE_SPAWN_CHANCE": arguments.crate_chance,
+    }
+    return {name: value for name, value in balance.items() if value is not None}
+
+
+def main(arguments: list[str]) -> None:
+    arguments = parseArguments(arguments)
+    balance = getBalance(arguments)
+    matches = [
+        {"match": i, "seed": arguments.seed + i, "policy": arguments.policy, "duration": arguments.duration,
+         "balance": balance, "vectorized": arguments.vectorized}
+        for i in range(arguments.matches)
+    ]
+    workers = max(1, min(arguments.workers or 1, len(matches)))
+    # Big enough chunks to keep IPC off the profile, small enough to balance the load.
+    chunkSize = max(1, len(matches) // (workers * 8))
+
+    outputDirectory = os.path.dirname(arguments.output)
+    if outputDirectory:
+        os.makedirs(outputDirectory, exist_ok=True)
+
+    startedAt = time.perf_counter()
+    totalScore = 0
+    totalTicks = 0
+    with open(arguments.output, "w") as resultsFile, multiprocessing.Pool(workers) as pool:
+        for result in pool.imap_unordered(playMatch, matches, chunkSize):
+            resultsFile.write(json.dumps(result) + "\n")
+            resultsFile.flush()
+            totalScore += result["score"]
+            totalTicks += result["ticks"]
+
+    elapsed = time.perf_counter() - startedAt
+    print(f"Played {len(matches)} matches on {workers} workers in {elapsed:.2f}s "
+          f"({totalTicks / elapsed:,.0f} ticks/s), average score {totalScore / max(1, len(matches)):.1f}")
+    print(f"Results written to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -15,12 +15,14 @@ class Bullet(Unit, Disposable):
     BULLET_SPEED: Final[int] = 20
     BULLET_NAME: Final[str] = "Bullet"
 
+    __slots__ = []
+
     def __init__(self, startLocation: Location = Location(0, 0)):
         super().__init__(self.BULLET_NAME, self.BULLET_SYMBOL, Entity.BULLET, startLocation, self.BULLET_SPEED)
 
     def getNextLocation(self, direction: Direction = Direction.UP) -> Location:
         if direction == Direction.UP: 
-            return Location(self.location.x, self.location.y - 1)
+            return self.location.getNeighbor(Direction.UP)
         return self.location
     
     def onHitByPlayer(self, game: 'Game') -> bool:
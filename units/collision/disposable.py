@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from units.pickups.crate import Crate
 
 class Disposable(ABC):
+    __slots__ = []
+
     @abstractmethod
     def onHitByPlayer(self, game: 'Game') -> bool:
         """
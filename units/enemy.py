@@ -1,5 +1,4 @@
-import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 from data.enums.entity import Entity
 from helpers.location import Location
 from units.collision.disposable import Disposable
@@ -12,17 +11,23 @@ if TYPE_CHECKING:
     from units.pickups.crate import Crate
 
 class Enemy(UnitWithHealth, Disposable):
+    # Ranges of the chance drawn for a move (uniform in [0, 1)) that make an enemy drift sideways.
+    DRIFT_LEFT_CHANCE: Final[tuple[float, float]] = (0.34, 0.4)
+    DRIFT_RIGHT_CHANCE: Final[tuple[float, float]] = (0.54, 0.6)
+
+    __slots__ = ["_damage"]
+
     def __init__(self, location: Location, speed: int, name: str = "Normal", symbol: str = '!', health: int = 1, damage: int = 1):
         super().__init__(name, symbol, Entity.ENEMY, location, speed, health)
         self._damage = damage
 
-    def getNextLocation(self, direction: Direction = Direction.DOWN) -> Location:
-        nextLocation = Location(self.location.x, self.location.y + (1 if direction == Direction.DOWN else -1))
-        chance = random.random()
-        if 0.34 < chance < 0.4:
-            nextLocation.x -= 1
-        elif 0.54 < chance < 0.6:
-            nextLocation.x += 1
+    def getNextLocation(self, direction: Direction = Direction.DOWN, chance: float = 0.0) -> Location:
+        """`chance` is a draw from the game's movement stream; the default never drifts."""
+        nextLocation = self.location.getNeighbor(Direction.DOWN if direction == Direction.DOWN else Direction.UP)
+        if self.DRIFT_LEFT_CHANCE[0] < chance < self.DRIFT_LEFT_CHANCE[1]:
+            return nextLocation.getNeighbor(Direction.LEFT)
+        elif self.DRIFT_RIGHT_CHANCE[0] < chance < self.DRIFT_RIGHT_CHANCE[1]:
+            return nextLocation.getNeighbor(Direction.RIGHT)
         return nextLocation
     
     def onHitByPlayer(self, game: 'Game') -> bool:
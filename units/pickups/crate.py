@@ -1,5 +1,4 @@
-import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 from data.enums.entity import Entity
 from helpers.location import Location
 from units.collision.disposable import Disposable
@@ -15,21 +14,21 @@ if TYPE_CHECKING:
     from units.enemy import Enemy
 
 class Crate(UnitWithHealth, Disposable):
-    def __init__(self, location: Location, name: str = "Crate", speed: int = 4, health: int = 1, symbol: str = 'X'):
+    # What a crate may hold; the game draws one from its loot stream.
+    PICKUP_TYPES: Final[tuple[type, ...]] = (Heart, ExtraScore, Megabomb)
+
+    __slots__ = ["pickup", "_isRemoved"]
+
+    def __init__(self, location: Location, pickup: type, name: str = "Crate", speed: int = 4, health: int = 1, symbol: str = 'X'):
         super().__init__(name, symbol, Entity.CRATE, location, speed, health)
-        self.pickup = random.choice([
-            Heart,
-            ExtraScore,
-            Megabomb
-        ])
+        self.pickup = pickup
         self._isRemoved = False
 
     def spawnPickup(self) -> "Pickup":
         return self.pickup(self.location)
     
     def getNextLocation(self, direction: Direction = Direction.DOWN) -> Location:
-        nextLocation = Location(self.location.x, self.location.y + (1 if direction == Direction.DOWN else -1))
-        return nextLocation
+        return self.location.getNeighbor(Direction.DOWN if direction == Direction.DOWN else Direction.UP)
     
     @property
     def isRemoved(self) -> bool:
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from logic.game import Game
 
 class ExtraScore(Pickup):
+    __slots__ = []
+
     def __init__(self, position: Location):
         super().__init__("Extra Score", '★', position, Entity.EXTRA_SCORE)
     def pick(self, game: "Game") -> None:
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from logic.game import Game
 
 class Heart(Pickup):
+    __slots__ = []
+
     def __init__(self, position: Location):
         super().__init__("Heart", '♥', position, Entity.HEART)
     def pick(self, game: "Game") -> None:
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from logic.game import Game
     
 class Megabomb(Pickup):
+    __slots__ = []
+
     def __init__(self, position: Location):
         super().__init__("Megabomb", '♦', position, Entity.MEGABOMB)
     def pick(self, game: "Game") -> None:
@@ -17,8 +19,8 @@ class Megabomb(Pickup):
             game.addNotification(str(e))
     def activate(self, game: "Game") -> None:
         game.addNotification("Megabomb activated!")
-        enemiesDestroyed = len(game._enemies)
+        enemiesDestroyed = len(game.enemies)
         game.player.incrementScore(enemiesDestroyed * game.SCORE_INCREMENT)
-        for enemy in game._enemies[:]:
+        for enemy in game.enemies:
             game.killUnit(enemy)
         game.player.inventory.remove(self)
\ No newline at end of file
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
     from units.pickups.crate import Crate
 
 class Pickup(Unit, Disposable):
+    __slots__ = []
+
     def __init__(self, name: str, pickupSymbol: str, location: Location, pickupType: Entity) -> None:
         super().__init__(name, pickupSymbol, pickupType, location, 0)
     def pick(self, game: 'Game') -> None:
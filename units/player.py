@@ -1,7 +1,7 @@
-import time
 from typing import Final, TYPE_CHECKING
 from data.enums.entity import Entity
 from data.enums.direction import Direction
+from helpers.clock import Clock
 from helpers.location import Location
 from units.collision.disposable import Disposable
 from units.unitWithHealth import UnitWithHealth
@@ -18,34 +18,48 @@ class Player(UnitWithHealth, Disposable):
     FIRE_COOLDOWN: Final[float] = .5
     INVENTORY_MAX_SIZE: Final[int] = 10
 
-    def __init__(self, name: str, location: Location, health: int, speed: int = 1, damage: int = 1, score: int = 0):
+    __slots__ = ["score", "damage", "clock", "lastFireTime", "inventory", "damageTaken"]
+
+    def __init__(self, name: str, location: Location, health: int, speed: int = 1, damage: int = 1, score: int = 0, clock: Clock | None = None):
         super().__init__(name, self.PLAYER_SYMBOL, Entity.PLAYER, location, speed, health)
         self.score: int = score
         self.damage: int = damage
-        self.lastFireTime: float = time.time()
+        # Set by the Game the player joins (see attachClock).
+        self.clock: Clock | None = clock
+        self.lastFireTime: float = clock.now() if clock is not None else 0.0
         self.inventory: list['Pickup'] = [] 
+        self.damageTaken: int = 0
+
+    def takeDamage(self, damage: int) -> None:
+        super().takeDamage(damage)
+        self.damageTaken += damage
 
     def incrementScore(self, value: int = 1) -> None:
         self.score += value
 
     def getNextLocation(self, direction: Direction) -> Location:
-        if direction == Direction.UP:
-            return Location(self.location.x, self.location.y - 1)
-        elif direction == Direction.DOWN:
-            return Location(self.location.x, self.location.y + 1)
-        elif direction == Direction.LEFT:
-            return Location(self.location.x - 1, self.location.y)
-        elif direction == Direction.RIGHT:
-            return Location(self.location.x + 1, self.location.y)
-        return self.location
+        return self.location.getNeighbor(direction)
+
+    def copy(self) -> "Player":
+        clone = super().copy()
+        clone.inventory = list(self.inventory)
+        return clone
+
+    def attachClock(self, clock: Clock) -> None:
+        """Switch to the game's clock and restart the fire cooldown on it."""
+        self.clock = clock
+        self.lastFireTime = clock.now()
 
     def canFire(self) -> bool:
         """Checks if the player can attack"""
-        return time.time() - self.lastFireTime > self.FIRE_COOLDOWN
+        return self.canFireAt(self.clock.now())
+
+    def canFireAt(self, time: float) -> bool:
+        return time - self.lastFireTime > self.FIRE_COOLDOWN
 
     def fire(self):
         """Update last fire time when the player shoots."""
-        self.lastFireTime = time.time()
+        self.lastFireTime = self.clock.now()
 
     def isInventoryFull(self) -> bool:
         return len(self.inventory) >= self.INVENTORY_MAX_SIZE
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable
 from data.enums.entity import Entity
 from helpers.location import Location
 from units.collision.disposable import Disposable
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
     from units.pickups.crate import Crate
 
 class Unit:
+    __slots__ = ["name", "symbol", "entityType", "location", "speed", "_frameCounter", "unitId", "registrySlot"]
+
     def __init__(self, name: str, symbol: str, entityType: Entity, location: Location = Location(0, 0), speed: int = 0):
         self.name = name
         self.symbol = symbol
@@ -17,10 +20,34 @@ class Unit:
         self.location = location
         self.speed = speed
         self._frameCounter = 0
+        self.unitId: int = 0
+        self.registrySlot: int = -1
         
-    def shouldMove(self) -> bool:
-        self._frameCounter += 1
-        return self._frameCounter % max(1, (30 // self.speed)) == 0
-    
+    def getMovePeriod(self, tickRate: int) -> int:
+        """Number of ticks between two moves of this unit, which moves about speed cells per second."""
+        return max(1, tickRate // self.speed)
+
+    def copy(self) -> "Unit":
+        """Shallow copy for cloned games; the clone shares its Location, which is replaced on moves, never changed."""
+        unitType = self.__class__
+        clone = unitType.__new__(unitType)
+        names, getFields = _getFieldAccess(unitType)
+        for name, value in zip(names, getFields(self)):
+            setattr(clone, name, value)
+        return clone
+
     def __str__(self):
-        return f"{self.symbol}"
\ No newline at end of file
+        return f"{self.symbol}"
+
+
+_fieldAccess: dict[type, tuple[tuple[str, ...], Callable[[Unit], tuple]]] = {}
+
+
+def _getFieldAccess(unitType: type) -> tuple[tuple[str, ...], Callable[[Unit], tuple]]:
+    # Every unit class is slotted, so its fields are the slots along the MRO.
+    access = _fieldAccess.get(unitType)
+    if access is None:
+        names = tuple(name for cls in reversed(unitType.__mro__) for name in getattr(cls, "__slots__", ()) if name not in ("__dict__", "__weakref__"))
+        getFields = attrgetter(*names)
+        access = _fieldAccess[unitType] = (names, getFields if len(names) > 1 else lambda unit: (getFields(unit),))
+    return access
@@ -0,0 +1,41 @@
+from typing import Final, Generic, TypeVar
+
+from units.unit import Unit
+
+U = TypeVar("U", bound=Unit)
+
+
+class UnitPool(Generic[U]):
+    """
+    Free list of released units of one type. acquire re-runs __init__ on a
+    released unit with the given arguments, so a reused unit is reset to
+    exactly the state a new one would have, and constructs a new unit only
+    when the pool is empty. At most `capacity` released units are kept.
+    """
+    DEFAULT_CAPACITY: Final[int] = 256
+
+    __slots__ = ["unitType", "capacity", "allocations", "reuses", "_free"]
+
+    def __init__(self, unitType: type[U], capacity: int = DEFAULT_CAPACITY) -> None:
+        self.unitType = unitType
+        self.capacity = capacity
+        self.allocations: int = 0
+        self.reuses: int = 0
+        self._free: list[U] = []
+
+    def acquire(self, *arguments) -> U:
+        if not self._free:
+            self.allocations += 1
+            return self.unitType(*arguments)
+        unit = self._free.pop()
+        unit.__init__(*arguments)
+        self.reuses += 1
+        return unit
+
+    def release(self, unit: U) -> None:
+        """Takes back a unit that left the game for good. Its fields stay readable until it is acquired again."""
+        if len(self._free) < self.capacity:
+            self._free.append(unit)
+
+    def __len__(self) -> int:
+        return len(self._free)
@@ -3,6 +3,8 @@ from helpers.location import Location
 from units.unit import Unit
 
 class UnitWithHealth(Unit):
+    __slots__ = ["health"]
+
     def __init__(self, name: str, symbol: str, entityType: Entity, location: Location = Location(0, 0), speed: int = 1, health: int = 1) -> None:
         super().__init__(name, symbol, entityType, location, speed)
         self.health = health
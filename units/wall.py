@@ -6,5 +6,7 @@ class Wall(Unit):
     WALL_SYMBOL: str = '■'
     WALL_NAME: str = "Wall"
 
+    __slots__ = []
+
     def __init__(self, location: Location = Location(0, 0)):
         super().__init__(self.WALL_NAME, self.WALL_SYMBOL, Entity.WALL, location)
\ No newline at end of file